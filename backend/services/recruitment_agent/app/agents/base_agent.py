@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from agents.state import RecruitmentState
 
@@ -9,3 +10,10 @@ class BaseAgent(ABC):
         Run the agent with a given RecruitmentState and return the updated state.
         """
         pass
+
+    async def arun(self, state: RecruitmentState) -> RecruitmentState:
+        """
+        Async variant used by the async graphs. Agents doing network I/O override
+        this; the default runs the blocking `run` in a worker thread.
+        """
+        return await asyncio.to_thread(self.run, state)
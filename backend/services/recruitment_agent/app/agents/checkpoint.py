@@ -0,0 +1,240 @@
+import asyncio
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Sequence, Set, Tuple
+
+import redis
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_serializable_checkpoint_metadata,
+)
+
+from config.constants import GRAPH_CHECKPOINT_ENABLED, GRAPH_CHECKPOINT_MAX_BYTES, GRAPH_CHECKPOINT_TTL
+from config.log_config import AppLogger
+from config.redis_client import get_redis_client
+from metrics.prometheus_metrics import graph_checkpoints_skipped_total
+
+logger = AppLogger(__name__)
+
+
+def _pack(typed: Tuple[str, bytes]) -> bytes:
+    type_, data = typed
+    return type_.encode() + b":" + data
+
+
+def _unpack(raw: bytes) -> Tuple[str, bytes]:
+    type_, _, data = raw.partition(b":")
+    return type_.decode(), data
+
+
+class RedisCheckpointSaver(BaseCheckpointSaver):
+    """
+    LangGraph checkpointer keeping only the latest checkpoint of each thread in Redis.
+
+    A thread is one pipeline run (e.g. one Celery task), so older checkpoints are
+    never needed to resume it. Each thread holds one hash with the checkpoint and
+    one hash with the pending writes of that checkpoint; both expire after
+    `ttl_seconds`. Checkpoints larger than `max_bytes` are not stored, leaving the
+    previous one in place. Redis failures are logged and never fail the run.
+    """
+
+    def __init__(self, ttl_seconds: int, max_bytes: int, client: Optional[redis.Redis] = None, prefix: str = "graph_checkpoint"):
+        super().__init__()
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.prefix = prefix
+        self._client = client
+        # Checkpoints dropped for size; their pending writes are dropped too
+        self._oversized: Set[Tuple[str, str, str]] = set()
+
+    @property
+    def client(self) -> redis.Redis:
+        return self._client or get_redis_client()
+
+    def _key(self, thread_id: str, checkpoint_ns: str) -> str:
+        return f"{self.prefix}:{thread_id}:{checkpoint_ns}"
+
+    def _writes_key(self, thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> str:
+        return f"{self._key(thread_id, checkpoint_ns)}:writes:{checkpoint_id}"
+
+    @staticmethod
+    def _thread(config: RunnableConfig) -> Tuple[str, str]:
+        configurable = config["configurable"]
+        return str(configurable["thread_id"]), configurable.get("checkpoint_ns", "")
+
+    # ---------- sync API ----------
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        thread_id, checkpoint_ns = self._thread(config)
+        try:
+            saved = self.client.hgetall(self._key(thread_id, checkpoint_ns))
+            if not saved:
+                return None
+            checkpoint_id = saved[b"id"].decode()
+            wanted_id = get_checkpoint_id(config)
+            if wanted_id and wanted_id != checkpoint_id:
+                return None
+            writes = self.client.hgetall(self._writes_key(thread_id, checkpoint_ns, checkpoint_id))
+        except redis.RedisError as e:
+            logger.warn(f"[checkpoint] read failed for thread {thread_id}: {e}")
+            return None
+
+        parent_id = saved.get(b"parent_id", b"").decode()
+        pending_writes = [
+            tuple(self.serde.loads_typed(_unpack(value)))
+            for _, value in sorted(writes.items())
+        ]
+        return CheckpointTuple(
+            config={"configurable": {"thread_id": thread_id, "checkpoint_ns": checkpoint_ns, "checkpoint_id": checkpoint_id}},
+            checkpoint=self.serde.loads_typed(_unpack(saved[b"checkpoint"])),
+            metadata=self.serde.loads_typed(_unpack(saved[b"metadata"])),
+            parent_config=(
+                {"configurable": {"thread_id": thread_id, "checkpoint_ns": checkpoint_ns, "checkpoint_id": parent_id}}
+                if parent_id else None
+            ),
+            pending_writes=pending_writes,
+        )
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        # Only the latest checkpoint of a given thread is kept
+        if not config or limit == 0:
+            return
+        saved = self.get_tuple(config)
+        if saved is None:
+            return
+        if before and get_checkpoint_id(before) and saved.config["configurable"]["checkpoint_id"] >= get_checkpoint_id(before):
+            return
+        if filter and any(saved.metadata.get(k) != v for k, v in filter.items()):
+            return
+        yield saved
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        thread_id, checkpoint_ns = self._thread(config)
+        parent_id = config["configurable"].get("checkpoint_id")
+        next_config = {"configurable": {"thread_id": thread_id, "checkpoint_ns": checkpoint_ns, "checkpoint_id": checkpoint["id"]}}
+
+        self._oversized.discard((thread_id, checkpoint_ns, parent_id))
+        packed = _pack(self.serde.dumps_typed(checkpoint))
+        if self.max_bytes and len(packed) > self.max_bytes:
+            self._oversized.add((thread_id, checkpoint_ns, checkpoint["id"]))
+            graph_checkpoints_skipped_total.inc()
+            logger.warn(f"[checkpoint] thread {thread_id}: checkpoint of {len(packed)} bytes exceeds {self.max_bytes}, not stored")
+            return next_config
+
+        key = self._key(thread_id, checkpoint_ns)
+        try:
+            pipe = self.client.pipeline()
+            pipe.hset(key, mapping={
+                "id": checkpoint["id"],
+                "parent_id": parent_id or "",
+                "checkpoint": packed,
+                "metadata": _pack(self.serde.dumps_typed(get_serializable_checkpoint_metadata(config, metadata))),
+            })
+            pipe.expire(key, self.ttl_seconds)
+            if parent_id:
+                # Writes of the previous checkpoint are folded into this one
+                pipe.delete(self._writes_key(thread_id, checkpoint_ns, parent_id))
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warn(f"[checkpoint] write failed for thread {thread_id}: {e}")
+        return next_config
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        thread_id, checkpoint_ns = self._thread(config)
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        if (thread_id, checkpoint_ns, checkpoint_id) in self._oversized:
+            return
+        key = self._writes_key(thread_id, checkpoint_ns, checkpoint_id)
+        try:
+            pipe = self.client.pipeline()
+            for idx, (channel, value) in enumerate(writes):
+                write_idx = WRITES_IDX_MAP.get(channel, idx)
+                field = f"{task_id}:{write_idx:+06d}"
+                packed = _pack(self.serde.dumps_typed((task_id, channel, value)))
+                # Regular writes are kept once stored; special channels (errors, interrupts) are overwritten
+                if write_idx >= 0:
+                    pipe.hsetnx(key, field, packed)
+                else:
+                    pipe.hset(key, field, packed)
+            pipe.expire(key, self.ttl_seconds)
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warn(f"[checkpoint] pending writes failed for thread {thread_id}: {e}")
+
+    def delete_thread(self, thread_id: str) -> None:
+        self._oversized = {entry for entry in self._oversized if entry[0] != str(thread_id)}
+        try:
+            keys = list(self.client.scan_iter(match=f"{self.prefix}:{thread_id}:*", count=100))
+            if keys:
+                self.client.delete(*keys)
+        except redis.RedisError as e:
+            logger.warn(f"[checkpoint] cleanup failed for thread {thread_id}: {e}")
+
+    # ---------- async API (redis-py calls run in a worker thread) ----------
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        items = await asyncio.to_thread(lambda: list(self.list(config, filter=filter, before=before, limit=limit)))
+        for item in items:
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+
+@lru_cache(maxsize=None)
+def get_graph_checkpointer() -> Optional[RedisCheckpointSaver]:
+    """Process-wide checkpointer for the matching graphs, None when checkpointing is disabled."""
+    if not GRAPH_CHECKPOINT_ENABLED:
+        return None
+    return RedisCheckpointSaver(GRAPH_CHECKPOINT_TTL, GRAPH_CHECKPOINT_MAX_BYTES)
@@ -1,17 +1,51 @@
+import asyncio
 import json
 import re
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+from config.constants import (
+    DEFAULT_MODEL,
+    CV_PARSER_MODE,
+    PARSED_CV_CACHE_ENABLED,
+    PARSED_CV_CACHE_TTL,
+    PARSED_CV_CACHE_MAX_ENTRIES,
+)
 from config.log_config import AppLogger
 from utils.utils import *
+from utils.cache import RedisCache
+from utils.text_extraction import extract_text
 from agents.base_agent import BaseAgent
 from agents.state import RecruitmentState
+from metrics.prometheus_metrics import parsed_cv_cache_hits_total, parsed_cv_cache_misses_total
 logger = AppLogger(__name__)
 
+# Bump whenever the parse prompts or post-processing change so cached results are not reused
+PROMPT_VERSION = "v1"
+
+
+def reject_unreadable_cv(state: RecruitmentState) -> RecruitmentState:
+    """Stop the pipeline for a CV without any text, even after OCR; an empty prompt only yields garbage."""
+    logger.warn(f"[cv_parser] No text could be extracted from {state.cv_file_path}")
+    state.parsed_cv = None
+    state.matched_jd = None
+    state.stop_pipeline = True
+    state.final_decision = "CV rejected: No readable text in the CV file."
+    return state
+
+
 class CVParserAgent(BaseAgent):
-    def __init__(self, llm):
+    def __init__(self, llm, cache: Optional[RedisCache] = None, mode: str = CV_PARSER_MODE):
         self.llm = llm
+        self.mode = mode
+        if cache is None and PARSED_CV_CACHE_ENABLED:
+            cache = RedisCache("parsed_cv", PARSED_CV_CACHE_TTL, PARSED_CV_CACHE_MAX_ENTRIES)
+        self.cache = cache
+
+    def _cache_key(self, cv_file_path: str) -> str:
+        model = getattr(self.llm, "model", DEFAULT_MODEL)
+        return f"{file_sha256(cv_file_path)}:{model}:{PROMPT_VERSION}-{self.mode}"
 
-    def _build_main_parse_prompt(self, cv_text: str) -> str:
+    def _build_main_parse_prompt(self, cv_text: str, strict_languages: bool = False) -> str:
         schema_example: Dict[str, Any] = {
             "name": "string",
             "email": "string",
@@ -42,6 +76,12 @@ class CVParserAgent(BaseAgent):
                 "confidence": 0.0,
             },
         }
+        language_rules = (
+            "\nLanguages: list every spoken language mentioned in the CV. Map the stated level to CEFR "
+            "(native/mother tongue -> C2, fluent/advanced -> C1, upper-intermediate -> B2, intermediate -> B1, "
+            "elementary -> A2, beginner -> A1). Use Unknown only when no level can be inferred.\n"
+            if strict_languages else ""
+        )
         return f"""
 Return ONLY ONE valid JSON object. No comments, no extra text.
 
@@ -55,7 +95,7 @@ Fields:
 - certifications (name, issuer, date, credential_id)
 - languages (language, proficiency_cefr in A1|A2|B1|B2|C1|C2|Unknown)
 - university_evaluation (best_institution, rank_tier, estimated_score, rationale, confidence)
-
+{language_rules}
 Shape example:
 {json.dumps(schema_example, indent=2)}
 
@@ -72,16 +112,20 @@ CV:
 {cv_text}
 """.strip()
 
-    def run(self, state: RecruitmentState) -> RecruitmentState:
-        if state.stop_pipeline:
-            return state
+    def _response_text(self, resp) -> str:
+        raw = getattr(resp, "content", None) or getattr(resp, "text", None) or str(resp or "")
+        return unwrap_maybe_wrapper(ensure_text(raw)).strip()
+
+    def _invoke_text(self, prompt: str) -> str:
+        return self._response_text(self.llm.invoke(prompt))
 
-        cv_text = ensure_text(extract_text_from_pdf(state.cv_file_path))
-        logger.debug("[cv_parser] start")
+    async def _ainvoke_text(self, prompt: str) -> str:
+        return self._response_text(await self.llm.ainvoke(prompt))
 
-        main_resp = self.llm.invoke(self._build_main_parse_prompt(cv_text))
-        raw = getattr(main_resp, "content", None) or getattr(main_resp, "text", None) or str(main_resp or "")
-        raw = unwrap_maybe_wrapper(ensure_text(raw)).strip()
+    def _main_prompt(self, cv_text: str) -> str:
+        return self._build_main_parse_prompt(cv_text, strict_languages=self.mode == "single_pass")
+
+    def _handle_main_response(self, raw: str) -> Dict[str, Any]:
         if not raw:
             logger.error("Empty LLM response (main parse)")
             raise ValueError("Empty LLM response (main parse)")
@@ -96,25 +140,120 @@ CV:
         parsed = validate_parsed_cv(parsed)
         parsed = coerce_types(parsed)
         logger.debug("[cv_parser] main parse ok")
+        return parsed
 
-        lang_resp = self.llm.invoke(self._build_languages_prompt(cv_text))
-        lang_raw = getattr(lang_resp, "content", None) or getattr(lang_resp, "text", None) or str(lang_resp or "")
-        lang_raw = unwrap_maybe_wrapper(ensure_text(lang_raw)).strip()
-        lang_clean = clean_json_from_text(lang_raw)
-
+    def _handle_languages_response(self, raw: str) -> List[Dict[str, str]]:
+        lang_clean = clean_json_from_text(raw)
         try:
             languages_json = json.loads(lang_clean) if lang_clean else []
         except Exception:
             logger.error("Invalid JSON (languages)")
             languages_json = []
+        return validate_languages(languages_json)
+
+    def _main_languages(self, parsed: Dict[str, Any]) -> bool:
+        """
+        single_pass: keep the languages of the main parse when usable.
+        Returns False when the languages pass is still needed.
+        """
+        languages = validate_languages(parsed.get("languages"))
+        if languages:
+            parsed["languages"] = languages
+            logger.debug("[cv_parser] languages from main parse ok")
+            return True
+        logger.debug("[cv_parser] languages from main parse unusable, running languages pass")
+        return False
 
-        languages = validate_languages(languages_json)
+    def _apply_languages(self, parsed: Dict[str, Any], languages: List[Dict[str, str]]) -> None:
         if languages:
             parsed["languages"] = languages
             logger.debug("[cv_parser] languages override ok")
         else:
             logger.debug("[cv_parser] languages override skipped")
 
+    def _cached_parse(self, cv_file_path: str):
+        """
+        Returns (cache_key, cached_parsed_cv). Both are None when caching is disabled.
+        """
+        if not self.cache:
+            return None, None
+        cache_key = self._cache_key(cv_file_path)
+        cached = self.cache.get(cache_key)
+        if isinstance(cached, dict):
+            parsed_cv_cache_hits_total.inc()
+            logger.info("[cv_parser] parsed CV cache hit")
+            return cache_key, cached
+        parsed_cv_cache_misses_total.inc()
+        return cache_key, None
+
+    def run(self, state: RecruitmentState) -> RecruitmentState:
+        if state.stop_pipeline:
+            return state
+
+        # Text handed over by the chained pipeline's extract stage is not kept in the state
+        cv_text, state.cv_text = state.cv_text, None
+        cache_key, cached = self._cached_parse(state.cv_file_path)
+        if cached is not None:
+            state.parsed_cv = cached
+            return state
+
+        if cv_text is None:
+            cv_text = extract_text(state.cv_file_path)
+        if not cv_text.strip():
+            return reject_unreadable_cv(state)
+        logger.debug(f"[cv_parser] start (mode={self.mode})")
+
+        if self.mode == "single_pass":
+            parsed = self._handle_main_response(self._invoke_text(self._main_prompt(cv_text)))
+            if not self._main_languages(parsed):
+                self._apply_languages(parsed, self._handle_languages_response(self._invoke_text(self._build_languages_prompt(cv_text))))
+        else:
+            # Both prompts only depend on the CV text, so issue them together
+            with ThreadPoolExecutor(max_workers=2, thread_name_prefix="cv-parser") as executor:
+                main_future = executor.submit(self._invoke_text, self._main_prompt(cv_text))
+                lang_future = executor.submit(self._invoke_text, self._build_languages_prompt(cv_text))
+                parsed = self._handle_main_response(main_future.result())
+                self._apply_languages(parsed, self._handle_languages_response(lang_future.result()))
+
+        if cache_key:
+            self.cache.set(cache_key, parsed)
+
+        state.parsed_cv = parsed
+        logger.info("[cv_parser] completed")
+        return state
+
+    async def arun(self, state: RecruitmentState) -> RecruitmentState:
+        if state.stop_pipeline:
+            return state
+
+        # Text handed over by the chained pipeline's extract stage is not kept in the state
+        cv_text, state.cv_text = state.cv_text, None
+        cache_key, cached = await asyncio.to_thread(self._cached_parse, state.cv_file_path)
+        if cached is not None:
+            state.parsed_cv = cached
+            return state
+
+        if cv_text is None:
+            cv_text = await asyncio.to_thread(extract_text, state.cv_file_path)
+        if not cv_text.strip():
+            return reject_unreadable_cv(state)
+        logger.debug(f"[cv_parser] async start (mode={self.mode})")
+
+        if self.mode == "single_pass":
+            parsed = self._handle_main_response(await self._ainvoke_text(self._main_prompt(cv_text)))
+            if not self._main_languages(parsed):
+                self._apply_languages(parsed, self._handle_languages_response(await self._ainvoke_text(self._build_languages_prompt(cv_text))))
+        else:
+            main_raw, lang_raw = await asyncio.gather(
+                self._ainvoke_text(self._main_prompt(cv_text)),
+                self._ainvoke_text(self._build_languages_prompt(cv_text)),
+            )
+            parsed = self._handle_main_response(main_raw)
+            self._apply_languages(parsed, self._handle_languages_response(lang_raw))
+
+        if cache_key:
+            await asyncio.to_thread(self.cache.set, cache_key, parsed)
+
         state.parsed_cv = parsed
         logger.info("[cv_parser] completed")
-        return state
\ No newline at end of file
+        return state
@@ -1,21 +1,73 @@
+import asyncio
+import logging
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph, END
-from utils.email_sender import EmailSender
+from agents.base_agent import BaseAgent
+from agents.checkpoint import get_graph_checkpointer
 from agents.state import RecruitmentState
 from agents.cv_parser_agent import CVParserAgent
 from agents.jd_fetcher_agent import JDFetcherAgent
+from agents.jd_prefilter_agent import JDPrefilterAgent
 from agents.matching_agent import MatchingAgent
 from agents.approver_agent import ApproverAgent
 from agents.final_decision_agent import FinalDecisionAgent
 from config.constants import *
 from config.log_config import AppLogger
+from metrics.prometheus_metrics import graph_runs_resumed_total
 from services.genai import GenAI
+from utils.progress import CVProgressPublisher
 
 logger = AppLogger(__name__)
+
+# Compiled graphs hold no per-request resources. The DB session and the email
+# sender are passed on every run through `config["configurable"]`, e.g.
+#   get_recruitment_graph_matching().invoke(state, config=graph_config(db))
+
+
+def graph_config(
+    db_session,
+    email_sender=None,
+    thread_id: Optional[str] = None,
+    progress_ids: Sequence[str] = (),
+) -> RunnableConfig:
+    """
+    Build the per-run config consumed by the graph nodes. `thread_id` names the
+    run for the checkpointer so a retry of the same run can resume it; nodes
+    publish progress events under `progress_ids` (see utils.progress).
+    """
+    configurable = {"db": db_session}
+    if email_sender is not None:
+        configurable["email_sender"] = email_sender
+    if thread_id is not None:
+        configurable["thread_id"] = thread_id
+    if progress_ids:
+        configurable["progress_ids"] = list(progress_ids)
+    return {"configurable": configurable}
+
+
+def _configurable(config: RunnableConfig, key: str):
+    value = (config or {}).get("configurable", {}).get(key)
+    if value is None:
+        raise ValueError(f"Graph config is missing configurable['{key}'].")
+    return value
+
+
+def _jd_fetcher_from_config(config: RunnableConfig) -> JDFetcherAgent:
+    return JDFetcherAgent(_configurable(config, "db"))
+
+
+def _final_decision_from_config(config: RunnableConfig) -> FinalDecisionAgent:
+    return FinalDecisionAgent(_configurable(config, "email_sender"), _configurable(config, "db"))
+
+
 # ======================================
 # Build RecruitmentGraph_Matching
 # ======================================
-def build_recruitment_graph_matching(db_session):
-    """Build graph for initial CV Parsing + JD Matching."""
+def build_recruitment_graph_matching():
+    """Build graph for initial CV Parsing + JD Prefilter + JD Matching."""
     llm = GenAI(
         model=DEFAULT_MODEL,
         temperature=0,
@@ -25,28 +77,30 @@ def build_recruitment_graph_matching(db_session):
 
     # Create nodes
     cv_parser_agent = CVParserAgent(llm)
-    jd_fetcher_agent = JDFetcherAgent(db_session)
+    jd_prefilter_agent = JDPrefilterAgent()
     matching_agent = MatchingAgent(llm)
 
     # Add nodes to graph
-    graph.add_node("cv_parser_node", cv_parser_with_log(cv_parser_agent))
-    graph.add_node("jd_fetcher_node", jd_fetcher_with_log(jd_fetcher_agent))
-    graph.add_node("matcher_node", matcher_with_log(matching_agent))
+    graph.add_node("cv_parser_node", node_with_log("cv_parser", _static(cv_parser_agent)))
+    graph.add_node("jd_fetcher_node", node_with_log("jd_fetcher", _jd_fetcher_from_config))
+    graph.add_node("jd_prefilter_node", node_with_log("jd_prefilter", _static(jd_prefilter_agent)))
+    graph.add_node("matcher_node", node_with_log("matcher", _static(matching_agent)))
 
     # Define flow
     graph.set_entry_point("cv_parser_node")
     graph.add_edge("cv_parser_node", "jd_fetcher_node")
-    graph.add_edge("jd_fetcher_node", "matcher_node")
+    graph.add_edge("jd_fetcher_node", "jd_prefilter_node")
+    graph.add_edge("jd_prefilter_node", "matcher_node")
     graph.add_edge("matcher_node", END)
 
     logger.info("RecruitmentGraph_Matching built and compiled.")
-    return graph.compile()
+    return graph.compile(checkpointer=get_graph_checkpointer())
 
 
 # ======================================
 # Build RecruitmentGraph_Approval
 # ======================================
-def build_recruitment_graph_approval(db_session, email_sender: EmailSender):
+def build_recruitment_graph_approval():
     """Build graph for Dev Approval + Final Decision."""
     llm = GenAI(
         model=DEFAULT_MODEL,
@@ -55,10 +109,9 @@ def build_recruitment_graph_approval(db_session, email_sender: EmailSender):
 
     graph = StateGraph(RecruitmentState)
     approver_agent = ApproverAgent(llm)
-    final_decision_agent = FinalDecisionAgent(email_sender, db_session)
 
-    graph.add_node("approver_node", approver_with_log(approver_agent))
-    graph.add_node("final_decision_node", final_decision_with_log(final_decision_agent))
+    graph.add_node("approver_node", node_with_log("approver", _static(approver_agent)))
+    graph.add_node("final_decision_node", node_with_log("final_decision", _final_decision_from_config))
 
     graph.set_entry_point("approver_node")
     graph.add_edge("approver_node", "final_decision_node")
@@ -69,90 +122,251 @@ def build_recruitment_graph_approval(db_session, email_sender: EmailSender):
 
 
 # ======================================
-# Wrappers - Corrected Merge State
+# Build RecruitmentGraph_Matching (async)
 # ======================================
+def build_recruitment_graph_matching_async():
+    """Same flow as build_recruitment_graph_matching; run it with `ainvoke`."""
+    llm = GenAI(
+        model=DEFAULT_MODEL,
+        temperature=0,
+    )
 
+    graph = StateGraph(RecruitmentState)
 
-def cv_parser_with_log(agent: CVParserAgent):
-    def wrapper(state):
-        logger.debug("[cv_parser] Starting...")
-        if isinstance(state, RecruitmentState):
-            state_obj = state
-        else:
-            state_obj = RecruitmentState(**state)
+    graph.add_node("cv_parser_node", async_node_with_log("cv_parser", _static(CVParserAgent(llm))))
+    graph.add_node("jd_fetcher_node", async_node_with_log("jd_fetcher", _jd_fetcher_from_config))
+    graph.add_node("jd_prefilter_node", async_node_with_log("jd_prefilter", _static(JDPrefilterAgent())))
+    graph.add_node("matcher_node", async_node_with_log("matcher", _static(MatchingAgent(llm))))
 
-        result = agent.run(state_obj)
-        updated_fields = result.model_dump()
-        merged_state = {**state_obj.model_dump(), **updated_fields}
-        logger.debug(f"[cv_parser] Merged state: {merged_state}")
-        return merged_state
+    graph.set_entry_point("cv_parser_node")
+    graph.add_edge("cv_parser_node", "jd_fetcher_node")
+    graph.add_edge("jd_fetcher_node", "jd_prefilter_node")
+    graph.add_edge("jd_prefilter_node", "matcher_node")
+    graph.add_edge("matcher_node", END)
 
-    return wrapper
+    logger.info("RecruitmentGraph_Matching (async) built and compiled.")
+    return graph.compile(checkpointer=get_graph_checkpointer())
 
 
-def jd_fetcher_with_log(agent: JDFetcherAgent):
-    def wrapper(state):
-        logger.debug("[jd_fetcher] Starting...")
-        if isinstance(state, RecruitmentState):
-            state_obj = state
-        else:
-            state_obj = RecruitmentState(**state)
+# ======================================
+# Build RecruitmentGraph_Approval (async)
+# ======================================
+def build_recruitment_graph_approval_async():
+    """Same flow as build_recruitment_graph_approval; run it with `ainvoke`."""
+    llm = GenAI(
+        model=DEFAULT_MODEL,
+        temperature=0,
+    )
 
-        result = agent.run(state_obj)
-        updated_fields = result.model_dump()
-        merged_state = {**state_obj.model_dump(), **updated_fields}
-        logger.debug(f"[jd_fetcher] Merged state: {merged_state}")
-        return merged_state
+    graph = StateGraph(RecruitmentState)
+    graph.add_node("approver_node", async_node_with_log("approver", _static(ApproverAgent(llm))))
+    graph.add_node("final_decision_node", async_node_with_log("final_decision", _final_decision_from_config))
 
-    return wrapper
+    graph.set_entry_point("approver_node")
+    graph.add_edge("approver_node", "final_decision_node")
+    graph.add_edge("final_decision_node", END)
 
+    logger.info("RecruitmentGraph_Approval (async) built and compiled.")
+    return graph.compile()
 
-def matcher_with_log(agent: MatchingAgent):
-    def wrapper(state):
-        logger.debug("[matcher] Starting...")
-        if isinstance(state, RecruitmentState):
-            state_obj = state
-        else:
-            state_obj = RecruitmentState(**state)
 
-        result = agent.run(state_obj)
-        updated_fields = result.model_dump()
-        merged_state = {**state_obj.model_dump(), **updated_fields}
-        logger.debug(f"[matcher] Merged state: {merged_state}")
-        return merged_state
+# ======================================
+# Stage graphs for the chained Celery pipeline
+# ======================================
+def build_cv_parse_graph():
+    """CV Parsing only; the parse stage of celery_tasks.stages."""
+    llm = GenAI(
+        model=DEFAULT_MODEL,
+        temperature=0,
+    )
 
-    return wrapper
+    graph = StateGraph(RecruitmentState)
+    graph.add_node("cv_parser_node", node_with_log("cv_parser", _static(CVParserAgent(llm))))
+
+    graph.set_entry_point("cv_parser_node")
+    graph.add_edge("cv_parser_node", END)
+
+    logger.info("RecruitmentGraph_CVParse built and compiled.")
+    return graph.compile()
+
+
+def build_jd_matching_graph():
+    """JD Fetch + JD Prefilter + JD Matching on an already parsed CV; the match stage of celery_tasks.stages."""
+    llm = GenAI(
+        model=DEFAULT_MODEL,
+        temperature=0,
+    )
+
+    graph = StateGraph(RecruitmentState)
+    graph.add_node("jd_fetcher_node", node_with_log("jd_fetcher", _jd_fetcher_from_config))
+    graph.add_node("jd_prefilter_node", node_with_log("jd_prefilter", _static(JDPrefilterAgent())))
+    graph.add_node("matcher_node", node_with_log("matcher", _static(MatchingAgent(llm))))
+
+    graph.set_entry_point("jd_fetcher_node")
+    graph.add_edge("jd_fetcher_node", "jd_prefilter_node")
+    graph.add_edge("jd_prefilter_node", "matcher_node")
+    graph.add_edge("matcher_node", END)
+
+    logger.info("RecruitmentGraph_JDMatching built and compiled.")
+    return graph.compile(checkpointer=get_graph_checkpointer())
+
+
+# ======================================
+# Per-process compiled graphs
+# ======================================
+@lru_cache(maxsize=None)
+def get_recruitment_graph_matching():
+    return build_recruitment_graph_matching()
+
+
+@lru_cache(maxsize=None)
+def get_recruitment_graph_approval():
+    return build_recruitment_graph_approval()
+
+
+@lru_cache(maxsize=None)
+def get_recruitment_graph_matching_async():
+    return build_recruitment_graph_matching_async()
+
+
+@lru_cache(maxsize=None)
+def get_recruitment_graph_approval_async():
+    return build_recruitment_graph_approval_async()
+
+
+@lru_cache(maxsize=None)
+def get_cv_parse_graph():
+    return build_cv_parse_graph()
+
+
+@lru_cache(maxsize=None)
+def get_jd_matching_graph():
+    return build_jd_matching_graph()
+
+
+# ======================================
+# Checkpointed runs
+# ======================================
+# With a checkpointer and a thread_id in the config, every completed node is
+# checkpointed. Running the same thread again picks up where it stopped: a
+# finished run returns its final state without running any node, an
+# interrupted one continues after the last completed node.
+
+
+def _resumable(graph, config: RunnableConfig) -> bool:
+    return graph.checkpointer is not None and "thread_id" in (config or {}).get("configurable", {})
+
+
+def invoke_resumable(graph, graph_input: Dict[str, Any], config: RunnableConfig) -> Dict[str, Any]:
+    if not _resumable(graph, config):
+        return graph.invoke(graph_input, config=config)
+    snapshot = graph.get_state(config)
+    if snapshot.values:
+        graph_runs_resumed_total.inc()
+        logger.info(f"[checkpoint] Resuming {config['configurable']['thread_id']} at {list(snapshot.next) or 'end'}")
+        return graph.invoke(None, config=config) if snapshot.next else dict(snapshot.values)
+    return graph.invoke(graph_input, config=config)
+
+
+async def ainvoke_resumable(graph, graph_input: Dict[str, Any], config: RunnableConfig) -> Dict[str, Any]:
+    if not _resumable(graph, config):
+        return await graph.ainvoke(graph_input, config=config)
+    snapshot = await graph.aget_state(config)
+    if snapshot.values:
+        graph_runs_resumed_total.inc()
+        logger.info(f"[checkpoint] Resuming {config['configurable']['thread_id']} at {list(snapshot.next) or 'end'}")
+        return await graph.ainvoke(None, config=config) if snapshot.next else dict(snapshot.values)
+    return await graph.ainvoke(graph_input, config=config)
+
+
+def clear_checkpoints(thread_id: str) -> None:
+    """Drop a finished run's checkpoints."""
+    checkpointer = get_graph_checkpointer()
+    if checkpointer is not None:
+        checkpointer.delete_thread(thread_id)
+
+
+# ======================================
+# Node wrappers - delta state updates
+# ======================================
+# Nodes return only the fields their agent changed; LangGraph merges them into
+# the channels (see the reducers on RecruitmentState). Agents assign new values
+# rather than mutating them in place, so comparing references is enough.
+
+
+def _field_refs(state: RecruitmentState) -> Dict[str, Any]:
+    return {name: getattr(state, name) for name in RecruitmentState.model_fields}
+
+
+def _changed_fields(before: Dict[str, Any], result: RecruitmentState) -> Dict[str, Any]:
+    delta = {}
+    for name, old_value in before.items():
+        value = getattr(result, name)
+        if value is not old_value:
+            delta[name] = value
+    return delta
+
+
+def _as_state(state) -> RecruitmentState:
+    return state if isinstance(state, RecruitmentState) else RecruitmentState(**state)
+
+
+def _log_delta(name: str, delta: Dict[str, Any]) -> None:
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"[{name}] Updated fields: {delta}")
+
+
+def _progress_ids(config: RunnableConfig):
+    return (config or {}).get("configurable", {}).get("progress_ids")
+
+
+def _publish_progress(name: str, result: RecruitmentState, config: RunnableConfig) -> None:
+    """Progress event after the parser and matcher nodes; rejections are published when the result is stored."""
+    ids = _progress_ids(config)
+    if not ids or result.stop_pipeline:
+        return
+    if name == "cv_parser":
+        CVProgressPublisher().publish(
+            ids, "parsed", result.cv_file_path, candidate_name=(result.parsed_cv or {}).get("name")
+        )
+    elif name == "matcher" and result.matched_jd:
+        breakdown = result.matched_jd.get("score_breakdown")
+        score = breakdown.get("total_score") if isinstance(breakdown, dict) else None
+        CVProgressPublisher().publish(
+            ids, "matched", result.cv_file_path, position=result.matched_jd.get("position"), score=score
+        )
+
+
+def _static(agent: BaseAgent) -> Callable[[RunnableConfig], BaseAgent]:
+    return lambda config: agent
 
 
-def approver_with_log(agent: ApproverAgent):
-    def wrapper(state):
-        logger.debug("[approver] Starting...")
-        if isinstance(state, RecruitmentState):
-            state_obj = state
-        else:
-            state_obj = RecruitmentState(**state)
+def node_with_log(name: str, agent_factory: Callable[[RunnableConfig], BaseAgent]):
+    def wrapper(state, config: RunnableConfig):
+        logger.debug(f"[{name}] Starting...")
+        state_obj = _as_state(state)
+        before = _field_refs(state_obj)
 
-        result = agent.run(state_obj)
-        updated_fields = result.model_dump()
-        merged_state = {**state_obj.model_dump(), **updated_fields}
-        logger.debug(f"[approver] Merged state: {merged_state}")
-        return merged_state
+        result = agent_factory(config).run(state_obj)
+        delta = _changed_fields(before, result)
+        _log_delta(name, delta)
+        _publish_progress(name, result, config)
+        return delta
 
     return wrapper
 
 
-def final_decision_with_log(agent: FinalDecisionAgent):
-    def wrapper(state):
-        logger.debug("[final_decision] Starting...")
-        if isinstance(state, RecruitmentState):
-            state_obj = state
-        else:
-            state_obj = RecruitmentState(**state)
+def async_node_with_log(name: str, agent_factory: Callable[[RunnableConfig], BaseAgent]):
+    async def wrapper(state, config: RunnableConfig):
+        logger.debug(f"[{name}] Starting...")
+        state_obj = _as_state(state)
+        before = _field_refs(state_obj)
 
-        result = agent.run(state_obj)
-        updated_fields = result.model_dump()
-        merged_state = {**state_obj.model_dump(), **updated_fields}
-        logger.debug(f"[final_decision] Merged state: {merged_state}")
-        return merged_state
+        result = await agent_factory(config).arun(state_obj)
+        delta = _changed_fields(before, result)
+        _log_delta(name, delta)
+        if _progress_ids(config):
+            await asyncio.to_thread(_publish_progress, name, result, config)
+        return delta
 
     return wrapper
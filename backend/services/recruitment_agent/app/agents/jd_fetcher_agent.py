@@ -10,6 +10,8 @@ class JDFetcherAgent(BaseAgent):
         self.db = db_session
 
     def run(self, state: RecruitmentState) -> RecruitmentState:
+        if state.stop_pipeline:
+            return state
         if not state.position_applied_for:
             raise ValueError("Position to apply for must be provided!")
 
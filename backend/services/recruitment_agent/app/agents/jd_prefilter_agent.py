@@ -0,0 +1,135 @@
+import json
+import re
+from typing import Any, Dict, List
+
+import numpy as np
+
+from agents.base_agent import BaseAgent
+from agents.state import RecruitmentState
+from config.constants import (
+    JD_PREFILTER_ENABLED,
+    JD_PREFILTER_TOP_K,
+    JD_PREFILTER_MIN_SCORE,
+)
+from config.log_config import AppLogger
+from metrics.prometheus_metrics import (
+    jd_prefilter_kept_total,
+    jd_prefilter_dropped_total,
+    jd_prefilter_score,
+)
+
+logger = AppLogger(__name__)
+
+
+def _normalize_skill(skill: Any) -> str:
+    # "Node.js", "node js" and "NodeJS" should land on the same token
+    return re.sub(r"[\s.\-_]+", "", str(skill).lower())
+
+
+def _jd_skills(jd: Dict[str, Any]) -> List[str]:
+    skills = jd.get("skills_required", [])
+    if isinstance(skills, str):
+        try:
+            skills = json.loads(skills)
+        except Exception:
+            return []
+    return skills if isinstance(skills, list) else []
+
+
+def score_skill_overlap(cv_skills: List[str], jd_skills_lists: List[List[str]]) -> np.ndarray:
+    """
+    IDF-weighted Jaccard similarity between the CV skill set and each JD skill set.
+
+    The skill-by-JD matrix is kept sparse as (jd, skill) index pairs; per-JD
+    intersection and JD weights are aggregated with np.bincount.
+    """
+    n_jds = len(jd_skills_lists)
+    if n_jds == 0:
+        return np.zeros(0, dtype=np.float64)
+
+    vocab: Dict[str, int] = {}
+    rows: List[int] = []
+    cols: List[int] = []
+    for jd_idx, skills in enumerate(jd_skills_lists):
+        for token in {_normalize_skill(s) for s in skills}:
+            if not token:
+                continue
+            rows.append(jd_idx)
+            cols.append(vocab.setdefault(token, len(vocab)))
+
+    cv_tokens = {_normalize_skill(s) for s in cv_skills}
+    cv_tokens.discard("")
+    cv_cols = [vocab.setdefault(token, len(vocab)) for token in cv_tokens]
+
+    row_idx = np.asarray(rows, dtype=np.int64)
+    col_idx = np.asarray(cols, dtype=np.int64)
+
+    # Smoothed IDF over the JD catalog: skills required by every JD weigh less
+    df = np.bincount(col_idx, minlength=len(vocab)).astype(np.float64)
+    idf = np.log((1.0 + n_jds) / (1.0 + df)) + 1.0
+
+    cv_mask = np.zeros(len(vocab), dtype=bool)
+    cv_mask[cv_cols] = True
+
+    entry_w = idf[col_idx]
+    jd_weight = np.bincount(row_idx, weights=entry_w, minlength=n_jds)
+    inter_weight = np.bincount(row_idx, weights=entry_w * cv_mask[col_idx], minlength=n_jds)
+    cv_weight = idf[cv_mask].sum()
+
+    union_weight = cv_weight + jd_weight - inter_weight
+    return np.divide(inter_weight, union_weight, out=np.zeros(n_jds), where=union_weight > 0)
+
+
+class JDPrefilterAgent(BaseAgent):
+    """
+    Deterministic pre-ranking of the fetched JDs so that only the most
+    promising ones are sent to the LLM by MatchingAgent.
+    """
+
+    def __init__(
+        self,
+        top_k: int = JD_PREFILTER_TOP_K,
+        min_score: float = JD_PREFILTER_MIN_SCORE,
+        enabled: bool = JD_PREFILTER_ENABLED,
+    ):
+        self.top_k = top_k
+        self.min_score = min_score
+        self.enabled = enabled
+
+    def run(self, state: RecruitmentState) -> RecruitmentState:
+        if state.stop_pipeline or not self.enabled:
+            return state
+
+        jd_list = state.jd_list or []
+        if not jd_list or not isinstance(state.parsed_cv, dict):
+            return state
+
+        if len(jd_list) <= self.top_k and self.min_score <= 0:
+            logger.debug(f"[JDPrefilterAgent] {len(jd_list)} JD(s) within top_k={self.top_k}. Nothing to prefilter.")
+            return state
+
+        cv_skills = state.parsed_cv.get("skills", []) or []
+        scores = score_skill_overlap(cv_skills, [_jd_skills(jd) for jd in jd_list])
+        for score in scores:
+            jd_prefilter_score.observe(float(score))
+
+        # Stable sort keeps the original JD order on ties
+        ranked = np.argsort(-scores, kind="stable")
+        ranked = ranked[scores[ranked] >= self.min_score]
+        if self.top_k > 0:
+            ranked = ranked[: self.top_k]
+        kept = sorted(int(i) for i in ranked)
+
+        jd_prefilter_kept_total.inc(len(kept))
+        jd_prefilter_dropped_total.inc(len(jd_list) - len(kept))
+        logger.info(
+            f"[JDPrefilterAgent] Kept {len(kept)}/{len(jd_list)} JD(s) for LLM matching "
+            f"(top_k={self.top_k}, min_score={self.min_score})"
+        )
+
+        state.jd_list = [jd_list[i] for i in kept]
+        if not state.jd_list:
+            state.matched_jd = None
+            state.stop_pipeline = True
+            state.final_decision = "CV rejected: No JD passed the skill prefilter."
+        return state
@@ -1,9 +1,18 @@
+import asyncio
 import json
-from typing import Any, Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 from agents.base_agent import BaseAgent
 from agents.state import RecruitmentState
-from config.constants import MATCHING_SCORE_PERCENTAGE
+from config.constants import (
+    MATCHING_SCORE_PERCENTAGE,
+    MATCHING_CONCURRENCY,
+    MATCHING_JD_TIMEOUT,
+    MATCHING_ATTEMPT_TIMEOUT,
+    MATCHING_SCORING_MODE,
+    MATCHING_BATCH_SIZE,
+)
 from config.log_config import AppLogger
 from utils.utils import *
 logger = AppLogger(__name__)
@@ -34,11 +43,42 @@ Languages: {json.dumps(languages, ensure_ascii=False)}
 """.strip()
 
 
-def _parse_llm_scores(raw: Any) -> Tuple[float, float, float, str, str]:
-    s = ensure_text(raw)
-    s = unwrap_maybe_wrapper(s)
-    s = clean_json_from_text(s)
-    obj = json.loads(s)
+def _build_batch_scoring_prompt(cv_skills: List[str], jd_skills_lists: List[List[str]], education: List[Dict[str, Any]], languages: List[Dict[str, str]]) -> str:
+    jd_lines = "\n".join(
+        f"{idx}. {', '.join(jd_skills)}" for idx, jd_skills in enumerate(jd_skills_lists)
+    )
+    return f"""
+You are an ATS scoring assistant.
+
+Score the candidate vs EACH numbered JD independently with this weighting:
+- main_skills_score: 0–80, based ONLY on overlap and seniority fit between candidate skills and JD skills.
+- extras_score: 0–20, based on education relevance/level and language proficiency (CEFR). Keep it conservative.
+- total_score: main_skills_score + extras_score (must be 0–100).
+
+Return ONLY ONE JSON array with exactly one object per JD, in the same order, each with exactly these keys:
+[
+  {{
+    "jd_index": 0,
+    "main_skills_score": 0.0,
+    "extras_score": 0.0,
+    "total_score": 0.0,
+    "rationale": "short reason",
+    "justification": "1–3 concise sentences for why this is or isn't a fit"
+  }}
+]
+
+Candidate skills: {", ".join(cv_skills)}
+Education: {json.dumps(education, ensure_ascii=False)}
+Languages: {json.dumps(languages, ensure_ascii=False)}
+
+JD skills:
+{jd_lines}
+""".strip()
+
+
+def _validate_score_object(obj: Any) -> Tuple[float, float, float, str, str]:
+    if not isinstance(obj, dict):
+        raise ValueError("Score entry is not an object.")
 
     main = float(obj.get("main_skills_score", 0.0))
     extra = float(obj.get("extras_score", 0.0))
@@ -56,71 +96,269 @@ def _parse_llm_scores(raw: Any) -> Tuple[float, float, float, str, str]:
     return main, extra, total, rationale, justification
 
 
+def _parse_llm_scores(raw: Any) -> Tuple[float, float, float, str, str]:
+    s = ensure_text(raw)
+    s = unwrap_maybe_wrapper(s)
+    s = clean_json_from_text(s)
+    obj = json.loads(s)
+    return _validate_score_object(obj)
+
+
+def _parse_llm_batch_scores(raw: Any, expected: int) -> List[Optional[Tuple[float, float, float, str, str]]]:
+    """
+    Vectorized counterpart of _parse_llm_scores. Returns one entry per JD in
+    prompt order; entries that are missing or fail validation are None.
+    """
+    s = ensure_text(raw)
+    s = unwrap_maybe_wrapper(s)
+    s = clean_json_from_text(s)
+    arr = json.loads(s)
+    if not isinstance(arr, list):
+        raise ValueError("Batch scores is not a JSON array.")
+
+    results: List[Optional[Tuple[float, float, float, str, str]]] = [None] * expected
+    for position, obj in enumerate(arr):
+        idx = obj.get("jd_index", position) if isinstance(obj, dict) else position
+        try:
+            idx = int(idx)
+        except (TypeError, ValueError):
+            idx = position
+        if not 0 <= idx < expected or results[idx] is not None:
+            continue
+        try:
+            results[idx] = _validate_score_object(obj)
+        except Exception as e:
+            logger.debug(f"[MatchingAgent] Invalid batch score entry #{idx}: {e}")
+    return results
+
+
 class MatchingAgent(BaseAgent):
-    def __init__(self, llm):
+    def __init__(
+        self,
+        llm,
+        concurrency: int = MATCHING_CONCURRENCY,
+        jd_timeout: float = MATCHING_JD_TIMEOUT,
+        attempt_timeout: float = MATCHING_ATTEMPT_TIMEOUT,
+        scoring_mode: str = MATCHING_SCORING_MODE,
+        batch_size: int = MATCHING_BATCH_SIZE,
+    ):
         self.llm = llm
+        self.concurrency = max(1, int(concurrency or 1))
+        # jd_timeout bounds a whole scoring call; attempt_timeout one HTTP attempt within it
+        self.jd_timeout = jd_timeout
+        self.attempt_timeout = min(attempt_timeout, jd_timeout)
+        self.scoring_mode = scoring_mode
+        self.batch_size = max(1, int(batch_size or 1))
 
-    def run(self, state: RecruitmentState) -> RecruitmentState:
-        if state.stop_pipeline:
-            return state
+    def _decode_jd_skills(self, jd: Dict[str, Any]) -> Optional[List[str]]:
+        jd_skills_list = jd.get("skills_required", [])
+        if isinstance(jd_skills_list, str):
+            try:
+                jd_skills_list = json.loads(jd_skills_list)
+            except Exception as e:
+                logger.error(f"[MatchingAgent] Failed to decode JD skills JSON: {e}")
+                return None
+        if not isinstance(jd_skills_list, list):
+            logger.error("[MatchingAgent] JD skills_required must be list or JSON-encoded list.")
+            return None
+        return jd_skills_list
+
+    @staticmethod
+    def _response_raw(resp) -> Any:
+        return getattr(resp, "content", None) or getattr(resp, "text", None) or getattr(resp, "data", None) or resp
+
+    @staticmethod
+    def _to_payload(scores: Tuple[float, float, float, str, str]) -> Dict[str, Any]:
+        main, extra, total, rationale, justification = scores
+        return {
+            "main_skills_score": main,
+            "extras_score": extra,
+            "total_score": total,
+            "rationale": rationale,
+            "justification": justification,
+        }
+
+    def _jd_payload(self, jd: Dict[str, Any], resp) -> Dict[str, Any]:
+        payload = self._to_payload(_parse_llm_scores(self._response_raw(resp)))
+        logger.debug(
+            f"[MatchingAgent] JD='{jd.get('position','')}' scores: main={payload['main_skills_score']:.2f} "
+            f"extra={payload['extras_score']:.2f} total={payload['total_score']:.2f}"
+        )
+        return payload
 
+    def _batch_payloads(self, batch: List[Tuple[Dict[str, Any], List[str]]], resp) -> List[Optional[Dict[str, Any]]]:
+        parsed = _parse_llm_batch_scores(self._response_raw(resp), len(batch))
+        payloads: List[Optional[Dict[str, Any]]] = []
+        for (jd, _), scores in zip(batch, parsed):
+            if scores is None:
+                payloads.append(None)
+                continue
+            payload = self._to_payload(scores)
+            logger.debug(f"[MatchingAgent] JD='{jd.get('position','')}' batch scores: total={payload['total_score']:.2f}")
+            payloads.append(payload)
+        return payloads
+
+    def _invoke(self, prompt: str):
+        return self.llm.invoke(prompt, timeout=self.attempt_timeout, deadline=self.jd_timeout)
+
+    async def _ainvoke(self, prompt: str):
+        # The client keeps retries within the deadline; wait_for is the hard stop
+        return await asyncio.wait_for(
+            self.llm.ainvoke(prompt, timeout=self.attempt_timeout, deadline=self.jd_timeout), self.jd_timeout
+        )
+
+    def _score_jd(self, jd: Dict[str, Any], jd_skills_list: List[str], cv_skills: List[str], education: List[Dict[str, Any]], languages: List[Dict[str, str]]) -> Optional[Dict[str, Any]]:
+        """
+        Score a single JD. Returns the score payload or None when scoring failed.
+        """
+        prompt = _build_scoring_prompt(cv_skills, jd_skills_list, education, languages)
+        try:
+            return self._jd_payload(jd, self._invoke(prompt))
+        except Exception as e:
+            logger.error(f"[MatchingAgent] LLM scoring failed for JD='{jd.get('position','')}': {e}")
+            return None
+
+    def _score_batch(self, batch: List[Tuple[Dict[str, Any], List[str]]], cv_skills, education, languages) -> List[Optional[Dict[str, Any]]]:
+        """
+        Score several JDs with a single LLM call. Entries that cannot be
+        validated are returned as None so the caller can fall back to per-JD scoring.
+        """
+        prompt = _build_batch_scoring_prompt(cv_skills, [skills for _, skills in batch], education, languages)
+        try:
+            return self._batch_payloads(batch, self._invoke(prompt))
+        except Exception as e:
+            logger.error(f"[MatchingAgent] Batched LLM scoring failed for {len(batch)} JD(s): {e}")
+            return [None] * len(batch)
+
+    def _run_parallel(self, fn, items: List[Any]) -> List[Any]:
+        if self.concurrency <= 1 or len(items) <= 1:
+            return [fn(item) for item in items]
+
+        workers = min(self.concurrency, len(items))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="jd-scoring") as executor:
+            futures = [executor.submit(fn, item) for item in items]
+            return [future.result() for future in futures]
+
+    def _batches(self, candidates):
+        return [candidates[i:i + self.batch_size] for i in range(0, len(candidates), self.batch_size)]
+
+    def _score_all(self, candidates: List[Tuple[Dict[str, Any], List[str]]], cv_skills, education, languages) -> List[Optional[Dict[str, Any]]]:
+        """
+        Score every (jd, jd_skills) pair. Results keep the order of `candidates`
+        so the best-match selection is the same as in the sequential path.
+        """
+        def score_one(candidate):
+            jd, skills = candidate
+            return self._score_jd(jd, skills, cv_skills, education, languages)
+
+        if self.scoring_mode != "batched" or len(candidates) <= 1:
+            logger.debug(f"[MatchingAgent] Scoring {len(candidates)} JD(s) with concurrency={self.concurrency}")
+            return self._run_parallel(score_one, candidates)
+
+        batches = self._batches(candidates)
+        logger.debug(f"[MatchingAgent] Scoring {len(candidates)} JD(s) in {len(batches)} batch(es)")
+        scores: List[Optional[Dict[str, Any]]] = []
+        for batch_scores in self._run_parallel(lambda batch: self._score_batch(batch, cv_skills, education, languages), batches):
+            scores.extend(batch_scores)
+
+        # Fall back to per-JD scoring for entries that failed validation
+        retry_idx = [i for i, payload in enumerate(scores) if payload is None]
+        if retry_idx:
+            logger.info(f"[MatchingAgent] Falling back to per-JD scoring for {len(retry_idx)} JD(s)")
+            for i, payload in zip(retry_idx, self._run_parallel(score_one, [candidates[i] for i in retry_idx])):
+                scores[i] = payload
+        return scores
+
+    async def _ascore_jd(self, semaphore: asyncio.Semaphore, jd: Dict[str, Any], jd_skills_list: List[str], cv_skills, education, languages) -> Optional[Dict[str, Any]]:
+        prompt = _build_scoring_prompt(cv_skills, jd_skills_list, education, languages)
+        try:
+            async with semaphore:
+                resp = await self._ainvoke(prompt)
+            return self._jd_payload(jd, resp)
+        except Exception as e:
+            logger.error(f"[MatchingAgent] LLM scoring failed for JD='{jd.get('position','')}': {e!r}")
+            return None
+
+    async def _ascore_batch(self, semaphore: asyncio.Semaphore, batch, cv_skills, education, languages) -> List[Optional[Dict[str, Any]]]:
+        prompt = _build_batch_scoring_prompt(cv_skills, [skills for _, skills in batch], education, languages)
+        try:
+            async with semaphore:
+                resp = await self._ainvoke(prompt)
+            return self._batch_payloads(batch, resp)
+        except Exception as e:
+            logger.error(f"[MatchingAgent] Batched LLM scoring failed for {len(batch)} JD(s): {e!r}")
+            return [None] * len(batch)
+
+    async def _ascore_all(self, candidates: List[Tuple[Dict[str, Any], List[str]]], cv_skills, education, languages) -> List[Optional[Dict[str, Any]]]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        if self.scoring_mode != "batched" or len(candidates) <= 1:
+            return list(await asyncio.gather(*(
+                self._ascore_jd(semaphore, jd, skills, cv_skills, education, languages) for jd, skills in candidates
+            )))
+
+        scores: List[Optional[Dict[str, Any]]] = []
+        for batch_scores in await asyncio.gather(*(
+            self._ascore_batch(semaphore, batch, cv_skills, education, languages) for batch in self._batches(candidates)
+        )):
+            scores.extend(batch_scores)
+
+        retry_idx = [i for i, payload in enumerate(scores) if payload is None]
+        if retry_idx:
+            logger.info(f"[MatchingAgent] Falling back to per-JD scoring for {len(retry_idx)} JD(s)")
+            retried = await asyncio.gather(*(
+                self._ascore_jd(semaphore, candidates[i][0], candidates[i][1], cv_skills, education, languages) for i in retry_idx
+            ))
+            for i, payload in zip(retry_idx, retried):
+                scores[i] = payload
+        return scores
+
+    def _prepare(self, state: RecruitmentState) -> Optional[Tuple[List[Tuple[Dict[str, Any], List[str]]], List[str], List[Dict[str, Any]], List[Dict[str, str]]]]:
+        """
+        Validate the inputs. Returns None (after marking the state as stopped)
+        when there is nothing to match.
+        """
         if not state.jd_list:
             logger.warn("[MatchingAgent] No Job Descriptions (JDs) available for matching.")
             state.matched_jd = None
             state.stop_pipeline = True
             state.final_decision = "CV rejected: No available JDs."
-            return state
+            return None
 
         if not state.parsed_cv or not isinstance(state.parsed_cv, dict):
             logger.warn("[MatchingAgent] No parsed CV data available.")
             state.matched_jd = None
             state.stop_pipeline = True
             state.final_decision = "CV rejected: Invalid CV content."
-            return state
+            return None
 
         parsed = state.parsed_cv
         cv_skills: List[str] = parsed.get("skills", []) or []
         education: List[Dict[str, Any]] = parsed.get("education", []) or []
         languages: List[Dict[str, str]] = parsed.get("languages", []) or []
 
+        candidates: List[Tuple[Dict[str, Any], List[str]]] = []
+        for jd in state.jd_list:
+            jd_skills_list = self._decode_jd_skills(jd)
+            if jd_skills_list is not None:
+                candidates.append((jd, jd_skills_list))
+        return candidates, cv_skills, education, languages
+
+    def _select_best(self, state: RecruitmentState, candidates, scores) -> RecruitmentState:
         best_match = None
         best_score = -1.0
         best_jd_skills: List[str] = []
         best_scores_payload: Dict[str, Any] = {}
 
-        for jd in state.jd_list:
-            jd_skills_list = jd.get("skills_required", [])
-            if isinstance(jd_skills_list, str):
-                try:
-                    jd_skills_list = json.loads(jd_skills_list)
-                except Exception as e:
-                    logger.error(f"[MatchingAgent] Failed to decode JD skills JSON: {e}")
-                    continue
-            if not isinstance(jd_skills_list, list):
-                logger.error("[MatchingAgent] JD skills_required must be list or JSON-encoded list.")
-                continue
-
-            prompt = _build_scoring_prompt(cv_skills, jd_skills_list, education, languages)
-            try:
-                resp = self.llm.invoke(prompt)
-                raw = getattr(resp, "content", None) or getattr(resp, "text", None) or getattr(resp, "data", None) or resp
-                main, extra, total, rationale, justification = _parse_llm_scores(raw)
-                logger.debug(f"[MatchingAgent] JD='{jd.get('position','')}' scores: main={main:.2f} extra={extra:.2f} total={total:.2f}")
-            except Exception as e:
-                logger.error(f"[MatchingAgent] LLM scoring failed for JD='{jd.get('position','')}': {e}")
+        for (jd, jd_skills_list), payload in zip(candidates, scores):
+            if payload is None:
                 continue
-
+            total = payload["total_score"]
             if total > best_score:
                 best_score = total
                 best_match = jd
                 best_jd_skills = jd_skills_list
-                best_scores_payload = {
-                    "main_skills_score": main,
-                    "extras_score": extra,
-                    "total_score": total,
-                    "rationale": rationale,
-                    "justification": justification,
-                }
+                best_scores_payload = payload
 
         if best_match and best_score >= MATCHING_SCORE_PERCENTAGE:
             logger.info(f"[MatchingAgent] Best match: {best_match.get('position')} (Score: {best_score:.2f}%)")
@@ -138,3 +376,25 @@ class MatchingAgent(BaseAgent):
         state.stop_pipeline = True
         state.final_decision = "CV rejected: No matching JD found."
         return state
+
+    def run(self, state: RecruitmentState) -> RecruitmentState:
+        if state.stop_pipeline:
+            return state
+
+        prepared = self._prepare(state)
+        if prepared is None:
+            return state
+        candidates, cv_skills, education, languages = prepared
+        scores = self._score_all(candidates, cv_skills, education, languages)
+        return self._select_best(state, candidates, scores)
+
+    async def arun(self, state: RecruitmentState) -> RecruitmentState:
+        if state.stop_pipeline:
+            return state
+
+        prepared = self._prepare(state)
+        if prepared is None:
+            return state
+        candidates, cv_skills, education, languages = prepared
+        scores = await self._ascore_all(candidates, cv_skills, education, languages)
+        return self._select_best(state, candidates, scores)
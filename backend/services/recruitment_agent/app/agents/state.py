@@ -1,8 +1,11 @@
-from typing import Optional, List, Dict, Any
+import operator
+from typing import Annotated, Optional, List, Dict, Any
 from pydantic import BaseModel
 
 class RecruitmentState(BaseModel):
     cv_file_path: Optional[str] = None
+    # Text extracted by an earlier task (the chained pipeline); parsing clears it
+    cv_text: Optional[str] = None
     override_email: Optional[str] = None
     position_applied_for: Optional[str] = None
     parsed_cv: Optional[Dict[str, Any]] = None
@@ -13,4 +16,6 @@ class RecruitmentState(BaseModel):
     final_decision: Optional[str] = None
     interview_questions: Optional[List[str]] = None
     cv_summary: Optional[str] = None
-    stop_pipeline: bool = False
\ No newline at end of file
+    # Graph nodes return only the fields they changed; once a node stops the
+    # pipeline, later updates cannot clear the flag.
+    stop_pipeline: Annotated[bool, operator.or_] = False
@@ -1,15 +1,45 @@
 # celery_tasks/pipeline.py
+import asyncio
+from typing import List
+
+from agents.graph import clear_checkpoints
 from celery_worker import celery
+from config.constants import ASYNC_PIPELINE_CONCURRENCY
 from config.database import DatabaseSession
 from config.log_config import AppLogger
+from metrics.prometheus_metrics import cv_upload_duplicates_total
+from utils.batch_tracker import CVBatchTracker
+from utils.progress import CVProgressPublisher, progress_ids
+from utils.upload_lock import CVUploadLock
 
 logger = AppLogger(__name__)
 
 @celery.task(name="celery_tasks.process_cv_pipeline", bind=True, max_retries=3)
-def process_cv_pipeline(self, cv_file_path: str, email: str, position: str, username: str):
+def process_cv_pipeline(self, cv_file_path: str, email: str, position: str, username: str, batch_id: str = None,
+                        checkpoint_thread: str = None, upload_id: str = None):
     """
     Celery task to process a CV file (already uploaded to disk) and run the matching pipeline.
+    CVs uploaded in bulk carry a batch_id whose progress counters are updated here.
+    The graph is checkpointed under the task ID (retries keep it), or under
+    `checkpoint_thread` when continuing a run started elsewhere, so a retry
+    resumes after the last completed node.
+    A CV identical to one already in flight (same file, position and user) is skipped.
+    Progress events are published under the upload ID and the batch ID.
     """
+    thread_id = checkpoint_thread or f"cv_pipeline:{self.request.id}"
+    upload_id = upload_id or f"task:{self.request.id}"
+    event_ids = progress_ids(upload_id, batch_id)
+    upload_lock = CVUploadLock()
+    lock_key = CVUploadLock.file_idempotency_key(cv_file_path, position, username)
+    holder = upload_lock.acquire(lock_key, upload_id)
+    if holder != upload_id:
+        logger.info(f"[TASK] {cv_file_path} is identical to in-flight upload {holder}, skipping")
+        cv_upload_duplicates_total.inc()
+        CVProgressPublisher().publish(event_ids, "duplicate", cv_file_path, duplicate_of=holder)
+        if batch_id:
+            CVBatchTracker().mark_processed(batch_id)
+        return f"Duplicate of in-flight upload {holder}; skipped."
+
     db = DatabaseSession()
     try:
         logger.info(f"[TASK] Start processing CV for position: {position} with cv_file: {cv_file_path}")
@@ -20,17 +50,113 @@ def process_cv_pipeline(self, cv_file_path: str, email: str, position: str, user
             override_email=email,
             position_applied_for=position,
             username=username,
-            db=db
+            db=db,
+            thread_id=thread_id,
+            progress_ids=event_ids,
         )
 
         logger.info(f"[✓] CV processed successfully for: {cv_file_path}")
+        upload_lock.release(lock_key, upload_id)
+        if batch_id:
+            CVBatchTracker().mark_processed(batch_id)
         return task_result
     except Exception as e:
         logger.error(f"[✘] Failed to process CV for: {cv_file_path} | Error: {e}")
+        if self.request.retries >= self.max_retries:
+            clear_checkpoints(thread_id)
+            upload_lock.release(lock_key, upload_id)
+            CVProgressPublisher().publish(event_ids, "failed", cv_file_path, error=str(e))
+            if batch_id:
+                CVBatchTracker().mark_failed(batch_id)
         self.retry(exc=e, countdown=10)
     finally:
         db.close()
 
+async def _run_cv_batch(items: List[dict], concurrency: int) -> List[dict]:
+    from services.service import RecruitmentService
+    from services.genai import GenAI
+
+    service = RecruitmentService()
+    upload_lock = CVUploadLock()
+    batch_tracker = CVBatchTracker()
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run_one(item: dict) -> dict:
+        async with semaphore:
+            cv_file_path, upload_id, batch_id = item["cv_file_path"], item["upload_id"], item.get("batch_id")
+            event_ids = progress_ids(upload_id, batch_id)
+            # Sessions are not shared between concurrent graphs
+            db = DatabaseSession()
+            try:
+                lock_key = await asyncio.to_thread(
+                    CVUploadLock.file_idempotency_key, cv_file_path, item.get("position"), item.get("username")
+                )
+                holder = await asyncio.to_thread(upload_lock.acquire, lock_key, upload_id)
+                if holder != upload_id:
+                    logger.info(f"[TASK] {cv_file_path} is identical to in-flight upload {holder}, skipping")
+                    cv_upload_duplicates_total.inc()
+                    CVProgressPublisher().publish(event_ids, "duplicate", cv_file_path, duplicate_of=holder)
+                    if batch_id:
+                        await asyncio.to_thread(batch_tracker.mark_processed, batch_id)
+                    return {"cv_file_path": cv_file_path, "status": "duplicate", "duplicate_of": holder}
+
+                result = await service.aupload_cv_from_file_path(
+                    cv_file_path=cv_file_path,
+                    override_email=item.get("email"),
+                    position_applied_for=item.get("position"),
+                    username=item.get("username"),
+                    db=db,
+                    thread_id=item["thread_id"],
+                    progress_ids=event_ids,
+                )
+                logger.info(f"[✓] CV processed successfully for: {cv_file_path}")
+                await asyncio.to_thread(upload_lock.release, lock_key, upload_id)
+                if batch_id:
+                    await asyncio.to_thread(batch_tracker.mark_processed, batch_id)
+                return {"cv_file_path": cv_file_path, "status": "done", "result": result}
+            except Exception as e:
+                # The lock stays with upload_id: the re-queued task claims it again
+                logger.error(f"[✘] Failed to process CV for: {cv_file_path} | Error: {e!r}")
+                db.rollback()
+                return {"cv_file_path": cv_file_path, "status": "failed", "error": str(e)}
+            finally:
+                db.close()
+
+    try:
+        return await asyncio.gather(*(run_one(item) for item in items))
+    finally:
+        await GenAI.aclose()
+
+@celery.task(name="celery_tasks.process_cv_pipeline_batch", bind=True)
+def process_cv_pipeline_batch(self, items: List[dict]):
+    """
+    Celery task to run several CV pipelines concurrently on one event loop.
+    Each item carries the process_cv_pipeline arguments: cv_file_path, email, position, username,
+    and optionally batch_id and upload_id. Duplicates, the upload lock and the batch
+    counters are handled per CV as in process_cv_pipeline.
+    Failed CVs are re-queued individually so they keep the per-CV retry policy
+    and resume from the nodes they already completed here.
+    """
+    logger.info(f"[TASK] Start processing batch of {len(items)} CV(s) (concurrency={ASYNC_PIPELINE_CONCURRENCY})")
+    items = [
+        {
+            **item,
+            "thread_id": f"cv_pipeline:{self.request.id}:{i}",
+            "upload_id": item.get("upload_id") or f"task:{self.request.id}:{i}",
+        }
+        for i, item in enumerate(items)
+    ]
+    results = asyncio.run(_run_cv_batch(items, ASYNC_PIPELINE_CONCURRENCY))
+
+    for item, result in zip(items, results):
+        if result["status"] == "failed":
+            # The re-queued task resumes from this run's checkpoints and owns the same upload lock
+            process_cv_pipeline.delay(
+                item["cv_file_path"], item.get("email"), item.get("position"), item.get("username"),
+                batch_id=item.get("batch_id"), checkpoint_thread=item["thread_id"], upload_id=item["upload_id"],
+            )
+    return results
+
 @celery.task(name="celery_tasks.approve_cv_task", bind=True, max_retries=3)
 def approve_cv_task(self, candidate_id: int):
     """
@@ -0,0 +1,254 @@
+# celery_tasks/stages.py
+"""
+The CV matching graph split into chained Celery tasks, one queue per stage:
+
+    extract_cv_text -> parse_cv -> match_cv -> persist_cv_result
+
+Each stage receives the job dict returned by the previous one. The extracted
+text travels in the job, so parse_cv never extracts again, whether or not the
+extracted-text cache is enabled. match_cv checkpoints its graph under the task
+ID, so a retry resumes after the last completed node.
+
+Used when CV_PIPELINE_MODE is "chain". Start a worker per stage with
+CELERY_WORKER_STAGE set to size CPU-bound and LLM-bound stages independently.
+"""
+from typing import List, Optional
+
+from celery import Task, chain
+
+from agents.cv_parser_agent import reject_unreadable_cv
+from agents.graph import clear_checkpoints, get_cv_parse_graph, get_jd_matching_graph, graph_config, invoke_resumable
+from agents.state import RecruitmentState
+from celery_worker import celery
+from config.constants import *
+from config.database import DatabaseSession
+from config.log_config import AppLogger
+from metrics.prometheus_metrics import cv_upload_duplicates_total
+from utils.batch_tracker import CVBatchTracker
+from utils.progress import CVProgressPublisher, progress_ids
+from utils.text_extraction import extract_text
+from utils.upload_lock import CVUploadLock
+
+logger = AppLogger(__name__)
+
+MATCH_STAGE = "celery_tasks.stages.match_cv"
+
+
+def _soft_limit(time_limit: int) -> int:
+    return max(1, int(time_limit * 0.9))
+
+
+class CVStageTask(Task):
+    """Retries a failed stage; once retries run out the rest of the chain is dropped."""
+
+    autoretry_for = (Exception,)
+    max_retries = 3
+    default_retry_delay = 10
+
+    def on_failure(self, exc, task_id, args, kwargs, einfo):
+        job = args[0] if args else kwargs.get("job") or {}
+        logger.error(f"[✘] Stage {self.name} failed for: {job.get('cv_file_path')} | Error: {exc}")
+        _release_upload(job, job.get("upload_id") or f"task:{task_id}")
+        CVProgressPublisher().publish(
+            progress_ids(job.get("upload_id") or f"task:{task_id}", job.get("batch_id")),
+            "failed", job.get("cv_file_path"), error=str(exc),
+        )
+        if job.get("batch_id"):
+            CVBatchTracker().mark_failed(job["batch_id"])
+        if self.name == MATCH_STAGE:
+            clear_checkpoints(_checkpoint_thread(task_id))
+
+
+def _checkpoint_thread(task_id: str) -> str:
+    # Retries keep the task ID, so they resume the same thread
+    return f"{MATCH_STAGE}:{task_id}"
+
+
+def _progress_ids(job: dict):
+    return progress_ids(job.get("upload_id"), job.get("batch_id"))
+
+
+def _release_upload(job: dict, upload_id: str) -> None:
+    try:
+        lock_key = CVUploadLock.file_idempotency_key(job["cv_file_path"], job.get("position"), job.get("username"))
+    except OSError:
+        return  # file gone; the lock expires on its own
+    CVUploadLock().release(lock_key, upload_id)
+
+
+@celery.task(
+    name="celery_tasks.stages.extract_cv_text",
+    base=CVStageTask,
+    bind=True,
+    time_limit=CV_EXTRACT_TIME_LIMIT,
+    soft_time_limit=_soft_limit(CV_EXTRACT_TIME_LIMIT),
+)
+def extract_cv_text(self, job: dict) -> dict:
+    """CPU-bound stage: duplicate check, text extraction and OCR fallback; the text is passed on in the job."""
+    job["upload_id"] = job.get("upload_id") or f"task:{self.request.id}"
+    lock_key = CVUploadLock.file_idempotency_key(job["cv_file_path"], job.get("position"), job.get("username"))
+    holder = CVUploadLock().acquire(lock_key, job["upload_id"])
+    if holder != job["upload_id"]:
+        # Later stages pass the job through untouched
+        logger.info(f"[TASK] {job['cv_file_path']} is identical to in-flight upload {holder}, skipping")
+        cv_upload_duplicates_total.inc()
+        job["duplicate_of"] = holder
+        return job
+
+    cv_text = extract_text(job["cv_file_path"])
+    if not cv_text.strip():
+        # Retrying would not help; parse_cv rejects the CV without extracting again
+        job["unreadable"] = True
+        return job
+    logger.info(f"[TASK] Extracted {len(cv_text)} chars from: {job['cv_file_path']}")
+    job["cv_text"] = cv_text
+    return job
+
+
+@celery.task(
+    name="celery_tasks.stages.parse_cv",
+    base=CVStageTask,
+    bind=True,
+    time_limit=CV_PARSE_TIME_LIMIT,
+    soft_time_limit=_soft_limit(CV_PARSE_TIME_LIMIT),
+)
+def parse_cv(self, job: dict) -> dict:
+    """LLM-bound stage: CV parsing."""
+    if job.get("duplicate_of"):
+        return job
+    from services.service import RecruitmentService
+
+    state = RecruitmentService.initial_matching_state(job["cv_file_path"], job.get("email"), job.get("position"))
+    if job.get("unreadable"):
+        job["state"] = reject_unreadable_cv(state).model_dump()
+        return job
+    # A retry gets the same job, so the text is only dropped once parsing succeeded
+    state.cv_text = job.get("cv_text")
+    result = get_cv_parse_graph().invoke(state.model_dump(), config=graph_config(None, progress_ids=_progress_ids(job)))
+    job["state"] = RecruitmentState(**result).model_dump()
+    job.pop("cv_text", None)
+    return job
+
+
+@celery.task(
+    name=MATCH_STAGE,
+    base=CVStageTask,
+    bind=True,
+    time_limit=CV_MATCH_TIME_LIMIT,
+    soft_time_limit=_soft_limit(CV_MATCH_TIME_LIMIT),
+)
+def match_cv(self, job: dict) -> dict:
+    """DB + LLM-bound stage: JD fetch, prefilter and matching."""
+    if job.get("duplicate_of"):
+        return job
+    thread_id = _checkpoint_thread(self.request.id)
+    db = DatabaseSession()
+    try:
+        config = graph_config(db, thread_id=thread_id, progress_ids=_progress_ids(job))
+        result = invoke_resumable(get_jd_matching_graph(), job["state"], config)
+    finally:
+        db.close()
+    clear_checkpoints(thread_id)
+    state = RecruitmentState(**result)
+    # Only the matched JD is needed from here on
+    state.jd_list = None
+    job["state"] = state.model_dump()
+    return job
+
+
+@celery.task(
+    name="celery_tasks.stages.persist_cv_result",
+    base=CVStageTask,
+    bind=True,
+    time_limit=CV_PERSIST_TIME_LIMIT,
+    soft_time_limit=_soft_limit(CV_PERSIST_TIME_LIMIT),
+)
+def persist_cv_result(self, job: dict) -> str:
+    """DB stage: store the matched CV."""
+    from services.service import RecruitmentService
+
+    if job.get("duplicate_of"):
+        CVProgressPublisher().publish(_progress_ids(job), "duplicate", job["cv_file_path"], duplicate_of=job["duplicate_of"])
+        if job.get("batch_id"):
+            CVBatchTracker().mark_processed(job["batch_id"])
+        return f"Duplicate of in-flight upload {job['duplicate_of']}; skipped."
+
+    db = DatabaseSession()
+    try:
+        task_result = RecruitmentService().store_matching_result(
+            final_state=RecruitmentState(**job["state"]),
+            cv_file_path=job["cv_file_path"],
+            position_applied_for=job.get("position"),
+            username=job.get("username"),
+            db=db,
+            progress_ids=_progress_ids(job),
+        )
+    finally:
+        db.close()
+
+    logger.info(f"[✓] CV processed successfully for: {job['cv_file_path']}")
+    _release_upload(job, job["upload_id"])
+    if job.get("batch_id"):
+        CVBatchTracker().mark_processed(job["batch_id"])
+    return task_result
+
+
+def cv_pipeline_signature(
+    cv_file_path: str,
+    email: Optional[str],
+    position: str,
+    username: str,
+    batch_id: Optional[str] = None,
+    upload_id: Optional[str] = None,
+):
+    """
+    Celery signature processing one CV, chained per stage or as a single task
+    depending on CV_PIPELINE_MODE. `upload_id` is the owner of the CV's
+    upload lock when the API already claimed it.
+    """
+    if CV_PIPELINE_MODE == "chain":
+        job = {
+            "cv_file_path": cv_file_path,
+            "email": email,
+            "position": position,
+            "username": username,
+            "batch_id": batch_id,
+            "upload_id": upload_id,
+        }
+        return chain(extract_cv_text.s(job), parse_cv.s(), match_cv.s(), persist_cv_result.s())
+
+    from celery_tasks.pipeline import process_cv_pipeline
+    return process_cv_pipeline.s(cv_file_path, email, position, username, batch_id=batch_id, upload_id=upload_id)
+
+
+def cv_batch_signatures(
+    cv_file_paths: List[str],
+    email: Optional[str],
+    position: str,
+    username: str,
+    batch_id: str,
+    upload_ids: Optional[List[str]] = None,
+) -> list:
+    """
+    Celery signatures processing the CVs of a bulk upload: in "async" mode one
+    process_cv_pipeline_batch task per ASYNC_PIPELINE_BATCH_SIZE CVs, otherwise
+    one cv_pipeline_signature per CV. `upload_ids` are the owners of the CVs'
+    upload locks when the API already claimed them.
+    """
+    upload_ids = upload_ids or [None] * len(cv_file_paths)
+    if CV_PIPELINE_MODE != "async":
+        return [
+            cv_pipeline_signature(path, email, position, username, batch_id=batch_id, upload_id=upload_id)
+            for path, upload_id in zip(cv_file_paths, upload_ids)
+        ]
+
+    from celery_tasks.pipeline import process_cv_pipeline_batch
+    items = [
+        {
+            "cv_file_path": path, "email": email, "position": position, "username": username,
+            "batch_id": batch_id, "upload_id": upload_id,
+        }
+        for path, upload_id in zip(cv_file_paths, upload_ids)
+    ]
+    size = max(1, ASYNC_PIPELINE_BATCH_SIZE)
+    return [process_cv_pipeline_batch.s(items[i:i + size]) for i in range(0, len(items), size)]
@@ -1,20 +1,39 @@
 from celery import Celery
+from celery.signals import worker_process_shutdown
+from kombu import Queue
 from config.constants import (
     CELERY_BROKER_URL,
     CELERY_RESULT_BACKEND,
     CELERY_TASK_TIME_LIMIT,
     CELERY_TASK_SOFT_TIME_LIMIT,
     CELERY_TIMEZONE,
+    CELERY_WORKER_STAGE,
+    CV_EXTRACT_QUEUE,
+    CV_PARSE_QUEUE,
+    CV_MATCH_QUEUE,
+    CV_PERSIST_QUEUE,
+    CV_EXTRACT_CONCURRENCY,
+    CV_PARSE_CONCURRENCY,
+    CV_MATCH_CONCURRENCY,
+    CV_PERSIST_CONCURRENCY,
 )
 from config.log_config import AppLogger
 
 logger = AppLogger("celery_worker")
 
+# Stage name -> (queue, worker concurrency) for the chained CV pipeline
+CV_STAGE_QUEUES = {
+    "extract": (CV_EXTRACT_QUEUE, CV_EXTRACT_CONCURRENCY),
+    "parse": (CV_PARSE_QUEUE, CV_PARSE_CONCURRENCY),
+    "match": (CV_MATCH_QUEUE, CV_MATCH_CONCURRENCY),
+    "persist": (CV_PERSIST_QUEUE, CV_PERSIST_CONCURRENCY),
+}
+
 celery = Celery(
     "recruitment_tasks",
     broker=CELERY_BROKER_URL,
     backend=CELERY_RESULT_BACKEND,
-    include=["celery_tasks.pipeline"]
+    include=["celery_tasks.pipeline", "celery_tasks.stages"]
 )
 
 celery.conf.update(
@@ -24,7 +43,37 @@ celery.conf.update(
     timezone=CELERY_TIMEZONE,
     task_track_started=True,
     task_time_limit=CELERY_TASK_TIME_LIMIT,
-    task_soft_time_limit=CELERY_TASK_SOFT_TIME_LIMIT
+    task_soft_time_limit=CELERY_TASK_SOFT_TIME_LIMIT,
+    # Declaring every queue lets a worker started without -Q consume all of them
+    task_queues=[Queue(celery.conf.task_default_queue)] + [Queue(queue) for queue, _ in CV_STAGE_QUEUES.values()],
+    task_routes={
+        "celery_tasks.stages.extract_cv_text": {"queue": CV_EXTRACT_QUEUE},
+        "celery_tasks.stages.parse_cv": {"queue": CV_PARSE_QUEUE},
+        "celery_tasks.stages.match_cv": {"queue": CV_MATCH_QUEUE},
+        "celery_tasks.stages.persist_cv_result": {"queue": CV_PERSIST_QUEUE},
+    },
 )
 
-logger.info("[✓] Celery worker initialized.")
\ No newline at end of file
+if CELERY_WORKER_STAGE:
+    if CELERY_WORKER_STAGE not in CV_STAGE_QUEUES:
+        raise ValueError(f"Unknown CELERY_WORKER_STAGE '{CELERY_WORKER_STAGE}', expected one of {list(CV_STAGE_QUEUES)}")
+    stage_queue, stage_concurrency = CV_STAGE_QUEUES[CELERY_WORKER_STAGE]
+    celery.conf.worker_concurrency = stage_concurrency
+    celery.select_queues([stage_queue])
+    logger.info(f"[✓] Worker dedicated to stage '{CELERY_WORKER_STAGE}' (queue={stage_queue}, concurrency={stage_concurrency})")
+
+
+@worker_process_shutdown.connect
+def stop_office_converters(**kwargs):
+    # Prefork children leave through os._exit, which skips atexit handlers
+    from utils.office_converter import close_office_converter_pool
+    close_office_converter_pool()
+
+
+@worker_process_shutdown.connect
+def stop_pdf_pool(**kwargs):
+    from utils.utils import close_pdf_pool
+    close_pdf_pool()
+
+
+logger.info("[✓] Celery worker initialized.")
@@ -11,6 +11,22 @@ SERVICE_NAME = os.getenv("SERVICE_NAME", "recruitment_agent-service")
 SERVICE_PORT = int(os.getenv("SERVICE_PORT", 8003))
 API_PREFIX = "/api/v1/recruitment"
 MATCHING_SCORE_PERCENTAGE = 70
+# Matching Settings - JDs are scored concurrently when MATCHING_CONCURRENCY > 1
+MATCHING_CONCURRENCY = int(os.getenv("MATCHING_CONCURRENCY", 4))
+# Wall-clock budget of one JD (or batch) scoring call, retries included; each attempt
+# times out after MATCHING_ATTEMPT_TIMEOUT (clipped to what is left) so a retry still fits
+MATCHING_JD_TIMEOUT = float(os.getenv("MATCHING_JD_TIMEOUT", 60))
+MATCHING_ATTEMPT_TIMEOUT = float(os.getenv("MATCHING_ATTEMPT_TIMEOUT", 40))
+# "per_jd": one LLM call per JD, "batched": one LLM call scores up to MATCHING_BATCH_SIZE JDs
+MATCHING_SCORING_MODE = os.getenv("MATCHING_SCORING_MODE", "per_jd").lower()
+MATCHING_BATCH_SIZE = int(os.getenv("MATCHING_BATCH_SIZE", 10))
+# JD Prefilter - lexical skill-overlap ranking before LLM matching. Off by default: every
+# fetched JD is scored by the LLM. When enabled, only the JD_PREFILTER_TOP_K best skill
+# overlaps (and none below JD_PREFILTER_MIN_SCORE) reach MatchingAgent, so a CV whose
+# skills are worded differently from a JD can miss it.
+JD_PREFILTER_ENABLED = os.getenv("JD_PREFILTER_ENABLED", "false").lower() == "true"
+JD_PREFILTER_TOP_K = int(os.getenv("JD_PREFILTER_TOP_K", 20))
+JD_PREFILTER_MIN_SCORE = float(os.getenv("JD_PREFILTER_MIN_SCORE", 0.0))
 # TLS Configuration
 TLS_ENABLED = os.getenv("TLS_ENABLED", "false").lower() == "true"
 CA_PATH = os.getenv("CA_PATH", "")
@@ -28,6 +44,76 @@ OTEL_ENDPOINT = os.getenv("OTEL_ENDPOINT", "otel-collector:4317") # gRPC endpoin
 BASE_DIR = Path(__file__).resolve().parent.parent
 UPLOAD_DIR = f"{BASE_DIR}/cv_uploads"
 JD_PREVIEW_DIR = "/tmp/jd_previews"
+CV_PREVIEW_DIR = "/tmp/cv_previews"
+# CV Upload Limits
+CV_ALLOWED_EXTENSIONS = {".pdf", ".doc", ".docx", ".odt", ".rtf", ".txt"}
+CV_UPLOAD_MAX_BYTES = int(os.getenv("CV_UPLOAD_MAX_BYTES", 10 * 1024 * 1024))
+UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", 1024 * 1024))
+# Identical uploads (file hash + position + username) attach to the in-flight one while its lock lives
+CV_UPLOAD_LOCK_TTL = int(os.getenv("CV_UPLOAD_LOCK_TTL", 30 * 60))
+# List Endpoints - keyset pagination, the next page's cursor is returned in the X-Next-Cursor header
+LIST_PAGE_SIZE = int(os.getenv("LIST_PAGE_SIZE", 100))
+LIST_PAGE_SIZE_MAX = int(os.getenv("LIST_PAGE_SIZE_MAX", 500))
+# CV Search - MySQL n-gram FULLTEXT indexes on candidate name and position, built offline on an
+# existing table with `python -m config.migrations`; searches use ILIKE until they exist.
+# SEARCH_NGRAM_TOKEN_SIZE must match the server's ngram_token_size, shorter words are not looked up
+SEARCH_FULLTEXT_ENABLED = os.getenv("SEARCH_FULLTEXT_ENABLED", "true").lower() == "true"
+SEARCH_NGRAM_TOKEN_SIZE = int(os.getenv("SEARCH_NGRAM_TOKEN_SIZE", 2))
+# Schema Migrations - rows per transaction when backfilling a new column on startup
+MIGRATION_BATCH_SIZE = int(os.getenv("MIGRATION_BATCH_SIZE", 1000))
+# JD Import - JDs per signature lookup, bulk INSERT and commit
+JD_IMPORT_BATCH_SIZE = int(os.getenv("JD_IMPORT_BATCH_SIZE", 1000))
+# Office Converter - "pool" keeps long-lived unoserver/LibreOffice workers, "cli" spawns libreoffice per file
+OFFICE_CONVERTER_MODE = os.getenv("OFFICE_CONVERTER_MODE", "pool").lower()
+OFFICE_BINARY = os.getenv("OFFICE_BINARY", "libreoffice")
+UNOSERVER_PYTHON = os.getenv("UNOSERVER_PYTHON", "/usr/bin/python3")
+# Pools are per process (each Celery child runs one task at a time), so one worker is the default
+OFFICE_POOL_SIZE = int(os.getenv("OFFICE_POOL_SIZE", 1))
+OFFICE_POOL_MAX_QUEUE = int(os.getenv("OFFICE_POOL_MAX_QUEUE", 16))
+OFFICE_ACQUIRE_TIMEOUT = float(os.getenv("OFFICE_ACQUIRE_TIMEOUT", 60))
+OFFICE_CONVERSION_TIMEOUT = float(os.getenv("OFFICE_CONVERSION_TIMEOUT", 120))
+OFFICE_STARTUP_TIMEOUT = float(os.getenv("OFFICE_STARTUP_TIMEOUT", 30))
+OFFICE_WORKER_RECYCLE_AFTER = int(os.getenv("OFFICE_WORKER_RECYCLE_AFTER", 200))
+OFFICE_PROFILE_ROOT = os.getenv("OFFICE_PROFILE_ROOT", "/tmp/lo_profiles")
+# Bulk CV Upload - one Celery task per CV, progress counters kept in Redis
+BULK_UPLOAD_MAX_FILES = int(os.getenv("BULK_UPLOAD_MAX_FILES", 500))
+CV_BATCH_TTL = int(os.getenv("CV_BATCH_TTL", 7 * 24 * 3600))
+# CV Progress Events - per-stage events pushed over Redis pub/sub to GET /cvs/progress/{task_id};
+# the last CV_PROGRESS_HISTORY events of a task or batch are kept so late subscribers can catch up
+CV_PROGRESS_ENABLED = os.getenv("CV_PROGRESS_ENABLED", "true").lower() == "true"
+CV_PROGRESS_TTL = int(os.getenv("CV_PROGRESS_TTL", 24 * 3600))
+CV_PROGRESS_HISTORY = int(os.getenv("CV_PROGRESS_HISTORY", 200))
+CV_PROGRESS_KEEPALIVE = float(os.getenv("CV_PROGRESS_KEEPALIVE", 15))
+CV_PROGRESS_STREAM_TIMEOUT = float(os.getenv("CV_PROGRESS_STREAM_TIMEOUT", 30 * 60))
+# EventSource cannot send an Authorization header: a stream is opened with a token for that one
+# task or batch, valid CV_PROGRESS_TOKEN_TTL seconds and checked only when (re)connecting
+CV_PROGRESS_TOKEN_TTL = int(os.getenv("CV_PROGRESS_TOKEN_TTL", 300))
+# PDF Text Extraction - with PDF_EXTRACT_WORKERS > 1, documents with at least PDF_PARALLEL_MIN_PAGES
+# pages are split into page ranges across a process pool; PDF_MAX_PAGES caps the pages read (0 = all
+# pages). A pool worker busy with one range for more than PDF_EXTRACT_TIMEOUT seconds is replaced, and
+# the document read serially. Every API process and Celery prefork child owns its pool, so a host runs
+# up to processes x PDF_EXTRACT_WORKERS extra interpreters: the default of 1 reads serially, raise it
+# only where few processes extract, e.g. a CELERY_WORKER_STAGE=extract worker with low concurrency
+PDF_MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", 0))
+PDF_PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", 24))
+PDF_EXTRACT_WORKERS = int(os.getenv("PDF_EXTRACT_WORKERS", 1))
+PDF_EXTRACT_TIMEOUT = float(os.getenv("PDF_EXTRACT_TIMEOUT", 60))
+# Extracted CV Text Cache - keyed on file SHA-256, shared by every extract_text caller
+CV_TEXT_CACHE_ENABLED = os.getenv("CV_TEXT_CACHE_ENABLED", "true").lower() == "true"
+CV_TEXT_CACHE_TTL = int(os.getenv("CV_TEXT_CACHE_TTL", 7 * 24 * 3600))
+CV_TEXT_CACHE_MAX_ENTRIES = int(os.getenv("CV_TEXT_CACHE_MAX_ENTRIES", 10000))
+# OCR Fallback - PDFs with fewer than OCR_MIN_CHARS_PER_PAGE extracted characters per page are
+# rendered and read with Tesseract; OCR_WORKERS bounds concurrent tesseract processes per process
+OCR_ENABLED = os.getenv("OCR_ENABLED", "true").lower() == "true"
+OCR_TESSERACT_BINARY = os.getenv("OCR_TESSERACT_BINARY", "tesseract")
+OCR_LANG = os.getenv("OCR_LANG", "eng")
+OCR_DPI = int(os.getenv("OCR_DPI", 300))
+OCR_MIN_CHARS_PER_PAGE = int(os.getenv("OCR_MIN_CHARS_PER_PAGE", 50))
+OCR_MAX_PAGES = int(os.getenv("OCR_MAX_PAGES", 10))
+OCR_WORKERS = int(os.getenv("OCR_WORKERS", min(2, os.cpu_count() or 1)))
+OCR_PAGE_TIMEOUT = float(os.getenv("OCR_PAGE_TIMEOUT", 60))
+OCR_CACHE_TTL = int(os.getenv("OCR_CACHE_TTL", 30 * 24 * 3600))
+OCR_CACHE_MAX_ENTRIES = int(os.getenv("OCR_CACHE_MAX_ENTRIES", 10000))
 
 # DB Setting - MySQL
 DB_HOST = os.getenv("DB_HOST", "localhost")
@@ -42,14 +128,65 @@ SMTP_USERNAME = os.getenv("SMTP_USERNAME", "your_email@gmail.com")
 SMTP_PASSWORD = os.getenv("SMTP_PASSWORD", "your_app_password")
 DEFAULT_CANDIDATE_EMAIL = os.getenv("DEFAULT_CANDIDATE_EMAIL", "")
 DEFAULT_MODEL = os.getenv("OPENAI_DEFAULT_MODEL", "gpt-4o-mini")
+# GenAI Client - pooled keep-alive connections, retries and circuit breaker
+GENAI_POOL_MAXSIZE = int(os.getenv("GENAI_POOL_MAXSIZE", 16))
+GENAI_CONNECT_TIMEOUT = float(os.getenv("GENAI_CONNECT_TIMEOUT", 5))
+GENAI_READ_TIMEOUT = float(os.getenv("GENAI_READ_TIMEOUT", 120))
+GENAI_MAX_RETRIES = int(os.getenv("GENAI_MAX_RETRIES", 2))
+GENAI_BACKOFF_BASE = float(os.getenv("GENAI_BACKOFF_BASE", 0.5))
+GENAI_BACKOFF_MAX = float(os.getenv("GENAI_BACKOFF_MAX", 8))
+GENAI_BREAKER_FAILURE_THRESHOLD = int(os.getenv("GENAI_BREAKER_FAILURE_THRESHOLD", 5))
+GENAI_BREAKER_RESET_TIMEOUT = float(os.getenv("GENAI_BREAKER_RESET_TIMEOUT", 30))
+
+# Redis Settings - Celery uses DB 0, application caches use REDIS_CACHE_URL
+REDIS_HOST = os.getenv("REDIS_HOST", "redis")
+REDIS_PORT = os.getenv("REDIS_PORT", "6379")
+REDIS_CACHE_URL = os.getenv("REDIS_CACHE_URL", f"redis://{REDIS_HOST}:{REDIS_PORT}/1")
+# Graph Checkpoints - latest RecruitmentState of each matching run is kept in Redis so a retried
+# pipeline resumes after the last completed node; removed once the run is stored or gives up
+GRAPH_CHECKPOINT_ENABLED = os.getenv("GRAPH_CHECKPOINT_ENABLED", "true").lower() == "true"
+GRAPH_CHECKPOINT_TTL = int(os.getenv("GRAPH_CHECKPOINT_TTL", 6 * 3600))
+GRAPH_CHECKPOINT_MAX_BYTES = int(os.getenv("GRAPH_CHECKPOINT_MAX_BYTES", 2 * 1024 * 1024))
+# CV Parser - "two_pass": main parse + languages pass run concurrently,
+# "single_pass": languages come from the main parse, second call only when unusable
+CV_PARSER_MODE = os.getenv("CV_PARSER_MODE", "two_pass").lower()
+# Parsed CV Cache - keyed on PDF SHA-256 + model + prompt version
+PARSED_CV_CACHE_ENABLED = os.getenv("PARSED_CV_CACHE_ENABLED", "true").lower() == "true"
+PARSED_CV_CACHE_TTL = int(os.getenv("PARSED_CV_CACHE_TTL", 7 * 24 * 3600))
+PARSED_CV_CACHE_MAX_ENTRIES = int(os.getenv("PARSED_CV_CACHE_MAX_ENTRIES", 10000))
 
 # Celery Settings
-CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", f"redis://{os.getenv('REDIS_HOST', 'redis')}:{os.getenv('REDIS_PORT', '6379')}/0")
+CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", f"redis://{REDIS_HOST}:{REDIS_PORT}/0")
 CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND", CELERY_BROKER_URL)
 CELERY_TASK_TIME_LIMIT = int(os.getenv("CELERY_TASK_TIME_LIMIT", 600))
 CELERY_TASK_SOFT_TIME_LIMIT = int(os.getenv("CELERY_TASK_SOFT_TIME_LIMIT", 500))
 CELERY_TASK_DEFAULT_QUEUE = os.getenv("CELERY_TASK_DEFAULT_QUEUE", "default")
 CELERY_TIMEZONE = os.getenv("CELERY_TIMEZONE", "Asia/Ho_Chi_Minh")
+# Number of CV graphs process_cv_pipeline_batch runs at once on one event loop
+ASYNC_PIPELINE_CONCURRENCY = int(os.getenv("ASYNC_PIPELINE_CONCURRENCY", 8))
+# Number of bulk-uploaded CVs sent to one process_cv_pipeline_batch task in "async" mode
+ASYNC_PIPELINE_BATCH_SIZE = int(os.getenv("ASYNC_PIPELINE_BATCH_SIZE", 32))
+# CV Pipeline Stages - "single": the whole matching graph runs in one process_cv_pipeline task,
+# "async": as "single", but bulk uploads are drained by process_cv_pipeline_batch tasks on one event
+# loop, "chain": extract -> parse -> match -> persist run as separate tasks on their own queues; only
+# enable it once workers consume those queues (see CELERY_WORKER_STAGE)
+CV_PIPELINE_MODE = os.getenv("CV_PIPELINE_MODE", "single").lower()
+CV_EXTRACT_QUEUE = os.getenv("CV_EXTRACT_QUEUE", "cv_extract")
+CV_PARSE_QUEUE = os.getenv("CV_PARSE_QUEUE", "cv_parse")
+CV_MATCH_QUEUE = os.getenv("CV_MATCH_QUEUE", "cv_match")
+CV_PERSIST_QUEUE = os.getenv("CV_PERSIST_QUEUE", "cv_persist")
+# Hard time limit per stage task; the soft limit fires 10% earlier
+CV_EXTRACT_TIME_LIMIT = int(os.getenv("CV_EXTRACT_TIME_LIMIT", 300))
+CV_PARSE_TIME_LIMIT = int(os.getenv("CV_PARSE_TIME_LIMIT", 300))
+CV_MATCH_TIME_LIMIT = int(os.getenv("CV_MATCH_TIME_LIMIT", 600))
+CV_PERSIST_TIME_LIMIT = int(os.getenv("CV_PERSIST_TIME_LIMIT", 60))
+# A worker started with CELERY_WORKER_STAGE=<extract|parse|match|persist> consumes only that
+# stage's queue with the stage's concurrency; without it a worker consumes every queue
+CELERY_WORKER_STAGE = os.getenv("CELERY_WORKER_STAGE", "").lower()
+CV_EXTRACT_CONCURRENCY = int(os.getenv("CV_EXTRACT_CONCURRENCY", os.cpu_count() or 1))
+CV_PARSE_CONCURRENCY = int(os.getenv("CV_PARSE_CONCURRENCY", 8))
+CV_MATCH_CONCURRENCY = int(os.getenv("CV_MATCH_CONCURRENCY", 8))
+CV_PERSIST_CONCURRENCY = int(os.getenv("CV_PERSIST_CONCURRENCY", 2))
 
 class FinalDecisionStatus(str, Enum):
     PENDING = "Pending"
@@ -93,6 +93,9 @@ class AppLogger:
     def exception(self, msg: str, *args, **kwargs):
         self.logger.exception(msg, *args, **kwargs)
 
+    def isEnabledFor(self, level: int) -> bool:
+        return self.logger.isEnabledFor(level)
+
 logger = AppLogger(__name__)
 
 def is_otel_collector_up(host: str, port: int, timeout: float = 2.0) -> bool:
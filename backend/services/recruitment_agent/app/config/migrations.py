@@ -0,0 +1,205 @@
+from typing import Callable, Dict, List
+
+from sqlalchemy import bindparam, func, inspect, select, update
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.schema import CreateColumn, CreateIndex, Index
+
+from config.constants import MIGRATION_BATCH_SIZE
+from config.database import DeclarativeBase
+from config.log_config import AppLogger
+
+logger = AppLogger(__name__)
+
+
+def _prepare_session(conn: Connection) -> None:
+    if conn.dialect.name == "mysql":
+        # With stopwords on, the ngram parser drops every token containing one
+        # ("an", "in", "on", ...), so names like "Tran" could not be found.
+        conn.exec_driver_sql("SET SESSION innodb_ft_enable_stopword = OFF")
+
+
+def _add_missing_columns(conn: Connection) -> None:
+    """
+    Add columns declared on a model but missing from its existing table. New
+    columns must be nullable (or generated): MySQL then adds them in place
+    without copying the table.
+    """
+    inspector = inspect(conn)
+    for table in DeclarativeBase.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            logger.info(f"[migrations] Adding column {table.name}.{column.name}")
+            spec = CreateColumn(column).compile(dialect=conn.dialect)
+            conn.exec_driver_sql(f"ALTER TABLE {table.name} ADD COLUMN {spec}")
+            conn.commit()
+
+
+def backfill_cv_fingerprints(conn: Connection) -> None:
+    """
+    Fill cv_applications.fingerprint in primary-key batches, one short
+    transaction each. Where existing active applications share a fingerprint
+    only the oldest keeps it, so the unique index can be built.
+    """
+    from models.cv_application import ACTIVE_CV_STATUSES, CVApplication, cv_fingerprint
+
+    table = CVApplication.__table__
+    last_id, filled = 0, 0
+    while True:
+        rows = conn.execute(
+            select(table.c.id, table.c.candidate_name, table.c.email, table.c.matched_position)
+            .where(table.c.id > last_id, table.c.fingerprint.is_(None))
+            .order_by(table.c.id)
+            .limit(MIGRATION_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        conn.execute(
+            update(table).where(table.c.id == bindparam("row_id")).values(fingerprint=bindparam("row_fingerprint")),
+            [
+                {"row_id": row.id, "row_fingerprint": cv_fingerprint(row.candidate_name, row.email, row.matched_position)}
+                for row in rows
+            ],
+        )
+        conn.commit()
+        last_id, filled = rows[-1].id, filled + len(rows)
+    logger.info(f"[migrations] Backfilled {filled} CV fingerprint(s)")
+
+    active = table.c.status.in_(ACTIVE_CV_STATUSES)
+    duplicates = conn.execute(
+        select(table.c.fingerprint, func.min(table.c.id))
+        .where(active, table.c.fingerprint.is_not(None))
+        .group_by(table.c.fingerprint)
+        .having(func.count() > 1)
+    ).all()
+    for fingerprint, kept_id in duplicates:
+        conn.execute(
+            update(table)
+            .where(active, table.c.fingerprint == fingerprint, table.c.id != kept_id)
+            .values(fingerprint=None)
+        )
+    conn.commit()
+    if duplicates:
+        logger.warn(f"[migrations] {len(duplicates)} duplicated active CV(s): only the oldest application keeps its fingerprint")
+
+
+def backfill_jd_signatures(conn: Connection) -> None:
+    """Fill job_descriptions.content_signature in primary-key batches, one short transaction each."""
+    from models.job_description import JobDescription, jd_signature
+
+    table = JobDescription.__table__
+    last_id, filled = 0, 0
+    while True:
+        rows = conn.execute(
+            select(table.c.id, table.c.position, table.c.skills_required, table.c.experience_required, table.c.level)
+            .where(table.c.id > last_id, table.c.content_signature.is_(None))
+            .order_by(table.c.id)
+            .limit(MIGRATION_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        conn.execute(
+            update(table).where(table.c.id == bindparam("row_id")).values(content_signature=bindparam("row_signature")),
+            [
+                {
+                    "row_id": row.id,
+                    "row_signature": jd_signature(row.position, row.skills_required, row.experience_required, row.level),
+                }
+                for row in rows
+            ],
+        )
+        conn.commit()
+        last_id, filled = rows[-1].id, filled + len(rows)
+    logger.info(f"[migrations] Backfilled {filled} JD content signature(s)")
+
+
+# Data to prepare before an index can be built; runs once, while the index is missing
+BEFORE_INDEX: Dict[str, Callable[[Connection], None]] = {
+    "uq_cv_active_fingerprint": backfill_cv_fingerprints,
+    "ix_job_descriptions_content_signature": backfill_jd_signatures,
+}
+
+
+def _is_fulltext(index: Index) -> bool:
+    return index.dialect_options["mysql"]["prefix"] == "FULLTEXT"
+
+
+def _create_index(conn: Connection, index: Index) -> None:
+    ddl = str(CreateIndex(index).compile(dialect=conn.dialect))
+    if conn.dialect.name == "mysql":
+        # Built online. Reads and writes continue, except that a FULLTEXT build blocks writes;
+        # MySQL refuses the statement rather than locking the table if it cannot comply.
+        ddl += f" ALGORITHM=INPLACE LOCK={'SHARED' if _is_fulltext(index) else 'NONE'}"
+    conn.exec_driver_sql(ddl)
+
+
+def _missing_indexes(conn: Connection):
+    """(table, index) of every declared index missing from an existing table."""
+    inspector = inspect(conn)
+    for table in DeclarativeBase.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                yield table, index
+
+
+def missing_fulltext_indexes(conn: Connection) -> List[str]:
+    return [index.name for _, index in _missing_indexes(conn) if _is_fulltext(index)]
+
+
+def _create_missing_indexes(conn: Connection, fulltext: bool = False) -> None:
+    """
+    create_all only builds tables that do not exist yet; indexes declared
+    later on an existing table are created here. FULLTEXT indexes block
+    writes to their table while they build, so they are only created with
+    `fulltext` (the offline step, see __main__ below).
+    """
+    for table, index in list(_missing_indexes(conn)):
+        if _is_fulltext(index) and not fulltext:
+            logger.warn(
+                f"[migrations] FULLTEXT index {index.name} on {table.name} is missing; build it offline with "
+                f"`python -m config.migrations`. Searches use ILIKE until then"
+            )
+            continue
+        logger.info(f"[migrations] Creating index {index.name} on {table.name}")
+        try:
+            if index.name in BEFORE_INDEX:
+                BEFORE_INDEX[index.name](conn)
+            _create_index(conn, index)
+            conn.commit()
+        except DBAPIError as e:
+            # Another replica starting at the same time may have created it
+            conn.rollback()
+            logger.warn(f"[migrations] Could not create index {index.name}: {e}")
+
+
+def apply_migrations(engine: Engine, fulltext: bool = False) -> None:
+    """
+    Create missing tables, columns and indexes of every model. Safe to run on
+    every start; FULLTEXT indexes on existing tables are only built with
+    `fulltext`, which the application never passes.
+    """
+    with engine.connect() as conn:
+        _prepare_session(conn)
+        DeclarativeBase.metadata.create_all(bind=conn)
+        conn.commit()
+        _add_missing_columns(conn)
+        _create_missing_indexes(conn, fulltext=fulltext)
+
+
+if __name__ == "__main__":
+    # Offline step, run from app/ during a maintenance window: python -m config.migrations
+    # Writes to cv_applications block until its FULLTEXT indexes are built.
+    import models.cv_application  # noqa: F401  registers the models on DeclarativeBase
+    import models.interview_question  # noqa: F401
+    import models.interview_schedule  # noqa: F401
+    import models.job_description  # noqa: F401
+    from config.database import engine
+
+    apply_migrations(engine, fulltext=True)
@@ -0,0 +1,30 @@
+import redis
+import redis.asyncio
+from config.constants import REDIS_CACHE_URL
+
+_client = None
+
+
+def get_redis_client() -> redis.Redis:
+    """
+    Return the process-wide Redis client used for application caches.
+    The connection pool is created lazily and re-created by redis-py after fork.
+    """
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(REDIS_CACHE_URL, socket_timeout=5, socket_connect_timeout=2)
+    return _client
+
+
+_async_client = None
+
+
+def get_async_redis_client() -> redis.asyncio.Redis:
+    """
+    Return the API's asyncio Redis client for the same database, used where
+    waiting on Redis must not hold the event loop (pub/sub subscriptions).
+    """
+    global _async_client
+    if _async_client is None:
+        _async_client = redis.asyncio.Redis.from_url(REDIS_CACHE_URL, socket_connect_timeout=2)
+    return _async_client
@@ -1,8 +1,10 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from routers import router
 from fastapi.middleware.cors import CORSMiddleware
 from config.constants import API_PREFIX
-from config.database import DeclarativeBase, engine
+from config.database import engine
+from config.migrations import apply_migrations
 from config.service_registration import ServiceRegistration
 from config.log_config import LoggingConfig, AppLogger, enable_otlp_logging
 from config.constants import *
@@ -16,6 +18,8 @@ import models.interview_question
 from fastapi.staticfiles import StaticFiles
 # === OpenTelemetry setup ===
 from metrics.otel_setup import setup_otel
+from metrics.queue_depth import update_queue_depths
+from utils.pagination import NEXT_CURSOR_HEADER
 from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
 from starlette.responses import Response
 
@@ -23,19 +27,22 @@ logger = AppLogger(__name__)
 
 LoggingConfig.setup_logging(json_format=True)
 enable_otlp_logging(service_name=SERVICE_NAME, otlp_endpoint=OTEL_ENDPOINT)
-# Create tables automatically
-DeclarativeBase.metadata.create_all(bind=engine)
+# Create tables and indexes automatically; FULLTEXT indexes missing from existing
+# tables block writes while they build, so they are left to `python -m config.migrations`
+apply_migrations(engine)
 
 app = FastAPI(
     title="Recruitment ATS",
     version="1.0.0",
     docs_url=f"{API_PREFIX}/docs",
     redoc_url=f"{API_PREFIX}/redoc",
-    openapi_url=f"{API_PREFIX}/openapi.json"
+    openapi_url=f"{API_PREFIX}/openapi.json",
+    default_response_class=ORJSONResponse,
 )
 
 @app.get("/metrics")
 def metrics():
+    update_queue_depths()
     return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
 
 # Mount static folder
@@ -52,6 +59,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Browsers only let the web app read listed response headers
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 # Mount router
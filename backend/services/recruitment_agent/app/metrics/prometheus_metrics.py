@@ -1,15 +1,25 @@
-from prometheus_client import Counter
+from prometheus_client import Counter, Gauge, Histogram
 
 # === COUNTERS ===
 
 # CV Counters
 cv_upload_total = Counter("cv_upload_total", "Total number of CVs uploaded")
+cv_batch_upload_total = Counter("cv_batch_upload_total", "Total number of bulk CV upload batches")
+cv_upload_duplicates_total = Counter("cv_upload_duplicates_total", "Total number of CV uploads attached to an identical in-flight upload")
 cv_approved_total = Counter("cv_approved_total", "Total number of CVs approved")
 cv_deleted_total = Counter("cv_deleted_total", "Total number of CVs deleted")
+parsed_cv_cache_hits_total = Counter("parsed_cv_cache_hits_total", "Total number of parsed CV cache hits")
+parsed_cv_cache_misses_total = Counter("parsed_cv_cache_misses_total", "Total number of parsed CV cache misses")
+cv_text_cache_hits_total = Counter("cv_text_cache_hits_total", "Total number of extracted CV text cache hits")
+cv_text_cache_misses_total = Counter("cv_text_cache_misses_total", "Total number of extracted CV text cache misses")
+cv_ocr_fallback_total = Counter("cv_ocr_fallback_total", "Total number of CVs sent to the OCR fallback")
+ocr_page_failures_total = Counter("ocr_page_failures_total", "Total number of pages Tesseract failed to read", ["reason"])
 
 # JD Counters
 jd_upload_total = Counter("jd_upload_total", "Total number of Job Descriptions uploaded")
 jd_deleted_total = Counter("jd_deleted_total", "Total number of JDs deleted")
+jd_prefilter_kept_total = Counter("jd_prefilter_kept_total", "Total number of JDs kept by the lexical prefilter for LLM matching")
+jd_prefilter_dropped_total = Counter("jd_prefilter_dropped_total", "Total number of JDs dropped by the lexical prefilter")
 
 # Interview Counters
 interview_scheduled_total = Counter("interview_scheduled_total", "Total number of interviews scheduled")
@@ -19,6 +29,59 @@ interview_deleted_total = Counter("interview_deleted_total", "Total number of in
 interview_questions_generated_total = Counter("interview_questions_generated_total", "Total sets of interview questions generated")
 interview_questions_regenerated_total = Counter("interview_questions_regenerated_total", "Total sets of interview questions regenerated")
 
+# GenAI Client Counters
+genai_request_retries_total = Counter("genai_request_retries_total", "Total number of retried GenAI requests")
+genai_circuit_rejections_total = Counter("genai_circuit_rejections_total", "Total number of GenAI requests rejected by the open circuit breaker")
+
+# Graph Checkpoint Counters
+graph_checkpoints_skipped_total = Counter("graph_checkpoints_skipped_total", "Total number of graph checkpoints not stored because they exceeded the size limit")
+graph_runs_resumed_total = Counter("graph_runs_resumed_total", "Total number of matching graph runs resumed from a checkpoint")
+
+# JD Preview Counters
+jd_preview_renders_total = Counter("jd_preview_renders_total", "Total number of JD preview PDFs rendered")
+jd_preview_cache_hits_total = Counter("jd_preview_cache_hits_total", "Total number of JD previews served from the on-disk cache")
+
+# Office Converter Counters
+office_worker_restarts_total = Counter("office_worker_restarts_total", "Total number of office converter worker restarts", ["reason"])
+office_converter_rejections_total = Counter("office_converter_rejections_total", "Total number of conversions rejected because the converter queue was full")
+
 # Auth / JWT Counters
 jwt_verification_total = Counter("jwt_verification_total", "Total number of JWT verifications")
-jwt_verification_failed_total = Counter("jwt_verification_failed_total", "Total number of failed JWT verifications")
\ No newline at end of file
+jwt_verification_failed_total = Counter("jwt_verification_failed_total", "Total number of failed JWT verifications")
+
+# === GAUGES ===
+
+genai_circuit_state = Gauge("genai_circuit_state", "GenAI circuit breaker state (0=closed, 1=half_open, 2=open)")
+genai_pool_maxsize = Gauge("genai_pool_maxsize", "Maximum number of pooled keep-alive connections to gen_ai_provider")
+genai_http_clients = Gauge("genai_http_clients", "Number of live GenAI HTTP clients: the session of this process and one async client per event loop")
+genai_requests_in_flight = Gauge("genai_requests_in_flight", "Number of GenAI requests currently in flight")
+celery_queue_depth = Gauge("celery_queue_depth", "Number of tasks waiting in each Celery queue", ["queue"])
+cv_progress_streams = Gauge("cv_progress_streams", "Number of open CV progress event streams")
+
+# === HISTOGRAMS ===
+
+jd_prefilter_score = Histogram(
+    "jd_prefilter_score",
+    "Weighted Jaccard skill-overlap score computed by the JD prefilter",
+    buckets=(0.0, 0.05, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0),
+)
+
+office_conversion_duration_seconds = Histogram(
+    "office_conversion_duration_seconds",
+    "Time spent converting documents to PDF with LibreOffice",
+    ["mode"],
+    buckets=(0.1, 0.25, 0.5, 1, 2, 5, 10, 30, 60, 120),
+)
+
+pdf_extraction_duration_seconds = Histogram(
+    "pdf_extraction_duration_seconds",
+    "Time spent extracting text from PDF files",
+    ["mode"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30),
+)
+
+ocr_duration_seconds = Histogram(
+    "ocr_duration_seconds",
+    "Time spent running OCR on one document",
+    buckets=(0.5, 1, 2, 5, 10, 20, 30, 60, 120, 300),
+)
@@ -0,0 +1,33 @@
+import redis
+
+from config.constants import CELERY_BROKER_URL
+from config.log_config import AppLogger
+from metrics.prometheus_metrics import celery_queue_depth
+
+logger = AppLogger(__name__)
+
+_broker_client = None
+
+
+def _get_broker_client() -> redis.Redis:
+    global _broker_client
+    if _broker_client is None:
+        _broker_client = redis.Redis.from_url(CELERY_BROKER_URL, socket_timeout=2, socket_connect_timeout=2)
+    return _broker_client
+
+
+def update_queue_depths() -> None:
+    """Refresh celery_queue_depth from the Redis broker (each queue is a list named after it)."""
+    from celery_worker import celery
+
+    queues = [queue.name for queue in celery.conf.task_queues]
+    try:
+        pipe = _get_broker_client().pipeline()
+        for name in queues:
+            pipe.llen(name)
+        depths = pipe.execute()
+    except redis.RedisError as e:
+        logger.warn(f"[metrics] Could not read Celery queue depths: {e}")
+        return
+    for name, depth in zip(queues, depths):
+        celery_queue_depth.labels(queue=name).set(depth)
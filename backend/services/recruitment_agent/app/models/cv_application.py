@@ -1,13 +1,40 @@
-from sqlalchemy import Column, Integer, String, Boolean, Text, Date
+import hashlib
+from sqlalchemy import Column, Computed, Integer, String, Boolean, Text, Date, Index
+from config.constants import FinalDecisionStatus
 from config.database import DeclarativeBase
 from datetime import date
 
+# Statuses in which a candidate may hold only one application per position
+ACTIVE_CV_STATUSES = (FinalDecisionStatus.PENDING.value, FinalDecisionStatus.ACCEPTED.value)
+
+
+def cv_fingerprint(candidate_name, email, position) -> str:
+    """SHA-256 of the lowercased, whitespace-normalized candidate name, email and position."""
+    parts = (" ".join(str(value or "").split()).lower() for value in (candidate_name, email, position))
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
 class CVApplication(DeclarativeBase):
     """
     SQLAlchemy ORM model for storing candidate CV applications.
     """
 
     __tablename__ = "cv_applications"
+    __table_args__ = (
+        # n-gram FULLTEXT indexes behind the name/position filters and /cvs/search (see utils.search);
+        # the MySQL-only options are ignored by other databases
+        Index("ft_cv_candidate_name", "candidate_name", mysql_prefix="FULLTEXT", mysql_with_parser="ngram"),
+        Index("ft_cv_matched_position", "matched_position", mysql_prefix="FULLTEXT", mysql_with_parser="ngram"),
+        Index(
+            "ft_cv_name_position", "candidate_name", "matched_position",
+            mysql_prefix="FULLTEXT", mysql_with_parser="ngram",
+        ),
+        # One active application per fingerprint; NULLs (inactive rows) never collide
+        Index("uq_cv_active_fingerprint", "active_fingerprint", unique=True),
+        # Lookups by candidate (interview scheduling) and the status list pages
+        Index("ix_cv_candidate_email_position", "candidate_name", "email", "matched_position"),
+        Index("ix_cv_status_id", "status", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     candidate_name = Column(String(255), nullable=False)  # Candidate full name
@@ -23,4 +50,12 @@ class CVApplication(DeclarativeBase):
     parsed_cv = Column(Text, nullable=True)  # Full parsed CV content as JSON string
     matched_score = Column(Integer, nullable=False, default=0) # LLM Score after Matching
     datetime = Column(Date(), default=date.today, nullable=True)
-    justification = Column(Text, nullable=True)
\ No newline at end of file
+    justification = Column(Text, nullable=True)
+    fingerprint = Column(String(64), nullable=True)  # cv_fingerprint() of name, email and position
+    active_fingerprint = Column(
+        String(64),
+        Computed(
+            "CASE WHEN status IN ({}) THEN fingerprint END".format(", ".join(f"'{status}'" for status in ACTIVE_CV_STATUSES)),
+            persisted=False,
+        ),
+    )  # fingerprint while the application is active, NULL otherwise
\ No newline at end of file
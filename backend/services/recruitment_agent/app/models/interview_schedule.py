@@ -5,7 +5,7 @@ class InterviewSchedule(DeclarativeBase):
     __tablename__ = "interview_schedules"
 
     id = Column(Integer, primary_key=True, index=True)
-    candidate_name = Column(String(255))
+    candidate_name = Column(String(255), index=True)  # Interview lookups by candidate
     interviewer_name = Column(String(255))
     interview_datetime = Column(DateTime)
     status = Column(String(50), default="Pending")
@@ -1,7 +1,24 @@
+import hashlib
+import json
 from sqlalchemy import Column, Integer, String, JSON, Date, Boolean, Text
 from config.database import DeclarativeBase
 from datetime import date
 
+
+def _normalize(value) -> str:
+    return " ".join(str(value or "").split()).lower()
+
+
+def jd_signature(position, skills_required, experience_required, level) -> str:
+    """SHA-256 of the fields a duplicate JD is recognized by: position, skills in any order, experience and level."""
+    canonical = [
+        _normalize(position),
+        sorted(_normalize(skill) for skill in skills_required or []),
+        experience_required,
+        _normalize(level),
+    ]
+    return hashlib.sha256(json.dumps(canonical).encode("utf-8")).hexdigest()
+
 class JobDescription(DeclarativeBase):
     __tablename__ = "job_descriptions"
 
@@ -31,4 +48,7 @@ class JobDescription(DeclarativeBase):
     
     # Hiring Names
     hiring_manager = Column(String(100), nullable=True)
-    recruiter = Column(String(100), nullable=True)
\ No newline at end of file
+    recruiter = Column(String(100), nullable=True)
+
+    # jd_signature of the JD; imports look existing JDs up by it
+    content_signature = Column(String(64), nullable=True, index=True)
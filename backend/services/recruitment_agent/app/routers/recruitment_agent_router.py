@@ -1,4 +1,5 @@
-from fastapi import APIRouter, UploadFile, File, Form, Depends, Body, Query
+from fastapi import APIRouter, UploadFile, File, Form, Depends, Body, Query, Header, Request
+from fastapi.responses import ORJSONResponse
 from typing import Optional, Dict, List
 from sqlalchemy.orm import Session
 from config.database import DatabaseSession
@@ -6,12 +7,26 @@ from services.service import RecruitmentService
 from schemas.interview_schema import (
     InterviewScheduleCreateSchema,
     InterviewAcceptSchema,
+    InterviewScheduleSchema,
 )
+import asyncio
 import json
-from schemas.jd_schema import JobDescriptionUploadSchema
-from schemas.cv_schema import CVUploadResponseSchema, CVApplicationResponse
+from schemas.jd_schema import JDImportResponseSchema, JobDescriptionUploadSchema, JobDescriptionResponseSchema
+from schemas.cv_schema import (
+    CVUploadResponseSchema,
+    CVApplicationResponse,
+    CVListItemSchema,
+    CVPositionListItemSchema,
+    CVSearchResultSchema,
+    CVBatchUploadResponseSchema,
+    CVBatchStatusSchema,
+    CVProgressTokenSchema,
+)
 from services.jwt_service import JWTService
 from config.log_config import AppLogger
+from config.constants import LIST_PAGE_SIZE_MAX
+from utils.ndjson import is_ndjson, iter_ndjson
+from utils.pagination import page_response
 from schemas.interview_question_schema import InterviewQuestionSchema
 from celery_tasks.pipeline import *
 
@@ -28,6 +43,10 @@ def get_db():
     finally:
         db.close()
 
+
+def _includes(include: Optional[str], field: str) -> bool:
+    return field in (include or "").split(",")
+
 # Upload CVs without authentication
 @router.post("/cvs/upload", response_model=CVUploadResponseSchema)
 async def upload_cv(
@@ -39,32 +58,85 @@ async def upload_cv(
     username = get_current_user.get("sub")
     role = get_current_user.get("role")
     logger.debug(f"USER '{username}' [{role}] is calling /cvs/upload endpoint.")
-    return recruitment_service.upload_and_process_cv(
+    return await recruitment_service.upload_and_process_cv(
         file,
         override_email=override_email,
         position_applied_for=position_applied_for,
         username=username
     )
     
+# Only administrator can bulk upload CVs (many files and/or ZIP archives)
+@router.post("/cvs/upload/bulk", response_model=CVBatchUploadResponseSchema)
+async def upload_cvs_bulk(
+    files: List[UploadFile] = File(...),
+    position_applied_for: str = Form(...),
+    get_current_user: dict = JWTService.require_role("ADMIN"),
+):
+    username = get_current_user.get("sub")
+    role = get_current_user.get("role")
+    logger.debug(f"USER '{username}' [{role}] is calling /cvs/upload/bulk endpoint with {len(files)} file(s).")
+    # File copies and ZIP extraction are blocking; keep them off the event loop
+    return await asyncio.to_thread(
+        recruitment_service.bulk_upload_cvs,
+        files,
+        position_applied_for=position_applied_for,
+        username=username,
+    )
+
+# Only administrator can follow a bulk upload batch
+@router.get("/cvs/batches/{batch_id}", response_model=CVBatchStatusSchema)
+async def get_cv_batch_status(
+    batch_id: str,
+    get_current_user: dict = JWTService.require_role("ADMIN"),
+):
+    logger.debug(f"USER '{get_current_user.get('sub')}' is calling GET /cvs/batches/{batch_id}")
+    # Redis reads are blocking; keep them off the event loop
+    return await asyncio.to_thread(recruitment_service.get_batch_status, batch_id)
+
+# EventSource cannot send the Authorization header: trade the JWT for a short-lived token of one stream
+@router.post("/cvs/progress/{task_id}/token", response_model=CVProgressTokenSchema)
+async def issue_cv_progress_token(
+    task_id: str,
+    get_current_user: dict = Depends(JWTService.verify_jwt),
+):
+    logger.debug(f"USER '{get_current_user.get('sub')}' is calling POST /cvs/progress/{task_id}/token")
+    return recruitment_service.issue_progress_token(task_id, get_current_user)
+
+# Progress events of an upload (task_id from /cvs/upload) or a bulk batch (batch_id), as Server-Sent Events.
+# A client reopening the stream itself passes ?last_event_id=, as EventSource only sends the header on reconnects
+@router.get("/cvs/progress/{task_id}")
+async def stream_cv_progress(
+    task_id: str,
+    request: Request,
+    token: str = Query(...),
+    last_event_id: Optional[str] = Query(None),
+    last_event_id_header: Optional[str] = Header(None, alias="Last-Event-ID"),
+):
+    return recruitment_service.stream_cv_progress(task_id, token, request, last_event_id_header or last_event_id)
+
 @router.get("/cvs/{cv_id}/preview")
 async def preview_cv_file(
     cv_id: int,
     db: Session = Depends(get_db)
 ):
     logger.debug(f"Fetching CV preview for CV ID: {cv_id}")
-    return recruitment_service.preview_cv_file(cv_id, db)
+    # Non-PDF CVs may need a PDF rendition first; keep that off the event loop
+    return await asyncio.to_thread(recruitment_service.preview_cv_file, cv_id, db)
 
 # === JD edit/delete ===
 # Only administrator can get the Job Description preview
 @router.get("/jds/{jd_id}/preview")
 async def preview_jd_file(
     jd_id: int,
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db)
 ):
-    return recruitment_service.preview_jd_file(jd_id, db)
+    # A cold preview renders the JD to PDF; keep that off the event loop
+    return await asyncio.to_thread(recruitment_service.preview_jd_file, jd_id, db, if_none_match=if_none_match)
 
 # Only administrator can upload the Job Descriptions
-@router.post("/jds/upload", response_model=CVUploadResponseSchema)
+# A JSON array of JDs, or NDJSON (one JD per line) for large catalogs
+@router.post("/jds/upload", response_model=JDImportResponseSchema)
 async def upload_jd(
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
@@ -73,11 +145,15 @@ async def upload_jd(
     username = get_current_user.get("sub")
     role = get_current_user.get("role")
     logger.debug(f"USER '{username}' [{role}] is calling /jd/upload endpoint.")
-    content = await file.read()
-    jd_list = json.loads(content)
-    return recruitment_service.upload_jd(jd_list, db)
-
-@router.post("/jds", response_model=CVUploadResponseSchema)
+    if is_ndjson(file.filename, file.content_type):
+        # Parsed line by line while importing, batch after batch
+        jd_list = iter_ndjson(file.file)
+    else:
+        jd_list = await asyncio.to_thread(json.load, file.file)
+    # The import (and the NDJSON parsing it drives) blocks on the database; keep it off the event loop
+    return await asyncio.to_thread(recruitment_service.upload_jd, jd_list, db)
+
+@router.post("/jds", response_model=JDImportResponseSchema)
 async def create_jd(
     jd_data: JobDescriptionUploadSchema,
     db: Session = Depends(get_db),
@@ -96,16 +172,19 @@ async def create_jd(
         return result
     except Exception as e:
         logger.error(f"Error creating JD: {e}")
-        return CVUploadResponseSchema(message=f"Failed to create JD: {str(e)}")
+        return JDImportResponseSchema(message=f"Failed to create JD: {str(e)}")
 
 # Candidate can get job descriptions list without authentication
-@router.get("/jds")
+@router.get("/jds", response_model=List[JobDescriptionResponseSchema])
 async def get_jds(
     position: Optional[str] = Query(None, description="Optional position filter"),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    limit: Optional[int] = Query(None, ge=1, description=f"Page size, at most {LIST_PAGE_SIZE_MAX}"),
     db: Session = Depends(get_db)
 ):
     logger.debug(f"Fetching job descriptions with position filter: {position}")
-    return recruitment_service.get_all_jds(db, position=position)
+    jds, next_cursor = recruitment_service.get_all_jds(db, position=position, cursor=cursor, limit=limit)
+    return page_response(jds, next_cursor)
 
 # Only administrator can edit the Job Description
 @router.put("/jds/{jd_id}", response_model=CVUploadResponseSchema)
@@ -153,7 +232,7 @@ async def schedule_interview(
 
 
 # Only administrator can get interview list
-@router.get("/interviews")
+@router.get("/interviews", response_model=List[InterviewScheduleSchema])
 async def get_interviews(
     interview_date: Optional[str] = Query(
         None, description="Optional interview date filter in format YYYY-MM-DD"
@@ -161,6 +240,8 @@ async def get_interviews(
     candidate_name: Optional[str] = Query(
         None, description="Optional candidate name filter"
     ),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    limit: Optional[int] = Query(None, ge=1, description=f"Page size, at most {LIST_PAGE_SIZE_MAX}"),
     db: Session = Depends(get_db),
     get_current_user: dict = JWTService.require_role("ADMIN"),
 ):
@@ -168,11 +249,12 @@ async def get_interviews(
         username = get_current_user.get("sub")
         role = get_current_user.get("role")
         logger.debug(f"USER '{username}' [{role}] is calling GET /interviews endpoint.")
-        return recruitment_service.get_all_interviews(
-            db, interview_date=interview_date, candidate_name=candidate_name
+        interviews, next_cursor = recruitment_service.get_all_interviews(
+            db, interview_date=interview_date, candidate_name=candidate_name, cursor=cursor, limit=limit
         )
+        return page_response(interviews, next_cursor)
     except ValueError as e:
-        return {"error": str(e)}
+        return ORJSONResponse({"error": str(e)})
 
 # Only administrator can delete interview
 @router.delete("/interviews/{interview_id}", response_model=CVUploadResponseSchema)
@@ -295,32 +377,50 @@ async def approve_cv(
 
 
 # Only administrator can get pending list CVs
-@router.get("/cvs/pending")
+@router.get("/cvs/pending", response_model=List[CVListItemSchema])
 async def get_pending_cv_list(
     candidate_name: Optional[str] = Query(
         None, description="Optional candidate name filter"
     ),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    limit: Optional[int] = Query(None, ge=1, description=f"Page size, at most {LIST_PAGE_SIZE_MAX}"),
     db: Session = Depends(get_db),
     get_current_user: dict = JWTService.require_role("ADMIN"),
 ):
     username = get_current_user.get("sub")
     role = get_current_user.get("role")
     logger.debug(f"USER '{username}' [{role}] is calling GET /cvs/pending endpoint.")
-    return recruitment_service.get_pending_cvs(db, candidate_name=candidate_name)
+    cvs, next_cursor = recruitment_service.get_pending_cvs(db, candidate_name=candidate_name, cursor=cursor, limit=limit)
+    return page_response(cvs, next_cursor)
 
 # Only administrator can get approved list CVs
-@router.get("/cvs/approved")
+@router.get("/cvs/approved", response_model=List[CVListItemSchema])
 async def get_approved_cv_list(
     candidate_name: Optional[str] = Query(
         None, description="Optional candidate name filter"
     ),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    limit: Optional[int] = Query(None, ge=1, description=f"Page size, at most {LIST_PAGE_SIZE_MAX}"),
     db: Session = Depends(get_db),
     get_current_user: dict = JWTService.require_role("ADMIN"),
 ):
     username = get_current_user.get("sub")
     role = get_current_user.get("role")
     logger.debug(f"USER '{username}' [{role}] is calling GET /cvs/approved endpoint.")
-    return recruitment_service.get_approved_cvs(db, candidate_name=candidate_name)
+    cvs, next_cursor = recruitment_service.get_approved_cvs(db, candidate_name=candidate_name, cursor=cursor, limit=limit)
+    return page_response(cvs, next_cursor)
+
+# Only administrator can search CVs by candidate name or position
+@router.get("/cvs/search", response_model=List[CVSearchResultSchema])
+async def search_cvs(
+    q: str = Query(..., min_length=1, description="Candidate name or position, partial words allowed"),
+    status: Optional[str] = Query(None, description="Optional status filter"),
+    limit: Optional[int] = Query(None, ge=1, description=f"Number of results, at most {LIST_PAGE_SIZE_MAX}"),
+    db: Session = Depends(get_db),
+    get_current_user: dict = JWTService.require_role("ADMIN"),
+):
+    logger.debug(f"USER '{get_current_user.get('sub')}' is calling GET /cvs/search with q={q}")
+    return ORJSONResponse(recruitment_service.search_cv_applications(db, q, status=status, limit=limit))
 
 # Only administrator can update the CV
 @router.put("/cvs/{cv_id}", response_model=CVUploadResponseSchema)
@@ -346,42 +446,54 @@ async def delete_cv(
     return recruitment_service.delete_cv_application(cv_id, db)
 
 # Only administrator can get all CVs filtered with position
-@router.get("/cvs/position")
+@router.get("/cvs/position", response_model=List[CVPositionListItemSchema])
 async def list_all_cvs(
     position: Optional[str] = Query(
         default=None, description="Optional position filter"
     ),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    limit: Optional[int] = Query(None, ge=1, description=f"Page size, at most {LIST_PAGE_SIZE_MAX}"),
     db: Session = Depends(get_db),
     get_current_user: dict = JWTService.require_role("ADMIN"),
 ):
     logger.debug(
         f"USER '{get_current_user.get('sub')}' is calling GET /cvs/position with position={position}"
     )
-    return recruitment_service.list_all_cv_applications(db, position)
+    cvs, next_cursor = recruitment_service.list_all_cv_applications(db, position, cursor=cursor, limit=limit)
+    return page_response(cvs, next_cursor)
 
 # User can get own CV applied
 @router.get("/cvs/me", response_model=List[CVApplicationResponse])
 async def get_cv_by_username(
+    include: Optional[str] = Query(None, description="Comma-separated optional fields: parsed_cv"),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    limit: Optional[int] = Query(None, ge=1, description=f"Page size, at most {LIST_PAGE_SIZE_MAX}"),
     db: Session = Depends(get_db),
     get_current_user: dict = Depends(JWTService.verify_jwt)
 ):
     username = get_current_user.get('sub')
     role = get_current_user.get('role')
     logger.debug(f"USER '{username}' with role {role} is calling GET /cvs/me")
-    return recruitment_service.get_cv_application_by_username(username=username, db=db)
+    cvs, next_cursor = recruitment_service.get_cv_application_by_username(
+        username=username, db=db, cursor=cursor, limit=limit, include_parsed_cv=_includes(include, "parsed_cv")
+    )
+    return page_response(cvs, next_cursor)
 
 # Only administrator can get specific CV
-@router.get("/cvs/{cv_id}")
+@router.get("/cvs/{cv_id}", response_model=CVApplicationResponse)
 async def get_cv_by_id(
     cv_id: int,
+    include: Optional[str] = Query(None, description="Comma-separated optional fields: parsed_cv"),
     db: Session = Depends(get_db),
     get_current_user: dict = JWTService.require_role("ADMIN"),
 ):
     logger.debug(f"USER '{get_current_user.get('sub')}' is calling GET /cv/{cv_id}")
     try:
-        return recruitment_service.get_cv_application_by_id(cv_id, db)
+        return ORJSONResponse(
+            recruitment_service.get_cv_application_by_id(cv_id, db, include_parsed_cv=_includes(include, "parsed_cv"))
+        )
     except ValueError as e:
-        return {"error": str(e)}
+        return ORJSONResponse({"error": str(e)})
 
 # Candidate can get the proof images
 @router.get("/cvs/{cv_id}/proofs", response_model=List[str])
@@ -1,8 +1,11 @@
-from typing import List, Optional
+from datetime import date
+from typing import Dict, List, Optional
 from pydantic import BaseModel
 
 class CVUploadResponseSchema(BaseModel):
     message: str
+    task_id: Optional[str] = None
+    duplicate: bool = False
 
 class CVApplicationResponse(BaseModel):
     id: int
@@ -16,7 +19,42 @@ class CVApplicationResponse(BaseModel):
     matched_score: Optional[float] = None
     justification: Optional[str] = None
     status: Optional[str] = None
-    parsed_cv: dict = {}
+    # Only with ?include=parsed_cv
+    parsed_cv: Optional[dict] = None
 
-    class Config:
-        orm_mode = True
\ No newline at end of file
+# Rows of the CV list endpoints, built from selected columns rather than ORM objects
+class CVListItemSchema(BaseModel):
+    id: int
+    candidate_name: str
+    email: str
+    position: Optional[str] = None
+    matched_score: Optional[float] = None
+    justification: Optional[str] = None
+    status: Optional[str] = None
+    datetime: Optional[date] = None
+
+class CVPositionListItemSchema(CVListItemSchema):
+    username: str
+
+class CVSearchResultSchema(CVPositionListItemSchema):
+    score: float
+
+class CVBatchUploadResponseSchema(BaseModel):
+    message: str
+    batch_id: Optional[str] = None
+    accepted: int = 0
+    skipped: List[str] = []
+    # Name of a skipped duplicate -> task ID of the identical upload in flight
+    duplicate_of: Dict[str, str] = {}
+
+class CVProgressTokenSchema(BaseModel):
+    token: str
+    expires_in: int
+
+class CVBatchStatusSchema(BaseModel):
+    batch_id: str
+    total: int
+    processed: int
+    failed: int
+    pending: int
+    skipped: int = 0
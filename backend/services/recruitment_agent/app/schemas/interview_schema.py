@@ -1,5 +1,6 @@
 from pydantic import BaseModel
 from datetime import datetime
+from typing import Optional
 
 class InterviewScheduleCreateSchema(BaseModel):
     candidate_name: str
@@ -7,4 +8,12 @@ class InterviewScheduleCreateSchema(BaseModel):
     interview_datetime: datetime
 
 class InterviewAcceptSchema(BaseModel):
-    candidate_id: int
\ No newline at end of file
+    candidate_id: int
+
+class InterviewScheduleSchema(BaseModel):
+    id: int
+    candidate_name: Optional[str] = None
+    interviewer_name: Optional[str] = None
+    interview_datetime: Optional[datetime] = None
+    status: Optional[str] = None
+    cv_application_id: int
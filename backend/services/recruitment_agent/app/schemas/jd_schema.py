@@ -42,3 +42,31 @@ class JobDescriptionUploadSchema(BaseModel):
         if v < 0:
             raise ValueError('Experience must be a non-negative integer')
         return v
+
+
+class JobDescriptionResponseSchema(BaseModel):
+    id: int
+    position: str
+    skills_required: List[str]
+    location: Optional[str] = None
+    datetime: Optional[date] = None
+    experience_required: int
+    level: Optional[str] = None
+    referral: bool = False
+    referral_code: Optional[str] = None
+    company_description: Optional[str] = None
+    job_description: Optional[str] = None
+    responsibilities: Optional[List[str]] = None
+    qualifications: Optional[List[str]] = None
+    additional_information: Optional[Any] = None
+    hiring_manager: Optional[str] = None
+    recruiter: Optional[str] = None
+
+
+class JDImportResponseSchema(BaseModel):
+    message: str
+    inserted: int = 0
+    # Already stored, or repeated in the input
+    skipped: int = 0
+    # Not valid JSON or missing required fields
+    invalid: int = 0
@@ -1,39 +1,261 @@
+import asyncio
+import os
+import random
+import threading
+import time
+import weakref
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from typing import Optional
 from config.log_config import AppLogger
 from config.constants import *
+from utils.circuit_breaker import CircuitBreaker
+from metrics.prometheus_metrics import (
+    genai_request_retries_total,
+    genai_circuit_rejections_total,
+    genai_circuit_state,
+    genai_pool_maxsize,
+    genai_http_clients,
+    genai_requests_in_flight,
+)
 
 logger = AppLogger(__name__)
 
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+_BREAKER_STATE_VALUES = {
+    CircuitBreaker.CLOSED: 0,
+    CircuitBreaker.HALF_OPEN: 1,
+    CircuitBreaker.OPEN: 2,
+}
+
+
+class GenAIUnavailableError(requests.exceptions.RequestException):
+    """Raised without a network call while the circuit breaker is open."""
+
+
+class GenAIDeadlineExceeded(requests.exceptions.Timeout):
+    """Raised when a call's overall deadline leaves no time for another attempt."""
+
+
+class _GenAIHttpClient:
+    """
+    Long-lived HTTP client shared by every GenAI instance in a process.
+    The session is re-created after fork so Celery children never share sockets.
+    """
+
+    def __init__(self):
+        self._session: Optional[requests.Session] = None
+        self._pid: Optional[int] = None
+        # httpx.AsyncClient is bound to the event loop it was first used on
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self.breaker = CircuitBreaker(
+            "genai",
+            failure_threshold=GENAI_BREAKER_FAILURE_THRESHOLD,
+            reset_timeout=GENAI_BREAKER_RESET_TIMEOUT,
+            on_state_change=lambda state: genai_circuit_state.set(_BREAKER_STATE_VALUES[state]),
+        )
+        genai_pool_maxsize.set(GENAI_POOL_MAXSIZE)
+        genai_http_clients.set_function(self._live_clients)
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None or self._pid != os.getpid():
+            with self._lock:
+                if self._session is None or self._pid != os.getpid():
+                    self._session = self._create_session()
+                    self._pid = os.getpid()
+        return self._session
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=GENAI_POOL_MAXSIZE, max_retries=0)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update({"Content-Type": "application/json", "Connection": "keep-alive"})
+        # Only verify with CA cert if TLS is enabled
+        # Query to genai server => Need to use CA certificate for validation
+        if TLS_ENABLED:
+            session.verify = CA_PATH
+        logger.info(f"[GenAI] HTTP session created (pool_maxsize={GENAI_POOL_MAXSIZE}, pid={os.getpid()})")
+        return session
+
+    def async_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=GENAI_POOL_MAXSIZE,
+                    max_keepalive_connections=GENAI_POOL_MAXSIZE,
+                ),
+                headers={"Content-Type": "application/json"},
+                verify=CA_PATH if TLS_ENABLED else True,
+            )
+            self._async_clients[loop] = client
+            logger.info(f"[GenAI] Async HTTP client created (pool_maxsize={GENAI_POOL_MAXSIZE}, pid={os.getpid()})")
+        return client
+
+    async def aclose(self) -> None:
+        """Close the async client bound to the running event loop."""
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def _backoff_delay(self, attempt: int) -> float:
+        return min(GENAI_BACKOFF_MAX, GENAI_BACKOFF_BASE * (2 ** attempt)) * random.uniform(0.5, 1.5)
+
+    @staticmethod
+    def _remaining(expires_at: Optional[float]) -> Optional[float]:
+        """Seconds left before `expires_at` (time.monotonic()); None without a deadline."""
+        if expires_at is None:
+            return None
+        remaining = expires_at - time.monotonic()
+        if remaining <= 0:
+            raise GenAIDeadlineExceeded("GenAI call deadline exceeded.")
+        return remaining
+
+    @staticmethod
+    def _fits(expires_at: Optional[float], delay: float) -> bool:
+        # A retry is only worth it if some time is left after the backoff
+        return expires_at is None or time.monotonic() + delay < expires_at
+
+    def _live_clients(self) -> float:
+        # Evaluated on scrape; a session inherited across fork is not this process's
+        sessions = 1 if self._session is not None and self._pid == os.getpid() else 0
+        return sessions + sum(1 for client in list(self._async_clients.values()) if not client.is_closed)
+
+    def post(self, url: str, payload: dict, timeout, expires_at: Optional[float] = None) -> requests.Response:
+        """
+        POST with retries. `timeout` is the (connect, read) timeout of one
+        attempt; with `expires_at` each attempt's timeouts are clipped to the
+        time left, so retries and backoff stay within that deadline.
+        """
+        attempt = 0
+        while True:
+            # Checked before the breaker admits the attempt, so a spent deadline never takes the probe
+            remaining = self._remaining(expires_at)
+            attempt_timeout = timeout if remaining is None else tuple(min(t, remaining) for t in timeout)
+            if not self.breaker.allow_request():
+                genai_circuit_rejections_total.inc()
+                raise GenAIUnavailableError("GenAI circuit breaker is open; gen_ai_provider is unhealthy.")
+
+            try:
+                with genai_requests_in_flight.track_inprogress():
+                    response = self.session.post(url, json=payload, timeout=attempt_timeout)
+                if response.status_code in RETRYABLE_STATUS_CODES:
+                    raise requests.exceptions.HTTPError(
+                        f"{response.status_code} Server Error for url: {url}", response=response
+                    )
+            except requests.exceptions.SSLError:
+                # Certificate problems do not go away on retry
+                self.breaker.record_failure()
+                raise
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout, requests.exceptions.HTTPError) as err:
+                self.breaker.record_failure()
+                delay = self._backoff_delay(attempt)
+                if attempt >= GENAI_MAX_RETRIES or not self._fits(expires_at, delay):
+                    raise
+                attempt += 1
+                genai_request_retries_total.inc()
+                logger.warn(f"[GenAI] Request failed ({err}); retry {attempt}/{GENAI_MAX_RETRIES} in {delay:.2f}s")
+                time.sleep(delay)
+                continue
+            except Exception:
+                # Every admitted attempt must end in the breaker, or a HALF_OPEN probe never ends
+                self.breaker.record_failure()
+                raise
+            except BaseException:
+                # Interrupted: nothing was learned about the provider
+                self.breaker.release()
+                raise
+
+            # Any non-retryable answer means the provider is reachable
+            self.breaker.record_success()
+            return response
+
+    async def apost(self, url: str, payload: dict, timeout: httpx.Timeout, expires_at: Optional[float] = None) -> httpx.Response:
+        """Async counterpart of post(); the same deadline rules apply."""
+        attempt = 0
+        while True:
+            remaining = self._remaining(expires_at)
+            attempt_timeout = timeout if remaining is None else httpx.Timeout(
+                min(timeout.read, remaining), connect=min(timeout.connect, remaining)
+            )
+            if not self.breaker.allow_request():
+                genai_circuit_rejections_total.inc()
+                raise GenAIUnavailableError("GenAI circuit breaker is open; gen_ai_provider is unhealthy.")
+
+            try:
+                genai_requests_in_flight.inc()
+                try:
+                    response = await self.async_client().post(url, json=payload, timeout=attempt_timeout)
+                finally:
+                    genai_requests_in_flight.dec()
+                if response.status_code in RETRYABLE_STATUS_CODES:
+                    raise httpx.HTTPStatusError(
+                        f"{response.status_code} Server Error for url: {url}",
+                        request=response.request,
+                        response=response,
+                    )
+            except (httpx.TransportError, httpx.HTTPStatusError) as err:
+                self.breaker.record_failure()
+                delay = self._backoff_delay(attempt)
+                if attempt >= GENAI_MAX_RETRIES or not self._fits(expires_at, delay):
+                    raise
+                attempt += 1
+                genai_request_retries_total.inc()
+                logger.warn(f"[GenAI] Async request failed ({err!r}); retry {attempt}/{GENAI_MAX_RETRIES} in {delay:.2f}s")
+                await asyncio.sleep(delay)
+                continue
+            except Exception:
+                self.breaker.record_failure()
+                raise
+            except BaseException:
+                # e.g. asyncio.wait_for cancelling the attempt: release the probe
+                self.breaker.release()
+                raise
+
+            self.breaker.record_success()
+            return response
+
+
+_http_client = _GenAIHttpClient()
+
+
+def _expires_at(deadline: Optional[float]) -> Optional[float]:
+    return time.monotonic() + deadline if deadline is not None else None
+
 
 class GenAI:
     def __init__(self, model=DEFAULT_MODEL, temperature=0.5):
         self.model = model
         self.temperature = temperature
 
-    def invoke(self, message) -> str:
+    def invoke(self, message, timeout: Optional[float] = None, deadline: Optional[float] = None) -> str:
         """
         Send a message to the GenAI agent and return the response.
+        An optional timeout (seconds) overrides the default read timeout of
+        each attempt; an optional deadline (seconds) bounds the whole call,
+        retries and backoff included.
         """
         messages = [{"role": "user", "content": message}]
-
-        request_kwargs = {
-            "url": f"{SCHEMA}://{GENAI_HOST}/api/v1/gen-ai/chat",
-            "json": {
-                "messages": messages,
-                "model": self.model,
-                "temperature": self.temperature,
-            },
-            "headers": {"Content-Type": "application/json"},
+        payload = {
+            "messages": messages,
+            "model": self.model,
+            "temperature": self.temperature,
         }
-
-        # Only verify with CA cert if TLS is enabled
-        # Query to genai server => Need to use CA certificate for validation
-        if TLS_ENABLED:
-            request_kwargs["verify"] = CA_PATH
+        read_timeout = timeout if timeout is not None else GENAI_READ_TIMEOUT
 
         try:
-            response = requests.post(**request_kwargs)
-            logger.debug(response.json())
+            response = _http_client.post(
+                f"{SCHEMA}://{GENAI_HOST}/api/v1/gen-ai/chat",
+                payload,
+                timeout=(GENAI_CONNECT_TIMEOUT, read_timeout),
+                expires_at=_expires_at(deadline),
+            )
+            logger.debug(f"[GenAI] status={response.status_code} bytes={len(response.content)}")
             response.raise_for_status()
             return response
         except requests.exceptions.SSLError as ssl_err:
@@ -42,3 +264,33 @@ class GenAI:
         except requests.exceptions.RequestException as req_err:
             logger.error(f"Request Error: {req_err}")
             raise
+
+    async def ainvoke(self, message, timeout: Optional[float] = None, deadline: Optional[float] = None) -> httpx.Response:
+        """
+        Async counterpart of invoke() used by the async recruitment graphs.
+        """
+        payload = {
+            "messages": [{"role": "user", "content": message}],
+            "model": self.model,
+            "temperature": self.temperature,
+        }
+        read_timeout = timeout if timeout is not None else GENAI_READ_TIMEOUT
+
+        try:
+            response = await _http_client.apost(
+                f"{SCHEMA}://{GENAI_HOST}/api/v1/gen-ai/chat",
+                payload,
+                timeout=httpx.Timeout(read_timeout, connect=GENAI_CONNECT_TIMEOUT),
+                expires_at=_expires_at(deadline),
+            )
+            logger.debug(f"[GenAI] status={response.status_code} bytes={len(response.content)}")
+            response.raise_for_status()
+            return response
+        except (httpx.HTTPError, requests.exceptions.RequestException) as req_err:
+            logger.error(f"Request Error: {req_err!r}")
+            raise
+
+    @staticmethod
+    async def aclose():
+        """Release the pooled async connections of the running event loop."""
+        await _http_client.aclose()
@@ -1,5 +1,7 @@
 from jose import jwt, JWTError
 import base64
+import hashlib
+import time
 from fastapi import HTTPException, Security, Depends, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from config.log_config import AppLogger
@@ -69,3 +71,30 @@ class JWTService:
             return user
 
         return Depends(role_checker)
+
+    @classmethod
+    def _stream_key(cls) -> bytes:
+        # Derived from the shared secret, so a stream token is never accepted as a user JWT
+        return hashlib.sha256(base64.b64decode(cls.SECRET_KEY_ENCODED) + b":cv_progress").digest()
+
+    @classmethod
+    def issue_stream_token(cls, user: dict, stream_id: str, ttl_seconds: int) -> str:
+        """Short-lived token that only opens the progress stream of `stream_id`."""
+        now = int(time.time())
+        claims = {"sub": user.get("sub"), "stream": stream_id, "iat": now, "exp": now + ttl_seconds}
+        return jwt.encode(claims, cls._stream_key(), algorithm=cls.ALGORITHM)
+
+    @classmethod
+    def verify_stream_token(cls, token: str, stream_id: str) -> dict:
+        """Verifies a token from issue_stream_token for `stream_id` and returns its payload."""
+        jwt_verification_total.inc()
+        try:
+            payload = jwt.decode(token, cls._stream_key(), algorithms=[cls.ALGORITHM])
+        except JWTError as e:
+            jwt_verification_failed_total.inc()
+            logger.error(f"[JWT ERROR] Stream token: {e}")
+            raise HTTPException(status_code=401, detail="Invalid or expired token")
+        if payload.get("stream") != stream_id:
+            jwt_verification_failed_total.inc()
+            raise HTTPException(status_code=403, detail="Token is not valid for this stream")
+        return payload
@@ -1,37 +1,131 @@
 # services/recruitment_service.py
+import asyncio
+import hashlib
+import itertools
 import os
-import subprocess
 import shutil
+import tempfile
 import json
-from typing import Optional, List
+import orjson
+import uuid
+import zipfile
+import redis
+from typing import Any, Dict, Iterable, Optional, List, Sequence, Tuple
 
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
-from fastapi.responses import FileResponse
-from fastapi import HTTPException, UploadFile
+from pydantic import ValidationError
+from sqlalchemy import and_, insert
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from fastapi import HTTPException, Request, UploadFile
 from datetime import datetime
 from config.config import Settings
 from config.log_config import AppLogger
 from config.constants import *
 from utils.email_sender import EmailSender
 from services.genai import GenAI
+from services.jwt_service import JWTService
 from agents.state import RecruitmentState
 from agents.graph import (
-    build_recruitment_graph_matching,
-    build_recruitment_graph_approval,
+    ainvoke_resumable,
+    clear_checkpoints,
+    get_recruitment_graph_matching,
+    get_recruitment_graph_matching_async,
+    get_recruitment_graph_approval,
+    graph_config,
+    invoke_resumable,
 )
 from agents.interview_question_agent import InterviewQuestionAgent
-from models.job_description import JobDescription
+from models.job_description import JobDescription, jd_signature
 from models.interview_schedule import InterviewSchedule
-from models.cv_application import CVApplication
+from models.cv_application import CVApplication, cv_fingerprint
 from models.interview_question import InterviewQuestion
 from schemas.interview_question_schema import InterviewQuestionSchema
-from schemas.jd_schema import JobDescriptionUploadSchema
-from schemas.cv_schema import CVUploadResponseSchema
+from schemas.jd_schema import JDImportResponseSchema, JobDescriptionUploadSchema
+from schemas.cv_schema import (
+    CVUploadResponseSchema,
+    CVBatchUploadResponseSchema,
+    CVBatchStatusSchema,
+    CVProgressTokenSchema,
+)
+from utils.batch_tracker import CVBatchTracker
+from utils.upload_lock import CVUploadLock
+from utils.pagination import keyset_page, page_size
+from utils.search import contains_filter, relevance
+from utils.progress import CVProgressPublisher, stream_progress
+from utils.jd_preview import get_jd_preview, invalidate_jd_preview, jd_preview_etag
+from utils.office_converter import OfficeConversionError, convert_to_pdf as office_convert_to_pdf
 from metrics.prometheus_metrics import *
 
 logger = AppLogger(__name__)
 
+# Columns of the CV list endpoints; the large parsed_cv column is never loaded for them
+_CV_LIST_COLUMNS = (
+    CVApplication.id,
+    CVApplication.candidate_name,
+    CVApplication.email,
+    CVApplication.matched_position.label("position"),
+    CVApplication.matched_score,
+    CVApplication.justification,
+    CVApplication.status,
+    CVApplication.datetime,
+)
+
+
+# Columns of a single CV application; parsed_cv, the full parsed CV, only when asked for
+_CV_DETAIL_COLUMNS = (
+    CVApplication.id,
+    CVApplication.candidate_name,
+    CVApplication.username,
+    CVApplication.email,
+    CVApplication.matched_position.label("position"),
+    CVApplication.experience_years,
+    CVApplication.skills,
+    CVApplication.matched_jd_skills,
+    CVApplication.matched_score,
+    CVApplication.justification,
+    CVApplication.status,
+)
+
+
+def _cv_detail_columns(include_parsed_cv: bool):
+    return _CV_DETAIL_COLUMNS + (CVApplication.parsed_cv,) if include_parsed_cv else _CV_DETAIL_COLUMNS
+
+
+def _cv_detail(row, include_parsed_cv: bool) -> dict:
+    cv = row._asdict()
+    cv["skills"] = orjson.loads(cv["skills"]) if cv["skills"] else []
+    jd_skills = cv.pop("matched_jd_skills")
+    cv["jd_skills"] = orjson.loads(jd_skills) if jd_skills else []
+    if include_parsed_cv:
+        cv["parsed_cv"] = orjson.loads(cv["parsed_cv"]) if cv["parsed_cv"] else {}
+    return cv
+
+
+def _jd_row(jd_data) -> Optional[dict]:
+    """Insert values of one JD to import, with its content signature; None if it is invalid."""
+    if not isinstance(jd_data, dict):
+        logger.warn("Invalid JD skipped: not a JSON object.")
+        return None
+    try:
+        jd_validated = JobDescriptionUploadSchema(**jd_data)
+    except ValidationError as e:
+        logger.warn(f"Invalid JD skipped: {e}")
+        return None
+    if not jd_validated.skills_required:
+        logger.warn(f"JD '{jd_validated.position}' has no skills_required. Skipping this JD.")
+        return None
+    if not jd_validated.level:
+        logger.warn("JD level is not set. Defaulting to 'Mid'.")
+        jd_validated.level = "Mid"
+
+    row = jd_validated.model_dump()
+    row["skills_required"] = sorted(jd_validated.skills_required)
+    row["content_signature"] = jd_signature(
+        jd_validated.position, jd_validated.skills_required, jd_validated.experience_required, jd_validated.level
+    )
+    return row
+
 
 class RecruitmentService:
     """
@@ -50,53 +144,236 @@ class RecruitmentService:
             Settings.SMTP_PASSWORD,
         )
 
-    def upload_and_process_cv(
+    async def upload_and_process_cv(
         self,
-        file,
+        file: UploadFile,
         override_email: Optional[str] = None,
         position_applied_for: Optional[str] = None,
         username: Optional[str] = None
     ):
+        """
+        Save the uploaded CV and enqueue the pipeline. The copy runs in a worker
+        thread and the CV is kept in its original format (text is extracted
+        natively by the pipeline), so the event loop is never blocked.
+        An identical upload (same file, position and user) that is still being
+        processed is not enqueued again; the response carries its task ID.
+        """
         logger.info("Uploading and processing CV file.")
+        filename = os.path.basename(file.filename or "")
+        if os.path.splitext(filename)[1].lower() not in CV_ALLOWED_EXTENSIONS:
+            raise HTTPException(status_code=415, detail=f"Unsupported CV file type: {filename}")
+        if file.size is not None and file.size > CV_UPLOAD_MAX_BYTES:
+            raise HTTPException(status_code=413, detail=f"CV file exceeds {CV_UPLOAD_MAX_BYTES} bytes.")
+
+        upload_id = uuid.uuid4().hex
+        # Stored under the upload ID so that two candidates' "cv.pdf" never overwrite each other
+        full_path = os.path.join(UPLOAD_DIR, f"{upload_id}_{filename}")
+        # Staged next to the target so the pipeline never sees a partial file
+        part_path = f"{full_path}.part"
+        upload_lock = CVUploadLock()
         try:
-            cv_dir = UPLOAD_DIR
-            original_path = os.path.join(cv_dir, file.filename)
-            with open(original_path, "wb") as f:
-                shutil.copyfileobj(file.file, f)
+            try:
+                size, sha256 = await asyncio.to_thread(self._save_upload_stream, file.file, part_path)
+            except ValueError as e:
+                raise HTTPException(status_code=413, detail=f"CV file {e}.")
+
+            idempotency_key = CVUploadLock.idempotency_key(sha256, position_applied_for, username)
+            holder = await asyncio.to_thread(upload_lock.acquire, idempotency_key, upload_id)
+            if holder != upload_id:
+                cv_upload_duplicates_total.inc()
+                logger.info(f"Duplicate upload of {filename} (sha256={sha256}) attached to in-flight task {holder}.")
+                return CVUploadResponseSchema(
+                    message="An identical CV is already being processed.", task_id=holder, duplicate=True
+                )
 
-            if not file.filename.lower().endswith(".pdf"):
-                try:
-                    subprocess.run(
-                        [
-                            "libreoffice",
-                            "--headless",
-                            "--convert-to",
-                            "pdf",
-                            "--outdir",
-                            cv_dir,
-                            original_path,
-                        ],
-                        check=True,
-                    )
-                    pdf_filename = file.filename.rsplit(".", 1)[0] + ".pdf"
-                    pdf_path = os.path.join(cv_dir, pdf_filename)
-                    if not os.path.exists(pdf_path):
-                        raise RuntimeError("PDF conversion failed.")
-                except Exception as e:
-                    logger.error(f"LibreOffice conversion failed: {e}")
-                    raise RuntimeError("Failed to convert CV to PDF.")
-            else:
-                pdf_filename = file.filename
+            os.replace(part_path, full_path)
+        finally:
+            # Left behind by a rejected, duplicate or failed upload
+            if os.path.exists(part_path):
+                os.remove(part_path)
+        logger.info(f"Stored CV {filename} as {full_path} ({size} bytes, sha256={sha256}).")
 
-            full_path = os.path.join(cv_dir, pdf_filename)
-            from celery_tasks.pipeline import process_cv_pipeline
+        try:
+            from celery_tasks.stages import cv_pipeline_signature
             cv_upload_total.inc()
-            process_cv_pipeline.delay(full_path, override_email, position_applied_for, username)
-            return CVUploadResponseSchema(message="CV received and is being processed.")
+            cv_pipeline_signature(full_path, override_email, position_applied_for, username, upload_id=upload_id).delay()
+            return CVUploadResponseSchema(message="CV received and is being processed.", task_id=upload_id)
         except Exception as e:
             logger.exception(f"Error processing CV: {e}")
+            await asyncio.to_thread(upload_lock.release, idempotency_key, upload_id)
             return CVUploadResponseSchema(message=f"Error processing CV: {str(e)}")
 
+    @staticmethod
+    def _save_upload_stream(src, dest_path: str) -> Tuple[int, str]:
+        """
+        Copy an uploaded stream to dest_path in chunks, enforcing CV_UPLOAD_MAX_BYTES.
+        Returns the size and the sha256 hex digest computed while copying.
+        """
+        written = 0
+        digest = hashlib.sha256()
+        try:
+            with open(dest_path, "wb") as f:
+                while chunk := src.read(UPLOAD_CHUNK_SIZE):
+                    written += len(chunk)
+                    if written > CV_UPLOAD_MAX_BYTES:
+                        raise ValueError(f"exceeds {CV_UPLOAD_MAX_BYTES} bytes")
+                    digest.update(chunk)
+                    f.write(chunk)
+        except ValueError:
+            os.remove(dest_path)
+            raise
+        return written, digest.hexdigest()
+
+    @staticmethod
+    def _batch_upload_path(filename: str, batch_prefix: str, index: int) -> str:
+        # The index keeps CVs with the same basename (across archives or uploads) apart
+        return os.path.join(UPLOAD_DIR, f"{batch_prefix}_{index:04d}_{os.path.basename(filename)}")
+
+    def _extract_zip(
+        self, archive, archive_name: str, batch_prefix: str, saved: List[Tuple[str, str, str]], skipped: List[str]
+    ) -> None:
+        try:
+            zf = zipfile.ZipFile(archive)
+        except zipfile.BadZipFile:
+            skipped.append(f"{archive_name}: not a valid ZIP file")
+            return
+
+        with zf:
+            for info in zf.infolist():
+                name = os.path.basename(info.filename)
+                if info.is_dir() or not name or info.filename.startswith("__MACOSX/") or name.startswith("."):
+                    continue
+                if os.path.splitext(name)[1].lower() not in CV_ALLOWED_EXTENSIONS:
+                    skipped.append(f"{info.filename}: unsupported file type")
+                    continue
+                if info.file_size > CV_UPLOAD_MAX_BYTES:
+                    skipped.append(f"{info.filename}: exceeds {CV_UPLOAD_MAX_BYTES} bytes")
+                    continue
+                if len(saved) >= BULK_UPLOAD_MAX_FILES:
+                    skipped.append(f"{info.filename}: batch limit of {BULK_UPLOAD_MAX_FILES} files reached")
+                    continue
+                try:
+                    with zf.open(info) as src:
+                        dest_path = self._batch_upload_path(name, batch_prefix, len(saved))
+                        _, sha256 = self._save_upload_stream(src, dest_path)
+                        saved.append((dest_path, info.filename, sha256))
+                except ValueError as e:
+                    skipped.append(f"{info.filename}: {e}")
+
+    def bulk_upload_cvs(
+        self,
+        files: List[UploadFile],
+        position_applied_for: str,
+        username: Optional[str] = None,
+    ) -> CVBatchUploadResponseSchema:
+        """
+        Save many CVs (plain files and/or ZIP archives) and fan them out as a
+        Celery group of CV pipelines sharing one batch ID (batches of CVs per
+        task when CV_PIPELINE_MODE is "async").
+        Each CV claims its upload lock before enqueueing, as in upload_and_process_cv:
+        one identical to an upload still in flight (or to an earlier CV of the batch)
+        is skipped and reported with the task ID it duplicates.
+        """
+        batch_id = uuid.uuid4().hex
+        batch_prefix = batch_id[:8]
+        # (stored path, name in the request, sha256)
+        saved: List[Tuple[str, str, str]] = []
+        skipped: List[str] = []
+
+        for upload in files:
+            filename = os.path.basename(upload.filename or "")
+            ext = os.path.splitext(filename)[1].lower()
+            if ext == ".zip":
+                self._extract_zip(upload.file, filename, batch_prefix, saved, skipped)
+            elif ext not in CV_ALLOWED_EXTENSIONS:
+                skipped.append(f"{filename}: unsupported file type")
+            elif len(saved) >= BULK_UPLOAD_MAX_FILES:
+                skipped.append(f"{filename}: batch limit of {BULK_UPLOAD_MAX_FILES} files reached")
+            else:
+                try:
+                    dest_path = self._batch_upload_path(filename, batch_prefix, len(saved))
+                    _, sha256 = self._save_upload_stream(upload.file, dest_path)
+                    saved.append((dest_path, filename, sha256))
+                except ValueError as e:
+                    skipped.append(f"{filename}: {e}")
+
+        upload_lock = CVUploadLock()
+        claimed: List[Tuple[str, str, str]] = []  # (stored path, upload ID, idempotency key)
+        duplicate_of: Dict[str, str] = {}
+        for dest_path, name, sha256 in saved:
+            upload_id = uuid.uuid4().hex
+            idempotency_key = CVUploadLock.idempotency_key(sha256, position_applied_for, username)
+            holder = upload_lock.acquire(idempotency_key, upload_id)
+            if holder != upload_id:
+                cv_upload_duplicates_total.inc()
+                os.remove(dest_path)
+                skipped.append(f"{name}: an identical CV is already being processed")
+                duplicate_of[name] = holder
+                continue
+            claimed.append((dest_path, upload_id, idempotency_key))
+
+        if not claimed:
+            return CVBatchUploadResponseSchema(message="No CV files accepted.", skipped=skipped, duplicate_of=duplicate_of)
+
+        from celery import group
+        from celery_tasks.stages import cv_batch_signatures
+
+        paths = [dest_path for dest_path, _, _ in claimed]
+        upload_ids = [upload_id for _, upload_id, _ in claimed]
+        try:
+            CVBatchTracker().create(batch_id, total=len(claimed), skipped=len(skipped))
+            group(cv_batch_signatures(paths, None, position_applied_for, username, batch_id, upload_ids)).apply_async()
+        except Exception as e:
+            logger.exception(f"[Bulk] Batch {batch_id} could not be enqueued: {e}")
+            for _, upload_id, idempotency_key in claimed:
+                upload_lock.release(idempotency_key, upload_id)
+            return CVBatchUploadResponseSchema(message=f"Error processing CVs: {str(e)}", skipped=skipped)
+        cv_upload_total.inc(len(claimed))
+        cv_batch_upload_total.inc()
+        logger.info(f"[Bulk] Batch {batch_id}: {len(claimed)} CV(s) enqueued, {len(skipped)} skipped.")
+        return CVBatchUploadResponseSchema(
+            message="CVs received and are being processed.",
+            batch_id=batch_id,
+            accepted=len(claimed),
+            skipped=skipped,
+            duplicate_of=duplicate_of,
+        )
+
+    def get_batch_status(self, batch_id: str) -> CVBatchStatusSchema:
+        try:
+            status = CVBatchTracker().status(batch_id)
+        except redis.RedisError as e:
+            logger.error(f"[Bulk] Could not read status of batch {batch_id}: {e}")
+            raise HTTPException(status_code=503, detail="Batch status is temporarily unavailable.")
+        if status is None:
+            raise HTTPException(status_code=404, detail="Batch not found or expired.")
+        return CVBatchStatusSchema(**status)
+
+    def issue_progress_token(self, task_id: str, user: dict) -> CVProgressTokenSchema:
+        """Token for GET /cvs/progress/{task_id}, which EventSource opens without an Authorization header."""
+        if not CV_PROGRESS_ENABLED:
+            raise HTTPException(status_code=404, detail="Progress events are disabled.")
+        token = JWTService.issue_stream_token(user, task_id, CV_PROGRESS_TOKEN_TTL)
+        return CVProgressTokenSchema(token=token, expires_in=CV_PROGRESS_TOKEN_TTL)
+
+    def stream_cv_progress(
+        self, task_id: str, token: str, request: Request, last_event_id: Optional[str] = None
+    ) -> StreamingResponse:
+        """
+        Server-Sent Events with the progress of an upload task or a bulk batch,
+        pushed from Redis pub/sub instead of polling the CV list endpoints.
+        """
+        if not CV_PROGRESS_ENABLED:
+            raise HTTPException(status_code=404, detail="Progress events are disabled.")
+        JWTService.verify_stream_token(token, task_id)
+        after = int(last_event_id) if last_event_id and last_event_id.isdigit() else 0
+        return StreamingResponse(
+            stream_progress(task_id, after, request.is_disconnected),
+            media_type="text/event-stream",
+            # Not cached, and not buffered by reverse proxies
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
     def upload_cv_from_file_path(
         self,
         cv_file_path: str,
@@ -104,51 +381,116 @@ class RecruitmentService:
         position_applied_for: str,
         username: str,
         db: Session,
+        thread_id: Optional[str] = None,
+        progress_ids: Sequence[str] = (),
     ):
+        """
+        Run the matching graph and store the result. With a `thread_id` every
+        completed node is checkpointed and calling again with the same ID
+        resumes the run; its checkpoints are dropped once the CV is stored.
+        Progress events are published under `progress_ids`.
+        """
         logger.info(f"[Worker] Processing CV: {cv_file_path}")
-        pipeline = build_recruitment_graph_matching(db)
-        state = RecruitmentState(cv_file_path=cv_file_path)
+        pipeline = get_recruitment_graph_matching()
+        state = self.initial_matching_state(cv_file_path, override_email, position_applied_for)
+        resumable = thread_id is not None
+        thread_id = thread_id or f"cv_pipeline:{uuid.uuid4().hex}"
 
+        try:
+            config = graph_config(db, thread_id=thread_id, progress_ids=progress_ids)
+            updated_state = invoke_resumable(pipeline, state.model_dump(), config)
+            final_state = RecruitmentState(**updated_state)
+            result = self.store_matching_result(
+                final_state, cv_file_path, position_applied_for, username, db, progress_ids=progress_ids
+            )
+        except Exception:
+            if not resumable:
+                clear_checkpoints(thread_id)
+            raise
+        clear_checkpoints(thread_id)
+        return result
+
+    async def aupload_cv_from_file_path(
+        self,
+        cv_file_path: str,
+        override_email: str,
+        position_applied_for: str,
+        username: str,
+        db: Session,
+        thread_id: Optional[str] = None,
+        progress_ids: Sequence[str] = (),
+    ):
+        """
+        Async variant of upload_cv_from_file_path. LLM calls run on the event loop,
+        DB work runs in a worker thread so other CVs on the same loop keep progressing.
+        """
+        logger.info(f"[Worker] Processing CV (async): {cv_file_path}")
+        pipeline = get_recruitment_graph_matching_async()
+        state = self.initial_matching_state(cv_file_path, override_email, position_applied_for)
+        resumable = thread_id is not None
+        thread_id = thread_id or f"cv_pipeline:{uuid.uuid4().hex}"
+
+        try:
+            config = graph_config(db, thread_id=thread_id, progress_ids=progress_ids)
+            updated_state = await ainvoke_resumable(pipeline, state.model_dump(), config)
+            final_state = RecruitmentState(**updated_state)
+            result = await asyncio.to_thread(
+                self.store_matching_result, final_state, cv_file_path, position_applied_for, username, db,
+                progress_ids,
+            )
+        except Exception:
+            if not resumable:
+                await asyncio.to_thread(clear_checkpoints, thread_id)
+            raise
+        await asyncio.to_thread(clear_checkpoints, thread_id)
+        return result
+
+    @staticmethod
+    def initial_matching_state(cv_file_path: str, override_email: str, position_applied_for: str) -> RecruitmentState:
+        state = RecruitmentState(cv_file_path=cv_file_path)
         if override_email:
             state.override_email = override_email
         if position_applied_for:
             state.position_applied_for = position_applied_for
+        return state
 
-        updated_state = pipeline.invoke(state.model_dump())
-        final_state = RecruitmentState(**updated_state)
-
+    def store_matching_result(
+        self,
+        final_state: RecruitmentState,
+        cv_file_path: str,
+        position_applied_for: str,
+        username: str,
+        db: Session,
+        progress_ids: Sequence[str] = (),
+    ):
+        """Store a matched CV; the outcome is published as a `stored` or `rejected` progress event."""
+        progress = CVProgressPublisher()
         parsed_cv = final_state.parsed_cv or {}
         candidate_name = parsed_cv.get("name", "Unknown Candidate")
         matched = final_state.matched_jd or {}
         email_to_check = final_state.override_email or parsed_cv.get("email")
-        final_state.parsed_cv["cv_file_name"] = os.path.basename(cv_file_path)
+        parsed_cv["cv_file_name"] = os.path.basename(cv_file_path)
 
         if not matched:
-            logger.info("No JD match from pipeline.")
-            return "No suitable JD match found."
+            reason = final_state.final_decision or "No suitable JD match found."
+            logger.info(f"No JD match from pipeline: {reason}")
+            progress.publish(progress_ids, "rejected", cv_file_path, reason=reason)
+            return reason
 
         candidate_experience = parsed_cv.get("experience_years", 0)
         jd_experience_required = matched.get("experience_required", 0)
 
         if abs(candidate_experience - jd_experience_required) > 1:
             logger.info("Experience mismatch with JD requirements.")
+            progress.publish(progress_ids, "rejected", cv_file_path, reason="Experience mismatch with JD requirements.")
             return f"{FinalDecisionStatus.REJECTED.value}: Experience mismatch with JD requirements."
 
-        existing = (
-            db.query(CVApplication)
-            .filter(
-                CVApplication.candidate_name == candidate_name,
-                CVApplication.email == email_to_check,
-                CVApplication.matched_position == matched.get("position"),
-                CVApplication.status.in_(
-                    [FinalDecisionStatus.PENDING.value, FinalDecisionStatus.ACCEPTED.value]
-                ),
-            )
-            .first()
-        )
+        matched_position = matched.get("position", position_applied_for)
+        fingerprint = cv_fingerprint(candidate_name, email_to_check, matched_position)
+        # One probe of the unique index on active fingerprints
+        existing = db.query(CVApplication.id).filter(CVApplication.active_fingerprint == fingerprint).first()
         if existing:
-            logger.info("CV already exists in DB. Skipping.")
-            return "CV already exists in DB. Skipping."
+            return self._duplicate_cv(progress, progress_ids, cv_file_path)
 
         matched_score = 0
         justification = ""
@@ -164,7 +506,7 @@ class RecruitmentService:
             candidate_name=candidate_name,
             username=username,
             email=email_to_check,
-            matched_position=matched.get("position", position_applied_for),
+            matched_position=matched_position,
             status=FinalDecisionStatus.PENDING.value,
             skills=json.dumps(parsed_cv.get("skills", [])),
             matched_jd_skills=json.dumps(matched.get("skills_required", [])),
@@ -174,12 +516,28 @@ class RecruitmentService:
             is_matched=True,
             matched_score=matched_score,
             justification=justification,
+            fingerprint=fingerprint,
         )
         db.add(cv)
-        db.commit()
+        try:
+            db.commit()
+        except IntegrityError:
+            # The same CV was stored concurrently since the check above
+            db.rollback()
+            return self._duplicate_cv(progress, progress_ids, cv_file_path)
         logger.info("CV saved to database.")
+        progress.publish(
+            progress_ids, "stored", cv_file_path,
+            candidate_id=cv.id, candidate_name=candidate_name, position=cv.matched_position, score=matched_score,
+        )
         return f"CV processed successfully for candidate name: {candidate_name}"
 
+    @staticmethod
+    def _duplicate_cv(progress: CVProgressPublisher, progress_ids: Sequence[str], cv_file_path: str) -> str:
+        logger.info("CV already exists in DB. Skipping.")
+        progress.publish(progress_ids, "rejected", cv_file_path, reason="CV already exists for this position.")
+        return "CV already exists in DB. Skipping."
+
     def approve_cv(self, candidate_id: int, db: Session):
         logger.info(f"Starting approval for candidate_id={candidate_id}.")
         cv_application = (
@@ -191,7 +549,7 @@ class RecruitmentService:
             logger.error("Pending CV not found or already approved/rejected.")
             raise ValueError("Pending CV not found or already processed.")
 
-        pipeline = build_recruitment_graph_approval(db, self.email_sender)
+        pipeline = get_recruitment_graph_approval()
         try:
             parsed_cv = (
                 json.loads(cv_application.parsed_cv)
@@ -220,7 +578,7 @@ class RecruitmentService:
         )
 
         try:
-            updated_state = pipeline.invoke(state.model_dump())
+            updated_state = pipeline.invoke(state.model_dump(), config=graph_config(db, self.email_sender))
             final_state = RecruitmentState(**updated_state)
             logger.info("[approve_cv] Approval graph execution completed.")
         except Exception as e:
@@ -244,69 +602,57 @@ class RecruitmentService:
         )
         return f"CV approval result: {final_state.final_decision}"
 
-    def upload_jd(self, jd_data_list: list, db: Session):
+    def upload_jd(self, jd_data_list: Iterable[Any], db: Session) -> JDImportResponseSchema:
+        """
+        Import JDs in batches of JD_IMPORT_BATCH_SIZE. Each batch resolves the
+        content signatures already stored with one indexed IN query, then
+        inserts the new JDs with one bulk INSERT and commits. `jd_data_list`
+        may be a lazy iterable (an NDJSON stream); JDs already stored or
+        repeated in the input are skipped, invalid ones are counted.
+        """
         logger.info("Uploading JD list.")
-        for jd_data in jd_data_list:
-            jd_validated = JobDescriptionUploadSchema(**jd_data)
-            logger.debug(f"Validating JD data: {jd_validated}")
-
-            if not jd_validated.position:
-                logger.warn("JD position is empty. Skipping this JD.")
-                continue
-            if not jd_validated.skills_required:
-                logger.warn("JD skills_required is empty. Skipping this JD.")
-                continue
-            if jd_validated.experience_required is None:
-                logger.warn("JD experience_required is not set. Skipping this JD.")
-                continue
-            if not jd_validated.level:
-                logger.warn("JD level is not set. Defaulting to 'Mid'.")
-                jd_validated.level = "Mid"
-
-            normalized_skills = sorted(jd_validated.skills_required)
-            existing = (
-                db.query(JobDescription)
-                .filter_by(
-                    position=jd_validated.position,
-                    skills_required=normalized_skills,
-                    experience_required=jd_validated.experience_required,
-                    level=jd_validated.level,
-                )
-                .first()
-            )
-            if existing:
-                logger.warn(
-                    f"JD with position '{jd_validated.position}' and skills '{normalized_skills}' already exists. Skipping."
-                )
+        result = JDImportResponseSchema(message="JD uploaded successfully.")
+        seen = set()
+        records = iter(jd_data_list)
+        while batch := list(itertools.islice(records, JD_IMPORT_BATCH_SIZE)):
+            rows = {}
+            for jd_data in batch:
+                row = _jd_row(jd_data)
+                if row is None:
+                    result.invalid += 1
+                elif row["content_signature"] in seen or row["content_signature"] in rows:
+                    result.skipped += 1
+                else:
+                    rows[row["content_signature"]] = row
+            if not rows:
                 continue
+            seen.update(rows)
 
-            jd = JobDescription(
-                position=jd_validated.position,
-                skills_required=normalized_skills,
-                location=jd_validated.location,
-                datetime=jd_validated.datetime,
-                experience_required=jd_validated.experience_required,
-                level=jd_validated.level,
-                referral=jd_validated.referral,
-                referral_code=jd_validated.referral_code,
-                company_description=jd_validated.company_description,
-                job_description=jd_validated.job_description,
-                responsibilities=jd_validated.responsibilities,
-                qualifications=jd_validated.qualifications,
-                additional_information=jd_validated.additional_information,
-                hiring_manager=jd_validated.hiring_manager,
-                recruiter=jd_validated.recruiter,
-            )
-            db.add(jd)
+            existing = {
+                signature
+                for (signature,) in db.query(JobDescription.content_signature)
+                .filter(JobDescription.content_signature.in_(list(rows)))
+                .all()
+            }
+            new_rows = [row for signature, row in rows.items() if signature not in existing]
+            result.skipped += len(rows) - len(new_rows)
+            if not new_rows:
+                continue
+            try:
+                db.execute(insert(JobDescription), new_rows)
+                db.commit()
+            except SQLAlchemyError as e:
+                db.rollback()
+                logger.error(f"Error committing JD uploads: {e}")
+                result.message = "Failed to save JD to the database."
+                return result
+            result.inserted += len(new_rows)
+            jd_upload_total.inc(len(new_rows))
 
-        try:
-            db.commit()
-            jd_upload_total.inc()
-        except Exception as e:
-            logger.error(f"Error committing JD uploads: {e}")
-            return CVUploadResponseSchema(message="Failed to save JD to the database.")
-        logger.info("JD list uploaded successfully.")
-        return CVUploadResponseSchema(message="JD uploaded successfully.")
+        logger.info(
+            f"JD list uploaded: {result.inserted} inserted, {result.skipped} skipped, {result.invalid} invalid."
+        )
+        return result
 
     def schedule_interview(self, interview_data, db: Session):
         logger.info(f"Scheduling interview for {interview_data.candidate_name}.")
@@ -428,7 +774,9 @@ class RecruitmentService:
         db: Session,
         interview_date: Optional[str] = None,
         candidate_name: Optional[str] = None,
-    ):
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[dict], Optional[str]]:
         filters = []
 
         if interview_date:
@@ -449,76 +797,62 @@ class RecruitmentService:
                 InterviewSchedule.candidate_name.ilike(f"%{candidate_name}%")
             )
 
-        interviews = (
-            db.query(InterviewSchedule).filter(and_(*filters)).all()
-            if filters
-            else db.query(InterviewSchedule).all()
-        )
+        query = db.query(*InterviewSchedule.__table__.columns)
+        if filters:
+            query = query.filter(and_(*filters))
+        interviews, next_cursor = keyset_page(query, InterviewSchedule.id, cursor, limit)
         logger.info(f"Fetched {len(interviews)} interviews.")
-        return interviews
+        return [row._asdict() for row in interviews], next_cursor
 
-    def get_all_jds(self, db: Session, position: Optional[str] = None):
+    def get_all_jds(
+        self,
+        db: Session,
+        position: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[dict], Optional[str]]:
+        # Plain rows: the JD list shows every field, but skips building ORM objects
+        query = db.query(*JobDescription.__table__.columns)
         if position:
-            jds = (
-                db.query(JobDescription)
-                .filter(JobDescription.position.ilike(f"%{position}%"))
-                .all()
-            )
-        else:
-            jds = db.query(JobDescription).all()
+            query = query.filter(JobDescription.position.ilike(f"%{position}%"))
+        jds, next_cursor = keyset_page(query, JobDescription.id, cursor, limit)
 
         logger.info(f"Fetched {len(jds)} job descriptions.")
-        return jds
+        return [row._asdict() for row in jds], next_cursor
 
     def get_pending_cvs(
-        self, db: Session, candidate_name: Optional[str] = None
-    ) -> List[dict]:
-        query = db.query(CVApplication).filter_by(
-            status=FinalDecisionStatus.PENDING.value
+        self,
+        db: Session,
+        candidate_name: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[dict], Optional[str]]:
+        query = db.query(*_CV_LIST_COLUMNS).filter(
+            CVApplication.status == FinalDecisionStatus.PENDING.value
         )
         if candidate_name:
             query = query.filter(
-                CVApplication.candidate_name.ilike(f"%{candidate_name}%")
+                contains_filter(db, CVApplication.candidate_name, candidate_name)
             )
-        pending_cvs = query.all()
-        return [
-        {
-            "id": cv.id,
-            "candidate_name": cv.candidate_name,
-            "email": cv.email,
-            "position": cv.matched_position,
-            "matched_score": cv.matched_score,
-            "justification": cv.justification,
-            "status": cv.status,
-            "datetime": cv.datetime,
-        }
-        for cv in pending_cvs
-    ]
+        pending_cvs, next_cursor = keyset_page(query, CVApplication.id, cursor, limit)
+        return [cv._asdict() for cv in pending_cvs], next_cursor
 
     def get_approved_cvs(
-        self, db: Session, candidate_name: Optional[str] = None
-    ) -> List[dict]:
-        query = db.query(CVApplication).filter_by(
-            status=FinalDecisionStatus.ACCEPTED.value
+        self,
+        db: Session,
+        candidate_name: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[dict], Optional[str]]:
+        query = db.query(*_CV_LIST_COLUMNS).filter(
+            CVApplication.status == FinalDecisionStatus.ACCEPTED.value
         )
         if candidate_name:
             query = query.filter(
-                CVApplication.candidate_name.ilike(f"%{candidate_name}%")
+                contains_filter(db, CVApplication.candidate_name, candidate_name)
             )
-        approved_cvs = query.all()
-        return [
-        {
-            "id": cv.id,
-            "candidate_name": cv.candidate_name,
-            "email": cv.email,
-            "position": cv.matched_position,
-            "matched_score": cv.matched_score,
-            "justification": cv.justification,
-            "status": cv.status,
-            "datetime": cv.datetime,
-        }
-        for cv in approved_cvs
-    ]
+        approved_cvs, next_cursor = keyset_page(query, CVApplication.id, cursor, limit)
+        return [cv._asdict() for cv in approved_cvs], next_cursor
 
     def update_cv_application(self, cv_id: int, update_data: dict, db: Session):
         logger.info(f"Updating CV application ID={cv_id}")
@@ -527,10 +861,18 @@ class RecruitmentService:
             raise ValueError("CV Application not found.")
 
         for key, value in update_data.items():
-            if hasattr(cv, key):
+            if hasattr(cv, key) and key not in ("fingerprint", "active_fingerprint"):
                 setattr(cv, key, value)
+        cv.fingerprint = cv_fingerprint(cv.candidate_name, cv.email, cv.matched_position)
 
-        db.commit()
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            logger.info(f"CV application ID={cv_id} would duplicate an active application.")
+            return CVUploadResponseSchema(
+                message="Another active application has the same candidate, email and position."
+            )
         logger.info("CV application updated.")
         return CVUploadResponseSchema(message="CV application updated successfully.")
 
@@ -545,69 +887,58 @@ class RecruitmentService:
         logger.info("CV application deleted.")
         return CVUploadResponseSchema(message="CV application deleted.")
 
-    def get_cv_application_by_id(self, cv_id: int, db: Session):
-        cv = db.query(CVApplication).filter_by(id=cv_id).first()
+    def get_cv_application_by_id(self, cv_id: int, db: Session, include_parsed_cv: bool = False):
+        query = db.query(*_cv_detail_columns(include_parsed_cv)).filter(CVApplication.id == cv_id)
+        cv = query.first()
         if not cv:
             raise ValueError("CV Application not found.")
-        return {
-            "id": cv.id,
-            "candidate_name": cv.candidate_name,
-            "username": cv.username,
-            "email": cv.email,
-            "position": cv.matched_position,
-            "experience_years": cv.experience_years,
-            "skills": json.loads(cv.skills) if cv.skills else [],
-            "jd_skills": json.loads(cv.matched_jd_skills) if cv.matched_jd_skills else [],
-            "matched_score": cv.matched_score,
-            "justification": cv.justification,
-            "status": cv.status,
-            "parsed_cv": json.loads(cv.parsed_cv) if cv.parsed_cv else {},
-        }
+        return _cv_detail(cv, include_parsed_cv)
     
-    def get_cv_application_by_username(self, username: str, db: Session):
-        cvs = db.query(CVApplication).filter(CVApplication.username == username).all()
-        result = []
-        for cv in cvs:
-            result.append({
-                "id": cv.id,
-                "candidate_name": cv.candidate_name,
-                "username": cv.username,
-                "email": cv.email,
-                "position": cv.matched_position,
-                "experience_years": cv.experience_years,
-                "skills": json.loads(cv.skills) if cv.skills else [],
-                "jd_skills": json.loads(cv.matched_jd_skills) if cv.matched_jd_skills else [],
-                "matched_score": cv.matched_score,
-                "justification": cv.justification,
-                "status": cv.status,
-                "parsed_cv": json.loads(cv.parsed_cv) if cv.parsed_cv else {},
-            })
+    def get_cv_application_by_username(
+        self,
+        username: str,
+        db: Session,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        include_parsed_cv: bool = False,
+    ) -> Tuple[List[dict], Optional[str]]:
+        query = db.query(*_cv_detail_columns(include_parsed_cv)).filter(CVApplication.username == username)
+        cvs, next_cursor = keyset_page(query, CVApplication.id, cursor, limit)
+        result = [_cv_detail(cv, include_parsed_cv) for cv in cvs]
         logger.debug(f"Found {len(result)} CV(s) for username '{username}'")
-        return result
+        return result, next_cursor
 
-    def list_all_cv_applications(self, db: Session, position: Optional[str] = None):
-        if not position or position.lower() == "null":
-            query = db.query(CVApplication)
-        else:
-            query = db.query(CVApplication).filter(
-                CVApplication.matched_position.ilike(f"%{position}%")
+    def list_all_cv_applications(
+        self,
+        db: Session,
+        position: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[dict], Optional[str]]:
+        query = db.query(*_CV_LIST_COLUMNS, CVApplication.username)
+        if position and position.lower() != "null":
+            query = query.filter(
+                contains_filter(db, CVApplication.matched_position, position)
             )
-        cvs = query.all()
+        cvs, next_cursor = keyset_page(query, CVApplication.id, cursor, limit)
         logger.info(f"Fetched {len(cvs)} CV applications.")
-        return [
-        {
-            "id": cv.id,
-            "candidate_name": cv.candidate_name,
-            "username": cv.username,
-            "email": cv.email,
-            "position": cv.matched_position,
-            "matched_score": cv.matched_score,
-            "justification": cv.justification,
-            "status": cv.status,
-            "datetime": cv.datetime,
-        }
-        for cv in cvs
-    ]
+        return [cv._asdict() for cv in cvs], next_cursor
+
+    def search_cv_applications(
+        self,
+        db: Session,
+        q: str,
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[dict]:
+        """CVs whose candidate name or position match `q`, most relevant first."""
+        condition, score = relevance(db, (CVApplication.candidate_name, CVApplication.matched_position), q)
+        query = db.query(*_CV_LIST_COLUMNS, CVApplication.username, score.label("score")).filter(condition)
+        if status:
+            query = query.filter(CVApplication.status == status)
+        cvs = query.order_by(score.desc(), CVApplication.id).limit(page_size(limit)).all()
+        logger.info(f"Search '{q}' matched {len(cvs)} CV applications.")
+        return [cv._asdict() for cv in cvs]
 
     def update_interview(self, interview_id: int, update_data: dict, db: Session):
         logger.info(f"Updating interview ID={interview_id}")
@@ -636,9 +967,12 @@ class RecruitmentService:
         if not jd:
             raise ValueError("JD not found.")
         for key, value in update_data.items():
-            if hasattr(jd, key):
+            if hasattr(jd, key) and key != "content_signature":
                 setattr(jd, key, value)
+        jd.content_signature = jd_signature(jd.position, jd.skills_required, jd.experience_required, jd.level)
         db.commit()
+        # The preview path follows the content, so the next preview renders the new version
+        # and only then drops the old one, which a concurrent request may still be sending
         logger.info("JD updated.")
         return CVUploadResponseSchema(message="JD updated.")
 
@@ -648,6 +982,7 @@ class RecruitmentService:
             raise ValueError("JD not found.")
         db.delete(jd)
         db.commit()
+        invalidate_jd_preview(jd_id)
         jd_deleted_total.inc()
         logger.info("JD deleted.")
         return CVUploadResponseSchema(message="JD deleted.")
@@ -656,6 +991,7 @@ class RecruitmentService:
         logger.info("Deleting all JDs.")
         db.query(JobDescription).delete(synchronize_session=False)
         db.commit()
+        invalidate_jd_preview()
         logger.info("All JDs deleted.")
         return CVUploadResponseSchema(message="All JDs deleted.")
 
@@ -794,6 +1130,10 @@ class RecruitmentService:
                 status_code=404, detail="CV file not found on server."
             )
 
+        if not filename.lower().endswith(".pdf"):
+            file_path = self._cv_pdf_rendition(file_path, cv.id)
+            filename = os.path.splitext(filename)[0] + ".pdf"
+
         return FileResponse(
             path=file_path,
             media_type="application/pdf",
@@ -801,66 +1141,52 @@ class RecruitmentService:
             headers={"Content-Disposition": f'inline; filename="{filename}"'},
         )
 
-    def preview_jd_file(self, jd_id: int, db: Session):
+    @staticmethod
+    def _cv_pdf_rendition(file_path: str, cv_id: int) -> str:
+        """
+        CVs are stored in their original format; the PDF used for previews is
+        rendered on first request and reused until the source file changes.
+        Renditions are keyed on the CV ID, so "cv.docx" and "cv.odt" never share one.
+        """
+        os.makedirs(CV_PREVIEW_DIR, exist_ok=True)
+        pdf_path = os.path.join(CV_PREVIEW_DIR, f"cv_{cv_id}.pdf")
+        if os.path.exists(pdf_path) and os.path.getmtime(pdf_path) >= os.path.getmtime(file_path):
+            return pdf_path
+        # The converter names its output after the source, so render in a private directory
+        work_dir = tempfile.mkdtemp(dir=CV_PREVIEW_DIR)
+        try:
+            os.replace(office_convert_to_pdf(file_path, work_dir), pdf_path)
+            return pdf_path
+        except OfficeConversionError as e:
+            logger.error(f"[preview_cv_file] PDF rendition failed: {e}")
+            raise HTTPException(status_code=500, detail="Failed to render CV preview.")
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    def preview_jd_file(self, jd_id: int, db: Session, if_none_match: Optional[str] = None):
         jd = db.query(JobDescription).filter_by(id=jd_id).first()
         if not jd:
             raise HTTPException(status_code=404, detail="Job Description not found.")
 
-        output_dir = JD_PREVIEW_DIR
-        os.makedirs(output_dir, exist_ok=True)
-
         filename = f"jd_{jd.id}_{jd.position.replace(' ', '_')}.pdf"
-        output_path = os.path.join(output_dir, filename)
-
-        jd_text = f"""
-Position: {jd.position}
-Level: {jd.level}
-Experience Required: {jd.experience_required}
-
-Location: {jd.location}
-Referral Code: {jd.referral_code or ''}
-Recruiter: {jd.recruiter or ''}
-Hiring Manager: {jd.hiring_manager or ''}
-
---- Company Description ---
-{jd.company_description or ''}
-
---- Job Description ---
-{jd.job_description or ''}
-
---- Responsibilities ---
-{jd.responsibilities or ''}
-
---- Qualifications ---
-{jd.qualifications or ''}
-
---- Additional Information ---
-{jd.additional_information or ''}
-        """.strip()
-
-        txt_path = os.path.join(output_dir, filename.replace(".pdf", ".txt"))
-        with open(txt_path, "w", encoding="utf-8") as f:
-            f.write(jd_text)
+        etag = f'"{jd_preview_etag(jd)}"'
+        cache_headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+            return Response(status_code=304, headers=cache_headers)
 
         try:
-            subprocess.run(
-                ["libreoffice", "--headless", "--convert-to", "pdf", "--outdir", output_dir, txt_path],
-                check=True,
-            )
+            output_path, _ = get_jd_preview(jd)
         except Exception as e:
-            logger.error(f"[preview_jd_file] LibreOffice failed: {e}")
-            raise HTTPException(status_code=500, detail="Failed to convert JD to PDF.")
-
-        if not os.path.exists(output_path):
-            raise HTTPException(status_code=500, detail="JD PDF was not created.")
+            logger.error(f"[preview_jd_file] Rendering failed: {e}")
+            raise HTTPException(status_code=500, detail="Failed to render JD to PDF.")
 
         return FileResponse(
             path=output_path,
             media_type="application/pdf",
             filename=filename,
-            headers={"Content-Disposition": f'inline; filename="{filename}"'},
+            headers={"Content-Disposition": f'inline; filename="{filename}"', **cache_headers},
         )
-    
+
     def list_proof_images(self, cv_id: int) -> List[str]:
         folder_path = os.path.join(UPLOAD_DIR, f"cv_{cv_id}", "proofs")
         if not os.path.exists(folder_path):
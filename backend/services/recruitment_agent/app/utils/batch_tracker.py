@@ -0,0 +1,85 @@
+import time
+from typing import Any, Dict, Optional
+
+import redis
+
+from config.constants import CV_BATCH_TTL
+from config.log_config import AppLogger
+from config.redis_client import get_redis_client
+
+logger = AppLogger(__name__)
+
+# Count only into a live batch: HINCRBY on an expired one would recreate it without a total or a TTL
+_INCR_SCRIPT = """
+if redis.call('exists', KEYS[1]) == 1 then
+    return redis.call('hincrby', KEYS[1], ARGV[1], 1)
+end
+return nil
+"""
+
+
+class CVBatchTracker:
+    """
+    Progress counters of a bulk CV upload, kept in one Redis hash per batch.
+
+    The API writes `total` when the batch is enqueued; the pipeline increments
+    `processed` per CV or, once its retries are exhausted, `failed`.
+    Redis failures are logged and never fail the pipeline itself.
+    """
+
+    def __init__(self, ttl_seconds: int = CV_BATCH_TTL, client: Optional[redis.Redis] = None):
+        self.ttl_seconds = ttl_seconds
+        self._client = client
+
+    @property
+    def client(self) -> redis.Redis:
+        return self._client or get_redis_client()
+
+    @staticmethod
+    def _key(batch_id: str) -> str:
+        return f"cv_batch:{batch_id}"
+
+    def create(self, batch_id: str, total: int, skipped: int = 0) -> None:
+        try:
+            pipe = self.client.pipeline()
+            pipe.hset(self._key(batch_id), mapping={
+                "total": total,
+                "processed": 0,
+                "failed": 0,
+                "skipped": skipped,
+                "created_at": int(time.time()),
+            })
+            pipe.expire(self._key(batch_id), self.ttl_seconds)
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warn(f"[CVBatchTracker] Could not create batch {batch_id}: {e}")
+
+    def _incr(self, batch_id: str, field: str) -> None:
+        try:
+            self.client.eval(_INCR_SCRIPT, 1, self._key(batch_id), field)
+        except redis.RedisError as e:
+            logger.warn(f"[CVBatchTracker] Could not update '{field}' of batch {batch_id}: {e}")
+
+    def mark_processed(self, batch_id: str) -> None:
+        self._incr(batch_id, "processed")
+
+    def mark_failed(self, batch_id: str) -> None:
+        self._incr(batch_id, "failed")
+
+    def status(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        """Counters of the batch, or None when it is unknown or expired. Redis errors are raised."""
+        raw = self.client.hgetall(self._key(batch_id))
+        if b"total" not in raw:
+            return None
+        counters = {key.decode(): int(value) for key, value in raw.items()}
+        total = counters.get("total", 0)
+        processed = counters.get("processed", 0)
+        failed = counters.get("failed", 0)
+        return {
+            "batch_id": batch_id,
+            "total": total,
+            "processed": processed,
+            "failed": failed,
+            "pending": max(0, total - processed - failed),
+            "skipped": counters.get("skipped", 0),
+        }
@@ -0,0 +1,82 @@
+import json
+import time
+from typing import Any, Optional
+
+import redis
+
+from config.log_config import AppLogger
+from config.redis_client import get_redis_client
+
+logger = AppLogger(__name__)
+
+
+class RedisCache:
+    """
+    JSON cache stored in Redis with a per-entry TTL and a size bound.
+
+    Entries are tracked in a sorted set ordered by write time; once the
+    namespace holds more than `max_entries` keys the oldest ones are evicted.
+    Redis failures are logged and treated as cache misses.
+    """
+
+    def __init__(self, namespace: str, ttl_seconds: int, max_entries: int, client: Optional[redis.Redis] = None):
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._client = client
+
+    @property
+    def client(self) -> redis.Redis:
+        return self._client or get_redis_client()
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    @property
+    def _index_key(self) -> str:
+        return f"{self.namespace}:__index__"
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            raw = self.client.get(self._key(key))
+        except redis.RedisError as e:
+            logger.warn(f"[cache:{self.namespace}] get failed: {e}")
+            return None
+        if raw is None:
+            return None
+        try:
+            return json.loads(raw)
+        except ValueError:
+            logger.warn(f"[cache:{self.namespace}] dropping undecodable entry {key}")
+            self.delete(key)
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        full_key = self._key(key)
+        try:
+            pipe = self.client.pipeline()
+            pipe.set(full_key, json.dumps(value, ensure_ascii=False), ex=self.ttl_seconds)
+            pipe.zadd(self._index_key, {full_key: time.time()})
+            pipe.zcard(self._index_key)
+            size = pipe.execute()[-1]
+            if self.max_entries and size > self.max_entries:
+                self._evict(size - self.max_entries)
+        except redis.RedisError as e:
+            logger.warn(f"[cache:{self.namespace}] set failed: {e}")
+
+    def delete(self, key: str) -> None:
+        full_key = self._key(key)
+        try:
+            pipe = self.client.pipeline()
+            pipe.delete(full_key)
+            pipe.zrem(self._index_key, full_key)
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warn(f"[cache:{self.namespace}] delete failed: {e}")
+
+    def _evict(self, count: int) -> None:
+        oldest = self.client.zpopmin(self._index_key, count)
+        keys = [member for member, _ in oldest]
+        if keys:
+            self.client.delete(*keys)
+            logger.debug(f"[cache:{self.namespace}] evicted {len(keys)} entries")
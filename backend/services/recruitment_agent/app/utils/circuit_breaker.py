@@ -0,0 +1,84 @@
+import threading
+import time
+from typing import Callable, Optional
+
+from config.log_config import AppLogger
+
+logger = AppLogger(__name__)
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker.
+
+    CLOSED: requests flow, consecutive failures are counted.
+    OPEN: requests are rejected until `reset_timeout` seconds have passed.
+    HALF_OPEN: a single probe request is allowed; success closes the circuit,
+    failure opens it again.
+    """
+
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int,
+        reset_timeout: float,
+        on_state_change: Optional[Callable[[str], None]] = None,
+    ):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.on_state_change = on_state_change
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self._set_state(self.HALF_OPEN)
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._probe_in_flight = False
+            if self._state != self.CLOSED:
+                self._set_state(self.CLOSED)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+                if self._state != self.OPEN:
+                    self._set_state(self.OPEN)
+
+    def release(self) -> None:
+        """End an admitted request that neither succeeded nor failed, e.g. a cancelled probe."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def _set_state(self, state: str) -> None:
+        logger.warn(f"[CircuitBreaker:{self.name}] {self._state} -> {state}")
+        self._state = state
+        if self.on_state_change:
+            self.on_state_change(state)
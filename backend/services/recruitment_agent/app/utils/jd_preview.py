@@ -0,0 +1,118 @@
+import glob
+import hashlib
+import html
+import os
+import tempfile
+from typing import Optional, Tuple
+
+import fitz
+
+from config.constants import JD_PREVIEW_DIR
+from config.log_config import AppLogger
+from metrics.prometheus_metrics import jd_preview_cache_hits_total, jd_preview_renders_total
+
+logger = AppLogger(__name__)
+
+# Bump when the preview layout changes so cached PDFs are re-rendered
+PREVIEW_VERSION = "v1"
+
+_PAGE = fitz.paper_rect("a4")
+_CONTENT = _PAGE + (50, 50, -50, -50)
+
+
+def jd_preview_text(jd) -> str:
+    return f"""
+Position: {jd.position}
+Level: {jd.level}
+Experience Required: {jd.experience_required}
+
+Location: {jd.location}
+Referral Code: {jd.referral_code or ''}
+Recruiter: {jd.recruiter or ''}
+Hiring Manager: {jd.hiring_manager or ''}
+
+--- Company Description ---
+{jd.company_description or ''}
+
+--- Job Description ---
+{jd.job_description or ''}
+
+--- Responsibilities ---
+{jd.responsibilities or ''}
+
+--- Qualifications ---
+{jd.qualifications or ''}
+
+--- Additional Information ---
+{jd.additional_information or ''}
+    """.strip()
+
+
+def jd_preview_etag(jd) -> str:
+    """Content hash of everything shown in the preview; changes whenever the JD does."""
+    digest = hashlib.sha256(f"{PREVIEW_VERSION}\n{jd_preview_text(jd)}".encode("utf-8")).hexdigest()
+    return digest[:32]
+
+
+def _preview_path(jd_id: int, etag: str) -> str:
+    return os.path.join(JD_PREVIEW_DIR, f"jd_{jd_id}_{etag}.pdf")
+
+
+def _to_html(text: str) -> str:
+    blocks = []
+    for line in text.split("\n"):
+        if line.startswith("---") and line.endswith("---"):
+            blocks.append(f"<h3>{html.escape(line.strip('- '))}</h3>")
+        else:
+            blocks.append(f"<p>{html.escape(line) or '&nbsp;'}</p>")
+    return f'<body style="font-family: sans-serif; font-size: 11pt">{"".join(blocks)}</body>'
+
+
+def render_pdf(text: str, output_path: str) -> None:
+    """Lay out plain text on A4 pages with PyMuPDF and write it atomically."""
+    # One temp file per call: requests of the same process render in threads
+    fd, tmp_path = tempfile.mkstemp(suffix=".tmp", prefix=f"{os.path.basename(output_path)}.", dir=os.path.dirname(output_path))
+    os.close(fd)
+    try:
+        story = fitz.Story(html=_to_html(text))
+        writer = fitz.DocumentWriter(tmp_path)
+        more = True
+        while more:
+            device = writer.begin_page(_PAGE)
+            more, _ = story.place(_CONTENT)
+            story.draw(device)
+            writer.end_page()
+        writer.close()
+        os.replace(tmp_path, output_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def get_jd_preview(jd) -> Tuple[str, str]:
+    """Return (pdf_path, etag) for the JD, rendering it only when its content changed."""
+    etag = jd_preview_etag(jd)
+    path = _preview_path(jd.id, etag)
+    if os.path.exists(path):
+        jd_preview_cache_hits_total.inc()
+        return path, etag
+
+    os.makedirs(JD_PREVIEW_DIR, exist_ok=True)
+    render_pdf(jd_preview_text(jd), path)
+    # Only once the new version is in place; a request may still be sending an old one
+    invalidate_jd_preview(jd.id, keep=path)
+    jd_preview_renders_total.inc()
+    logger.info(f"[jd_preview] Rendered preview for JD ID={jd.id}")
+    return path, etag
+
+
+def invalidate_jd_preview(jd_id=None, keep: Optional[str] = None) -> None:
+    """Remove cached previews of one JD, or of every JD when jd_id is None, except `keep`."""
+    pattern = f"jd_{jd_id}_*.pdf" if jd_id is not None else "jd_*.pdf"
+    for path in glob.glob(os.path.join(JD_PREVIEW_DIR, pattern)):
+        if path == keep:
+            continue
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
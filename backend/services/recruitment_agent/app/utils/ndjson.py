@@ -0,0 +1,32 @@
+from typing import IO, Any, Iterator, Optional
+
+import orjson
+
+from config.log_config import AppLogger
+
+logger = AppLogger(__name__)
+
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl", "application/x-jsonlines")
+NDJSON_EXTENSIONS = (".ndjson", ".jsonl")
+
+
+def is_ndjson(filename: Optional[str], content_type: Optional[str]) -> bool:
+    return (content_type or "").split(";")[0].strip() in NDJSON_MEDIA_TYPES or (filename or "").lower().endswith(
+        NDJSON_EXTENSIONS
+    )
+
+
+def iter_ndjson(stream: IO[bytes]) -> Iterator[Optional[Any]]:
+    """
+    One JSON value per non-blank line, read as the stream is consumed so a
+    large file is never held in memory. A line that is not valid JSON is
+    logged and yields None.
+    """
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield orjson.loads(line)
+        except orjson.JSONDecodeError as e:
+            logger.warn(f"[NDJSON] Line {line_number} is not valid JSON: {e}")
+            yield None
@@ -0,0 +1,135 @@
+import os
+import shutil
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Iterator, Optional
+
+import fitz
+
+from config.constants import *
+from config.log_config import AppLogger
+from metrics.prometheus_metrics import cv_ocr_fallback_total, ocr_duration_seconds, ocr_page_failures_total
+from utils.cache import RedisCache
+from utils.utils import file_sha256
+
+logger = AppLogger(__name__)
+
+# Bump when rendering or Tesseract options change so cached OCR text is not reused
+OCR_VERSION = "v1"
+
+_ocr_cache: Optional[RedisCache] = None
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_pid: Optional[int] = None
+_executor_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def tesseract_available() -> bool:
+    available = shutil.which(OCR_TESSERACT_BINARY) is not None
+    if not available:
+        logger.warn(f"[ocr] {OCR_TESSERACT_BINARY} not found, OCR fallback disabled")
+    return available
+
+
+def _get_ocr_cache() -> RedisCache:
+    global _ocr_cache
+    if _ocr_cache is None:
+        _ocr_cache = RedisCache("cv_ocr", OCR_CACHE_TTL, OCR_CACHE_MAX_ENTRIES)
+    return _ocr_cache
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """
+    Each thread drives one tesseract process, so the executor bounds how many
+    run at once in this process. Plain subprocesses also work in daemonic
+    Celery children, where a multiprocessing pool cannot be started.
+    """
+    global _executor, _executor_pid
+    if _executor is None or _executor_pid != os.getpid():
+        with _executor_lock:
+            if _executor is None or _executor_pid != os.getpid():
+                _executor = ThreadPoolExecutor(max_workers=max(1, OCR_WORKERS), thread_name_prefix="ocr")
+                _executor_pid = os.getpid()
+    return _executor
+
+
+def text_density(text: str, page_count: int) -> float:
+    """Non-whitespace characters per page."""
+    return len("".join(text.split())) / max(1, page_count)
+
+
+def needs_ocr(text: str, page_count: int) -> bool:
+    return OCR_ENABLED and page_count > 0 and text_density(text, page_count) < OCR_MIN_CHARS_PER_PAGE
+
+
+def _render_pages(file_path: str, page_count: int) -> Iterator[bytes]:
+    with fitz.open(file_path) as doc:
+        for i in range(page_count):
+            yield doc[i].get_pixmap(dpi=OCR_DPI, colorspace=fitz.csGRAY).tobytes("png")
+
+
+def _tesseract(png: bytes, page_index: int) -> Optional[str]:
+    """OCR one rendered page; None when Tesseract failed or timed out."""
+    try:
+        result = subprocess.run(
+            [OCR_TESSERACT_BINARY, "stdin", "stdout", "-l", OCR_LANG, "--psm", "3"],
+            input=png,
+            capture_output=True,
+            timeout=OCR_PAGE_TIMEOUT,
+            check=True,
+            # One thread per process; concurrency comes from the executor
+            env={**os.environ, "OMP_THREAD_LIMIT": "1"},
+        )
+    except subprocess.TimeoutExpired:
+        ocr_page_failures_total.labels(reason="timeout").inc()
+        logger.warn(f"[ocr] page {page_index} timed out after {OCR_PAGE_TIMEOUT}s")
+        return None
+    except (subprocess.CalledProcessError, OSError) as e:
+        ocr_page_failures_total.labels(reason="error").inc()
+        logger.warn(f"[ocr] page {page_index} failed: {e}")
+        return None
+    return result.stdout.decode("utf-8", errors="ignore")
+
+
+def ocr_pdf(file_path: str, page_count: int) -> str:
+    """
+    OCR the first `page_count` pages (at most OCR_MAX_PAGES). Complete
+    results are cached on the file's SHA-256, so retries and re-matches
+    of the same scan do not run Tesseract again.
+    """
+    page_count = min(page_count, OCR_MAX_PAGES)
+    cache = _get_ocr_cache()
+    cache_key = f"{file_sha256(file_path)}:{OCR_VERSION}:{OCR_LANG}:{OCR_DPI}:{page_count}"
+    cached = cache.get(cache_key)
+    if isinstance(cached, str):
+        logger.debug(f"[ocr] cache hit for {file_path}")
+        return cached
+
+    cv_ocr_fallback_total.inc()
+    start = time.perf_counter()
+    executor = _get_executor()
+    # Pages are rendered here while earlier ones are already being read
+    futures = [
+        executor.submit(_tesseract, png, i)
+        for i, png in enumerate(_render_pages(file_path, page_count))
+    ]
+    pages = [f.result() for f in futures]
+    ocr_duration_seconds.observe(time.perf_counter() - start)
+
+    text = "\n".join(page or "" for page in pages)
+    if all(page is not None for page in pages):
+        cache.set(cache_key, text)
+    logger.info(f"[ocr] {file_path}: {page_count} pages, {len(text)} chars in {time.perf_counter() - start:.1f}s")
+    return text
+
+
+def ocr_fallback(file_path: str, text: str, page_count: int) -> str:
+    """Return OCR text for sparse (scanned) PDFs, the extracted text otherwise."""
+    if not needs_ocr(text, page_count) or not tesseract_available():
+        return text
+    logger.info(f"[ocr] low text density ({text_density(text, page_count):.0f} chars/page) in {file_path}")
+    ocr_text = ocr_pdf(file_path, page_count)
+    return ocr_text if len(ocr_text.strip()) > len(text.strip()) else text
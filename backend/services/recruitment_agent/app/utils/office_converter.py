@@ -0,0 +1,298 @@
+import atexit
+import importlib.util
+import os
+import queue
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+from typing import List, Optional
+from xmlrpc.client import ServerProxy
+
+from config.constants import *
+from config.log_config import AppLogger
+from metrics.prometheus_metrics import (
+    office_conversion_duration_seconds,
+    office_converter_rejections_total,
+    office_worker_restarts_total,
+)
+
+logger = AppLogger(__name__)
+
+
+class OfficeConversionError(RuntimeError):
+    """Raised when a document cannot be converted to PDF."""
+
+
+class OfficeConverterBusyError(OfficeConversionError):
+    """Raised when the converter queue is full or no worker freed up in time."""
+
+
+def _expected_pdf_path(src_path: str, out_dir: str) -> str:
+    return os.path.join(out_dir, os.path.splitext(os.path.basename(src_path))[0] + ".pdf")
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _unoserver_path() -> Optional[str]:
+    """Directory holding the unoserver package, added to the server interpreter's path."""
+    spec = importlib.util.find_spec("unoserver")
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    return os.path.dirname(list(spec.submodule_search_locations)[0])
+
+
+def convert_with_cli(src_path: str, out_dir: str, timeout: float = OFFICE_CONVERSION_TIMEOUT) -> str:
+    """
+    Cold `libreoffice --convert-to pdf` run. A throwaway profile keeps
+    concurrent runs from fighting over the same user installation.
+    """
+    profile_dir = tempfile.mkdtemp(prefix="lo-profile-")
+    try:
+        subprocess.run(
+            [
+                OFFICE_BINARY,
+                f"-env:UserInstallation=file://{profile_dir}",
+                "--headless",
+                "--convert-to",
+                "pdf",
+                "--outdir",
+                out_dir,
+                src_path,
+            ],
+            check=True,
+            timeout=timeout,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+    except (subprocess.SubprocessError, OSError) as e:
+        raise OfficeConversionError(f"LibreOffice conversion failed for {src_path}: {e}") from e
+    finally:
+        shutil.rmtree(profile_dir, ignore_errors=True)
+
+    pdf_path = _expected_pdf_path(src_path, out_dir)
+    if not os.path.exists(pdf_path):
+        raise OfficeConversionError(f"LibreOffice did not produce {pdf_path}")
+    return pdf_path
+
+
+class _OfficeWorker:
+    """One long-lived unoserver (XML-RPC front + headless LibreOffice) with its own profile."""
+
+    def __init__(self, index: int, profile_root: str):
+        self.index = index
+        self.profile_dir = os.path.join(profile_root, f"{os.getpid()}-{index}")
+        self.port: Optional[int] = None
+        self.process: Optional[subprocess.Popen] = None
+        self.conversions = 0
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    def _proxy(self) -> ServerProxy:
+        return ServerProxy(f"http://127.0.0.1:{self.port}", allow_none=True)
+
+    def start(self) -> None:
+        self.port = _free_port()
+        env = dict(os.environ)
+        unoserver_path = _unoserver_path()
+        if unoserver_path:
+            env["PYTHONPATH"] = unoserver_path
+        os.makedirs(self.profile_dir, exist_ok=True)
+
+        self.process = subprocess.Popen(
+            [
+                UNOSERVER_PYTHON, "-m", "unoserver.server",
+                "--interface", "127.0.0.1",
+                "--port", str(self.port),
+                "--uno-port", str(_free_port()),
+                "--user-installation", self.profile_dir,
+                "--conversion-timeout", str(int(OFFICE_CONVERSION_TIMEOUT)),
+                "--executable", shutil.which(OFFICE_BINARY) or OFFICE_BINARY,
+                "--quiet",
+            ],
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        self.conversions = 0
+
+        deadline = time.monotonic() + OFFICE_STARTUP_TIMEOUT
+        while time.monotonic() < deadline:
+            if not self.alive:
+                raise OfficeConversionError(f"unoserver worker {self.index} exited during startup")
+            try:
+                self._proxy().info()
+                logger.info(f"[OfficeConverter] Worker {self.index} ready on port {self.port} (pid={self.process.pid})")
+                return
+            except OSError:
+                time.sleep(0.25)
+        self.stop()
+        raise OfficeConversionError(f"unoserver worker {self.index} not ready after {OFFICE_STARTUP_TIMEOUT}s")
+
+    def stop(self) -> None:
+        if self.process is not None and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+        self.process = None
+        shutil.rmtree(self.profile_dir, ignore_errors=True)
+
+    def restart(self, reason: str) -> None:
+        logger.warn(f"[OfficeConverter] Restarting worker {self.index}: {reason}")
+        office_worker_restarts_total.labels(reason=reason).inc()
+        self.stop()
+        self.start()
+
+    def convert(self, src_path: str, pdf_path: str) -> None:
+        from unoserver.client import UnoClient
+
+        UnoClient(server="127.0.0.1", port=str(self.port), host_location="local").convert(
+            inpath=src_path, outpath=pdf_path, convert_to="pdf"
+        )
+        self.conversions += 1
+
+
+class OfficeConverterPool:
+    """
+    Pool of long-lived headless LibreOffice converters.
+
+    At most `size` conversions run at once and at most `max_queue` callers wait
+    for a free worker; anything beyond that is rejected immediately. Dead
+    workers are restarted before use, a worker whose conversion failed is
+    stopped and started again on its next checkout, and every worker is
+    recycled after `recycle_after` conversions.
+    """
+
+    def __init__(
+        self,
+        size: int = OFFICE_POOL_SIZE,
+        max_queue: int = OFFICE_POOL_MAX_QUEUE,
+        acquire_timeout: float = OFFICE_ACQUIRE_TIMEOUT,
+        recycle_after: int = OFFICE_WORKER_RECYCLE_AFTER,
+        profile_root: str = OFFICE_PROFILE_ROOT,
+    ):
+        self.size = max(1, size)
+        self.acquire_timeout = acquire_timeout
+        self.recycle_after = recycle_after
+        self._slots = threading.BoundedSemaphore(self.size + max(0, max_queue))
+        self._idle: "queue.Queue[_OfficeWorker]" = queue.Queue()
+        self._workers: List[_OfficeWorker] = [_OfficeWorker(i, profile_root) for i in range(self.size)]
+        for worker in self._workers:
+            # Workers start lazily on first use
+            self._idle.put(worker)
+
+    def _checkout(self) -> _OfficeWorker:
+        try:
+            return self._idle.get(timeout=self.acquire_timeout)
+        except queue.Empty:
+            office_converter_rejections_total.inc()
+            raise OfficeConverterBusyError(f"No office converter available after {self.acquire_timeout}s")
+
+    def _ensure_healthy(self, worker: _OfficeWorker) -> None:
+        if worker.process is None:
+            worker.start()
+        elif not worker.alive:
+            worker.restart("dead")
+        elif self.recycle_after and worker.conversions >= self.recycle_after:
+            worker.restart("recycle")
+
+    def convert_to_pdf(self, src_path: str, out_dir: str) -> str:
+        if not self._slots.acquire(blocking=False):
+            office_converter_rejections_total.inc()
+            raise OfficeConverterBusyError("Office converter queue is full")
+        try:
+            worker = self._checkout()
+            try:
+                try:
+                    self._ensure_healthy(worker)
+                except OfficeConversionError:
+                    worker.stop()
+                    raise
+                pdf_path = _expected_pdf_path(src_path, out_dir)
+                try:
+                    worker.convert(src_path, pdf_path)
+                except Exception as e:
+                    # Started again on next checkout
+                    office_worker_restarts_total.labels(reason="error").inc()
+                    worker.stop()
+                    raise OfficeConversionError(f"Conversion failed for {src_path}: {e}") from e
+            finally:
+                self._idle.put(worker)
+        finally:
+            self._slots.release()
+
+        if not os.path.exists(pdf_path):
+            raise OfficeConversionError(f"Converter did not produce {pdf_path}")
+        return pdf_path
+
+    def close(self) -> None:
+        for worker in self._workers:
+            worker.stop()
+
+
+_pool: Optional[OfficeConverterPool] = None
+_pool_pid: Optional[int] = None
+_pool_lock = threading.Lock()
+
+
+def get_office_converter_pool() -> OfficeConverterPool:
+    """Process-wide pool; forked children (Celery prefork) get their own workers."""
+    global _pool, _pool_pid
+    if _pool is None or _pool_pid != os.getpid():
+        with _pool_lock:
+            if _pool is None or _pool_pid != os.getpid():
+                _pool = OfficeConverterPool()
+                _pool_pid = os.getpid()
+    return _pool
+
+
+def close_office_converter_pool() -> None:
+    """
+    Stop the unoserver workers started by this process so they do not outlive it.
+    Runs at interpreter exit and, for Celery prefork children (which skip atexit), on
+    worker_process_shutdown.
+    """
+    global _pool
+    with _pool_lock:
+        pool, owned = _pool, _pool_pid == os.getpid()
+        _pool = None
+    # A pool inherited through fork belongs to the parent
+    if pool is not None and owned:
+        pool.close()
+
+
+atexit.register(close_office_converter_pool)
+
+
+def convert_to_pdf(src_path: str, out_dir: Optional[str] = None) -> str:
+    """
+    Convert an office/text document to PDF and return the PDF path.
+    Uses the converter pool when OFFICE_CONVERTER_MODE is "pool" and falls back
+    to a cold LibreOffice run if the pool cannot start a worker.
+    """
+    out_dir = out_dir or os.path.dirname(os.path.abspath(src_path))
+    start = time.perf_counter()
+    mode = OFFICE_CONVERTER_MODE
+    try:
+        if mode == "pool":
+            try:
+                return get_office_converter_pool().convert_to_pdf(src_path, out_dir)
+            except OfficeConverterBusyError:
+                raise
+            except OfficeConversionError as e:
+                logger.error(f"[OfficeConverter] Pool conversion failed, falling back to CLI: {e}")
+                mode = "cli"
+        return convert_with_cli(src_path, out_dir)
+    finally:
+        office_conversion_duration_seconds.labels(mode=mode).observe(time.perf_counter() - start)
@@ -0,0 +1,56 @@
+import base64
+import binascii
+import json
+from typing import Any, List, Optional, Tuple
+
+from fastapi import HTTPException
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import Query
+
+from config.constants import LIST_PAGE_SIZE, LIST_PAGE_SIZE_MAX
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(last_id: int) -> str:
+    """Opaque token of the last row returned, so the sort key can change without breaking clients."""
+    return base64.urlsafe_b64encode(json.dumps({"id": last_id}).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[int]:
+    if not cursor:
+        return None
+    try:
+        return int(json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))["id"])
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+
+
+def page_size(limit: Optional[int]) -> int:
+    return max(1, min(limit or LIST_PAGE_SIZE, LIST_PAGE_SIZE_MAX))
+
+
+def keyset_page(query: Query, id_column, cursor: Optional[str], limit: Optional[int]) -> Tuple[List[Any], Optional[str]]:
+    """
+    One page of `query` ordered by `id_column`, starting after `cursor`, and the
+    cursor of the next page (None on the last one). The rows must expose `id`.
+    Seeking on the primary key keeps every page as cheap as the first.
+    """
+    size = page_size(limit)
+    after = decode_cursor(cursor)
+    if after is not None:
+        query = query.filter(id_column > after)
+    rows = query.order_by(id_column).limit(size + 1).all()
+    if len(rows) <= size:
+        return rows, None
+    return rows[:size], encode_cursor(rows[size - 1].id)
+
+
+def page_response(items: List[Any], next_cursor: Optional[str]) -> ORJSONResponse:
+    """
+    A page of plain rows, encoded by orjson as is. Returning the response
+    skips FastAPI's jsonable_encoder and response_model validation, which
+    cost far more than the encoding itself; see benchmarks/bench_serialization.py.
+    """
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+    return ORJSONResponse(items, headers=headers)
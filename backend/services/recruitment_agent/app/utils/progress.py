@@ -0,0 +1,177 @@
+import asyncio
+import json
+import os
+import time
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Optional, Tuple
+
+import redis
+
+from config.constants import *
+from config.log_config import AppLogger
+from config.redis_client import get_async_redis_client, get_redis_client
+from metrics.prometheus_metrics import cv_progress_streams
+from utils.batch_tracker import CVBatchTracker
+
+logger = AppLogger(__name__)
+
+# Last event of a single CV; a task stream closes after it
+TERMINAL_STAGES = frozenset({"stored", "rejected", "failed", "duplicate"})
+
+# Number the event, keep it in the task's history and publish it in one step,
+# so a subscriber reading the history after subscribing can drop repeats by seq
+_PUBLISH_SCRIPT = """
+local seq = redis.call('incr', KEYS[1])
+local event = '{"seq": ' .. seq .. ', ' .. string.sub(ARGV[1], 2)
+redis.call('rpush', KEYS[2], event)
+redis.call('ltrim', KEYS[2], -tonumber(ARGV[2]), -1)
+redis.call('expire', KEYS[1], ARGV[3])
+redis.call('expire', KEYS[2], ARGV[3])
+redis.call('publish', KEYS[3], event)
+return seq
+"""
+
+
+def progress_ids(upload_id: Optional[str], batch_id: Optional[str] = None) -> Tuple[str, ...]:
+    """IDs a CV's events are published under: its task ID, and its batch ID for bulk uploads."""
+    return tuple(i for i in (upload_id, batch_id) if i)
+
+
+class CVProgressPublisher:
+    """
+    Per-stage progress events of CV processing (parsed, matched, stored,
+    rejected, ...), published on one Redis channel per task or batch ID.
+
+    Each event is also appended to a short history list with a per-ID
+    sequence number, so a client subscribing after the CV was parsed still
+    sees every event, and a reconnecting one resumes from its Last-Event-ID.
+    Redis failures are logged and never fail the pipeline itself.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = CV_PROGRESS_TTL,
+        history: int = CV_PROGRESS_HISTORY,
+        client: Optional[redis.Redis] = None,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.history = history
+        self._client = client
+
+    @property
+    def client(self) -> redis.Redis:
+        return self._client or get_redis_client()
+
+    @staticmethod
+    def channel(progress_id: str) -> str:
+        return f"cv_progress:{progress_id}"
+
+    @staticmethod
+    def history_key(progress_id: str) -> str:
+        return f"cv_progress_log:{progress_id}"
+
+    @staticmethod
+    def _seq_key(progress_id: str) -> str:
+        return f"cv_progress_seq:{progress_id}"
+
+    def publish(self, ids: Iterable[str], stage: str, cv_file_path: Optional[str] = None, **details) -> None:
+        """Publish one event under every ID in `ids`; the first one is the CV's task ID."""
+        ids = [i for i in ids if i]
+        if not CV_PROGRESS_ENABLED or not ids:
+            return
+        event = {"stage": stage, "task_id": ids[0]}
+        if cv_file_path:
+            event["cv_file_name"] = os.path.basename(cv_file_path)
+        event.update(details)
+        event["ts"] = round(time.time(), 3)
+        payload = json.dumps(event, default=str)
+        for progress_id in ids:
+            try:
+                self.client.eval(
+                    _PUBLISH_SCRIPT, 3,
+                    self._seq_key(progress_id), self.history_key(progress_id), self.channel(progress_id),
+                    payload, self.history, self.ttl_seconds,
+                )
+            except redis.RedisError as e:
+                logger.warn(f"[CVProgress] Could not publish '{stage}' for {progress_id}: {e}")
+
+
+def _sse(event: dict) -> str:
+    return f"id: {event['seq']}\nevent: {event['stage']}\ndata: {json.dumps(event)}\n\n"
+
+
+async def stream_progress(
+    progress_id: str,
+    last_event_id: int = 0,
+    is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None,
+) -> AsyncIterator[str]:
+    """
+    Server-Sent Events for a task or batch ID: the stored history after
+    `last_event_id`, then live events until the CV reaches a terminal stage
+    (for a batch: until no CV is pending), the client leaves, or
+    CV_PROGRESS_STREAM_TIMEOUT passes. Comments keep idle connections open.
+    """
+    client = get_async_redis_client()
+    batch_tracker = CVBatchTracker()
+    is_batch = False
+    last_seq = last_event_id
+    pubsub = client.pubsub()
+    cv_progress_streams.inc()
+
+    def fresh(raw) -> Optional[dict]:
+        nonlocal last_seq
+        event = json.loads(raw)
+        if event["seq"] <= last_seq:
+            return None
+        last_seq = event["seq"]
+        return event
+
+    try:
+        is_batch = await asyncio.to_thread(batch_tracker.status, progress_id) is not None
+        # Subscribe before reading the history so no event falls in between
+        await pubsub.subscribe(CVProgressPublisher.channel(progress_id))
+        yield "retry: 3000\n\n"
+        for raw in await client.lrange(CVProgressPublisher.history_key(progress_id), 0, -1):
+            event = fresh(raw)
+            if event:
+                yield _sse(event)
+                if not is_batch and event["stage"] in TERMINAL_STAGES:
+                    return
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + CV_PROGRESS_STREAM_TIMEOUT
+        next_keepalive = loop.time() + CV_PROGRESS_KEEPALIVE
+        check_batch = is_batch
+        while loop.time() < deadline:
+            if is_disconnected is not None and await is_disconnected():
+                return
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+            if message is not None:
+                event = fresh(message["data"])
+                if event:
+                    yield _sse(event)
+                    if event["stage"] in TERMINAL_STAGES:
+                        if not is_batch:
+                            return
+                        check_batch = True
+                continue
+
+            # Idle: batch counters are updated right after a CV's last event
+            if check_batch:
+                check_batch = False
+                status = await asyncio.to_thread(batch_tracker.status, progress_id)
+                if status is None or status["pending"] == 0:
+                    yield f"event: completed\ndata: {json.dumps(status or {'batch_id': progress_id})}\n\n"
+                    return
+            if loop.time() >= next_keepalive:
+                next_keepalive = loop.time() + CV_PROGRESS_KEEPALIVE
+                check_batch = is_batch
+                yield ": keepalive\n\n"
+    except redis.RedisError as e:
+        logger.warn(f"[CVProgress] Stream for {progress_id} interrupted: {e}")
+        yield f"event: error\ndata: {json.dumps({'detail': 'Progress events are unavailable.'})}\n\n"
+    finally:
+        cv_progress_streams.dec()
+        try:
+            await pubsub.aclose()
+        except redis.RedisError:
+            pass
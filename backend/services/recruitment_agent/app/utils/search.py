@@ -0,0 +1,75 @@
+import re
+from functools import lru_cache
+from typing import List
+
+from sqlalchemy import and_, literal, or_
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from config.constants import SEARCH_FULLTEXT_ENABLED, SEARCH_NGRAM_TOKEN_SIZE
+from config.log_config import AppLogger
+
+logger = AppLogger(__name__)
+
+# Characters with a meaning in MySQL boolean full-text queries
+_BOOLEAN_OPERATORS = re.compile(r'[+\-<>()~*"@]')
+
+
+def search_terms(text: str) -> List[str]:
+    return _BOOLEAN_OPERATORS.sub(" ", text or "").split()
+
+
+@lru_cache(maxsize=None)
+def _fulltext_indexes_built(engine: Engine) -> bool:
+    # Built offline (python -m config.migrations); processes started before that keep ILIKE
+    from config.migrations import missing_fulltext_indexes
+
+    with engine.connect() as conn:
+        missing = missing_fulltext_indexes(conn)
+    if missing:
+        logger.warn(f"[search] FULLTEXT indexes {missing} not built yet, searching with ILIKE")
+    return not missing
+
+
+def fulltext_enabled(db: Session) -> bool:
+    bind = db.get_bind()
+    return SEARCH_FULLTEXT_ENABLED and bind.dialect.name == "mysql" and _fulltext_indexes_built(bind)
+
+
+def _indexable(terms: List[str]) -> List[str]:
+    # The ngram index holds no token shorter than ngram_token_size
+    return [term for term in terms if len(term) >= SEARCH_NGRAM_TOKEN_SIZE]
+
+
+def contains_filter(db: Session, column, text: str):
+    """
+    Rows whose `column` matches ILIKE '%text%', on every database. On MySQL a
+    boolean MATCH on the column's n-gram FULLTEXT index first narrows the
+    rows the ILIKE is checked on, instead of a full scan. Every row
+    containing `text` contains each of its words as a run of n-grams, so the
+    MATCH never drops a row the ILIKE keeps: mid-word matches and words
+    shorter than an n-gram (not looked up in the index) behave as before.
+    """
+    substring = column.ilike(f"%{text}%")
+    indexed = _indexable(search_terms(text))
+    if not fulltext_enabled(db) or not indexed:
+        return substring
+    # Each quoted word is an n-gram phrase: it matches as a substring
+    return and_(match(column, against=" ".join(f'+"{term}"' for term in indexed)).in_boolean_mode(), substring)
+
+
+def relevance(db: Session, columns, text: str):
+    """
+    (filter, score) for a ranked search over `columns`. On MySQL the score is
+    the natural-language MATCH relevance over shared n-grams, so partial
+    words and small typos still match; elsewhere every word must be
+    contained in one of the columns and the score is constant.
+    """
+    terms = search_terms(text)
+    indexed = _indexable(terms)
+    if fulltext_enabled(db) and indexed:
+        score = match(*columns, against=" ".join(indexed)).in_natural_language_mode()
+        return score, score
+    condition = and_(*(or_(*(column.ilike(f"%{term}%") for column in columns)) for term in terms or [text]))
+    return condition, literal(1.0)
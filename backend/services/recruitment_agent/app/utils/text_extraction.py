@@ -0,0 +1,247 @@
+import os
+import re
+import tempfile
+import zipfile
+import xml.etree.ElementTree as ET
+from typing import Callable, Dict, Iterable, List, Optional
+
+import fitz
+
+from config.constants import CV_TEXT_CACHE_ENABLED, CV_TEXT_CACHE_MAX_ENTRIES, CV_TEXT_CACHE_TTL, PDF_MAX_PAGES
+from config.log_config import AppLogger
+from metrics.prometheus_metrics import cv_text_cache_hits_total, cv_text_cache_misses_total
+from utils.cache import RedisCache
+from utils.ocr import ocr_fallback
+from utils.utils import ensure_text, extract_text_from_pdf, file_sha256
+
+logger = AppLogger(__name__)
+
+# Bump whenever an extractor's output changes so cached text is not reused
+EXTRACTION_VERSION = "v2"
+
+TextExtractor = Callable[[str], str]
+_EXTRACTORS: Dict[str, TextExtractor] = {}
+_text_cache: Optional[RedisCache] = None
+
+
+def register_extractor(*extensions: str):
+    """Register a text extractor for one or more file extensions (".docx", ...)."""
+    def decorator(fn: TextExtractor) -> TextExtractor:
+        for ext in extensions:
+            _EXTRACTORS[ext.lower()] = fn
+        return fn
+    return decorator
+
+
+def supported_extensions() -> List[str]:
+    return sorted(_EXTRACTORS)
+
+
+def _get_text_cache() -> Optional[RedisCache]:
+    global _text_cache
+    if _text_cache is None and CV_TEXT_CACHE_ENABLED:
+        _text_cache = RedisCache("cv_text", CV_TEXT_CACHE_TTL, CV_TEXT_CACHE_MAX_ENTRIES)
+    return _text_cache
+
+
+def extract_text(file_path: str, use_cache: bool = True) -> str:
+    """
+    Extract plain text from a CV in any registered format. Results are cached
+    on the file's SHA-256, so re-parsing the same file skips extraction.
+    """
+    ext = os.path.splitext(file_path)[1].lower()
+    extractor = _EXTRACTORS.get(ext)
+    if extractor is None:
+        raise ValueError(f"Unsupported CV format: {ext or file_path}")
+
+    cache = _get_text_cache() if use_cache else None
+    cache_key = f"{file_sha256(file_path)}:{ext}:{EXTRACTION_VERSION}:{PDF_MAX_PAGES}" if cache else None
+    if cache:
+        cached = cache.get(cache_key)
+        if isinstance(cached, str):
+            cv_text_cache_hits_total.inc()
+            logger.debug(f"[extract] cache hit for {file_path}")
+            return cached
+        cv_text_cache_misses_total.inc()
+
+    text = ensure_text(extractor(file_path))
+    logger.debug(f"[extract] {ext} chars: {len(text)}")
+    if cache and text.strip():
+        cache.set(cache_key, text)
+    return text
+
+
+# ============ PDF ============
+@register_extractor(".pdf")
+def extract_text_from_pdf_or_scan(file_path: str) -> str:
+    """Native PDF text, replaced by OCR output when the PDF is a scan."""
+    text = extract_text_from_pdf(file_path)
+    with fitz.open(file_path) as doc:
+        page_count = min(doc.page_count, PDF_MAX_PAGES) if PDF_MAX_PAGES > 0 else doc.page_count
+    return ocr_fallback(file_path, text, page_count)
+
+
+# ============ DOCX ============
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_DOCX_PART = re.compile(r"^word/(header\d*|document|footer\d*)\.xml$")
+
+
+def _docx_part_order(name: str) -> int:
+    # Headers usually hold the contact details, keep them first
+    return 0 if "/header" in name else 2 if "/footer" in name else 1
+
+
+def _iter_docx_text(xml_stream) -> Iterable[str]:
+    for _, elem in ET.iterparse(xml_stream, events=("end",)):
+        tag = elem.tag
+        if tag == f"{_W}t":
+            yield elem.text or ""
+        elif tag == f"{_W}tab":
+            yield "\t"
+        elif tag in (f"{_W}br", f"{_W}cr"):
+            yield "\n"
+        elif tag == f"{_W}p":
+            yield "\n"
+            elem.clear()
+        elif tag == f"{_W}tc":
+            yield "\t"
+
+
+@register_extractor(".docx")
+def extract_text_from_docx(file_path: str) -> str:
+    parts: List[str] = []
+    with zipfile.ZipFile(file_path) as zf:
+        names = sorted((n for n in zf.namelist() if _DOCX_PART.match(n)), key=_docx_part_order)
+        for name in names:
+            with zf.open(name) as xml_stream:
+                parts.extend(_iter_docx_text(xml_stream))
+            parts.append("\n")
+    return "".join(parts)
+
+
+# ============ ODT ============
+_TEXT = "{urn:oasis:names:tc:opendocument:xmlns:text:1.0}"
+
+
+def _odt_inline_text(elem) -> str:
+    parts = [elem.text or ""]
+    for child in elem:
+        tag = child.tag
+        if tag == f"{_TEXT}s":
+            parts.append(" " * int(child.get(f"{_TEXT}c", "1")))
+        elif tag == f"{_TEXT}tab":
+            parts.append("\t")
+        elif tag == f"{_TEXT}line-break":
+            parts.append("\n")
+        else:
+            parts.append(_odt_inline_text(child))
+        parts.append(child.tail or "")
+    return "".join(parts)
+
+
+@register_extractor(".odt")
+def extract_text_from_odt(file_path: str) -> str:
+    parts: List[str] = []
+    with zipfile.ZipFile(file_path) as zf, zf.open("content.xml") as xml_stream:
+        for _, elem in ET.iterparse(xml_stream, events=("end",)):
+            if elem.tag in (f"{_TEXT}p", f"{_TEXT}h"):
+                parts.append(_odt_inline_text(elem))
+                parts.append("\n")
+                elem.clear()
+    return "".join(parts)
+
+
+# ============ RTF ============
+_RTF_TOKEN = re.compile(
+    r"\\([a-zA-Z]+)(-?\d+)? ?|\\'([0-9a-fA-F]{2})|\\([^a-zA-Z])|([{}])|[\r\n]+|([^\\{}\r\n]+)"
+)
+# Groups whose content is never body text
+_RTF_SKIP_DESTINATIONS = {
+    "fonttbl", "colortbl", "stylesheet", "info", "pict", "object", "header", "footer",
+    "headerl", "headerr", "footerl", "footerr", "listtable", "listoverridetable",
+    "revtbl", "rsidtbl", "generator", "themedata", "colorschememapping", "datastore",
+    "latentstyles", "xmlnstbl", "filetbl", "fldinst",
+}
+_RTF_SPECIAL = {"par": "\n", "line": "\n", "sect": "\n", "page": "\n", "row": "\n", "tab": "\t", "cell": "\t",
+                "emdash": "\u2014", "endash": "\u2013", "bullet": "\u2022", "lquote": "\u2018",
+                "rquote": "\u2019", "ldblquote": "\u201c", "rdblquote": "\u201d"}
+
+
+def rtf_to_text(rtf: str, encoding: str = "cp1252") -> str:
+    out: List[str] = []
+    stack = []
+    skip = False
+    uc_skip = 1  # characters to drop after a \uN escape
+    pending_skip = 0
+
+    for match in _RTF_TOKEN.finditer(rtf):
+        word, arg, hex_code, symbol, brace, text = match.groups()
+        if brace == "{":
+            stack.append((skip, uc_skip))
+            continue
+        if brace == "}":
+            if stack:
+                skip, uc_skip = stack.pop()
+            continue
+        if pending_skip and (text or hex_code):
+            if text:
+                drop = min(pending_skip, len(text))
+                text = text[drop:]
+                pending_skip -= drop
+            else:
+                pending_skip -= 1
+                continue
+        if word:
+            if word in _RTF_SKIP_DESTINATIONS:
+                skip = True
+            elif word == "uc":
+                uc_skip = int(arg or 1)
+            elif word == "u" and not skip:
+                code = int(arg)
+                out.append(chr(code + 65536 if code < 0 else code))
+                pending_skip = uc_skip
+            elif word in _RTF_SPECIAL and not skip:
+                out.append(_RTF_SPECIAL[word])
+        elif symbol:
+            if symbol == "*":
+                skip = True  # unknown "\*\dest" groups are optional destinations
+            elif symbol == "~" and not skip:
+                out.append("\u00a0")
+            elif symbol in "\\{}" and not skip:
+                out.append(symbol)
+            elif symbol in "\r\n" and not skip:
+                out.append("\n")
+        elif hex_code and not skip:
+            out.append(bytes([int(hex_code, 16)]).decode(encoding, errors="ignore"))
+        elif text and not skip:
+            out.append(text)
+    return "".join(out)
+
+
+@register_extractor(".rtf")
+def extract_text_from_rtf(file_path: str) -> str:
+    with open(file_path, "r", encoding="latin-1") as f:
+        return rtf_to_text(f.read())
+
+
+# ============ TXT ============
+@register_extractor(".txt")
+def extract_text_from_txt(file_path: str) -> str:
+    with open(file_path, "rb") as f:
+        raw = f.read()
+    for encoding in ("utf-8-sig", "cp1252"):
+        try:
+            return raw.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    return raw.decode("latin-1")
+
+
+# ============ Legacy formats ============
+@register_extractor(".doc")
+def extract_text_via_pdf(file_path: str) -> str:
+    """Binary formats without a native reader are converted to a temporary PDF first."""
+    from utils.office_converter import convert_to_pdf
+
+    with tempfile.TemporaryDirectory(prefix="cv-extract-") as tmp_dir:
+        return extract_text_from_pdf(convert_to_pdf(file_path, tmp_dir))
@@ -0,0 +1,80 @@
+import hashlib
+from typing import Optional
+
+import redis
+
+from config.constants import CV_UPLOAD_LOCK_TTL
+from config.log_config import AppLogger
+from config.redis_client import get_redis_client
+from utils.utils import file_sha256
+
+logger = AppLogger(__name__)
+
+# Delete the lock only if it is still held by the given upload
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class CVUploadLock:
+    """
+    Idempotency lock of an in-flight CV upload.
+
+    One Redis key per (file hash, position, username) holds the ID of the
+    upload that is processing it. The API claims it before enqueueing and the
+    pipeline claims it again when it starts; a second upload of the same CV
+    finds the first one's ID and attaches to it instead of running the LLM
+    pipeline again. The lock expires after `ttl_seconds` and is released when
+    the pipeline finishes. Redis failures are logged and never block a CV.
+    """
+
+    def __init__(self, ttl_seconds: int = CV_UPLOAD_LOCK_TTL, client: Optional[redis.Redis] = None):
+        self.ttl_seconds = ttl_seconds
+        self._client = client
+
+    @property
+    def client(self) -> redis.Redis:
+        return self._client or get_redis_client()
+
+    @staticmethod
+    def idempotency_key(file_hash: str, position: Optional[str], username: Optional[str]) -> str:
+        return hashlib.sha256(f"{file_hash}|{position or ''}|{username or ''}".encode("utf-8")).hexdigest()
+
+    @classmethod
+    def file_idempotency_key(cls, cv_file_path: str, position: Optional[str], username: Optional[str]) -> str:
+        return cls.idempotency_key(file_sha256(cv_file_path), position, username)
+
+    @staticmethod
+    def _key(idempotency_key: str) -> str:
+        return f"cv_upload_lock:{idempotency_key}"
+
+    def acquire(self, idempotency_key: str, upload_id: str) -> str:
+        """
+        Claim the key for `upload_id` and return the ID of the upload holding it:
+        `upload_id` itself when claimed (or already owned), another ID for a duplicate.
+        """
+        key = self._key(idempotency_key)
+        try:
+            for _ in range(2):
+                if self.client.set(key, upload_id, nx=True, ex=self.ttl_seconds):
+                    return upload_id
+                holder = self.client.get(key)
+                if holder is None:
+                    continue  # expired in between, claim again
+                holder = holder.decode()
+                if holder == upload_id:
+                    # Re-claimed by the same upload (task start, retry): restart the TTL
+                    self.client.expire(key, self.ttl_seconds)
+                return holder
+        except redis.RedisError as e:
+            logger.warn(f"[CVUploadLock] Could not claim {idempotency_key}: {e}")
+        return upload_id
+
+    def release(self, idempotency_key: str, upload_id: str) -> None:
+        try:
+            self.client.eval(_RELEASE_SCRIPT, 1, self._key(idempotency_key), upload_id)
+        except redis.RedisError as e:
+            logger.warn(f"[CVUploadLock] Could not release {idempotency_key}: {e}")
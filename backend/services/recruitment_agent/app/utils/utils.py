@@ -1,11 +1,21 @@
 # utils/cv_utils.py
+import atexit
+import hashlib
 import json
+import math
+import os
 import re
+import threading
+from functools import lru_cache
 from socket import socket
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 import time
+import billiard
 import fitz
+from billiard.pool import Pool
+from config.constants import PDF_EXTRACT_TIMEOUT, PDF_EXTRACT_WORKERS, PDF_MAX_PAGES, PDF_PARALLEL_MIN_PAGES
 from config.log_config import AppLogger
+from metrics.prometheus_metrics import pdf_extraction_duration_seconds
 
 logger = AppLogger(__name__)
 
@@ -43,14 +53,19 @@ def clean_json_from_text(text: str) -> str:
         return s
     except Exception:
         pass
-    m = re.search(r"\{.*\}", s, re.DOTALL)
-    if m:
-        cand = m.group(0)
-        try:
-            json.loads(cand)
-            return cand
-        except Exception:
-            pass
+    # Try the outermost value first: an array of objects also contains "{...}"
+    patterns = [r"\{.*\}", r"\[.*\]"]
+    if "[" in s and ("{" not in s or s.index("[") < s.index("{")):
+        patterns.reverse()
+    for pat in patterns:
+        m = re.search(pat, s, re.DOTALL)
+        if m:
+            cand = m.group(0)
+            try:
+                json.loads(cand)
+                return cand
+            except Exception:
+                pass
     return s
 
 
@@ -121,12 +136,102 @@ def validate_parsed_cv(obj: Any) -> Dict[str, Any]:
     return obj
 
 
-def extract_text_from_pdf(file_path: str) -> str:
+def _pdf_page_range_text(file_path: str, start: int, stop: int) -> str:
+    with fitz.open(file_path) as doc:
+        return "".join(doc[i].get_text() for i in range(start, stop))
+
+
+_pdf_pool: Optional[Pool] = None
+_pdf_pool_pid: Optional[int] = None
+_pdf_pool_lock = threading.Lock()
+
+
+def _get_pdf_pool() -> Optional[Pool]:
+    """
+    Process-wide extraction pool, or None where pages are read serially
+    (PDF_EXTRACT_WORKERS below 2, the default). billiard (Celery's fork of multiprocessing) is used because Celery prefork
+    children are daemonic: multiprocessing refuses to start processes there,
+    billiard does not. MuPDF holds the GIL and is not thread-safe, so threads
+    would not read pages in parallel. A page range running longer than
+    PDF_EXTRACT_TIMEOUT has its worker killed and replaced by the pool.
+    """
+    global _pdf_pool, _pdf_pool_pid
+    if PDF_EXTRACT_WORKERS < 2:
+        return None
+    if _pdf_pool is None or _pdf_pool_pid != os.getpid():
+        with _pdf_pool_lock:
+            if _pdf_pool is None or _pdf_pool_pid != os.getpid():
+                # spawn: MuPDF state must not be inherited from a threaded parent
+                _pdf_pool = billiard.get_context("spawn").Pool(PDF_EXTRACT_WORKERS, timeout=PDF_EXTRACT_TIMEOUT)
+                _pdf_pool_pid = os.getpid()
+    return _pdf_pool
+
+
+def close_pdf_pool() -> None:
+    """Stop this process's extraction workers; a pool inherited through fork belongs to the parent."""
+    global _pdf_pool
+    with _pdf_pool_lock:
+        pool, owned = _pdf_pool, _pdf_pool_pid == os.getpid()
+        _pdf_pool = None
+    if pool is not None and owned:
+        pool.terminate()
+        pool.join()
+
+
+atexit.register(close_pdf_pool)
+
+
+def _page_ranges(page_count: int, parts: int) -> List[Tuple[int, int]]:
+    step = max(1, math.ceil(page_count / parts))
+    return [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+
+
+def extract_text_from_pdf(file_path: str, max_pages: int = PDF_MAX_PAGES) -> str:
+    """
+    Concatenate the text of every page (or the first `max_pages`). Large
+    documents are split into page ranges read in parallel by a process pool.
+    """
     logger.debug(f"[pdf] reading: {file_path}")
-    doc = fitz.open(file_path)
-    text = "".join(page.get_text() for page in doc)
+    start = time.perf_counter()
+    with fitz.open(file_path) as doc:
+        page_count = min(doc.page_count, max_pages) if max_pages > 0 else doc.page_count
+        pool = _get_pdf_pool() if page_count >= PDF_PARALLEL_MIN_PAGES else None
+        if pool is None:
+            mode = "serial"
+            text = "".join(doc[i].get_text() for i in range(page_count))
+
+    if pool is not None:
+        mode = "parallel"
+        try:
+            results = [
+                pool.apply_async(_pdf_page_range_text, (file_path, first, last))
+                for first, last in _page_ranges(page_count, PDF_EXTRACT_WORKERS)
+            ]
+            text = "".join(r.get() for r in results)
+        except Exception as e:
+            # Worker lost or over its time limit; the pool replaces it, this document is read here
+            logger.warn(f"[pdf] parallel extraction failed, reading serially: {e!r}")
+            mode = "serial"
+            text = _pdf_page_range_text(file_path, 0, page_count)
+    pdf_extraction_duration_seconds.labels(mode=mode).observe(time.perf_counter() - start)
+
     text = ensure_text(text)
     if not text:
         logger.info(f"[pdf] empty content: {file_path}")
-    logger.debug(f"[pdf] chars: {len(text)}")
+    logger.debug(f"[pdf] pages: {page_count}, mode: {mode}, chars: {len(text)}")
     return text
+
+
+@lru_cache(maxsize=256)
+def _file_sha256(file_path: str, size: int, mtime_ns: int, chunk_size: int) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_sha256(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+    # Memoised on size + mtime: the parser and the text cache both key on the same file
+    st = os.stat(file_path)
+    return _file_sha256(file_path, st.st_size, st.st_mtime_ns, chunk_size)
@@ -0,0 +1,47 @@
+"""
+Per-task graph construction cost: building and compiling the LangGraph
+pipelines on every task vs reusing the per-process compiled graphs.
+
+Run from backend/services/recruitment_agent:
+    python benchmarks/bench_graph_build.py [iterations]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from agents.graph import (  # noqa: E402
+    build_recruitment_graph_matching,
+    build_recruitment_graph_approval,
+    get_recruitment_graph_matching,
+    get_recruitment_graph_approval,
+)
+
+
+def _bench(label, fn, iterations):
+    fn()  # warm up imports and caches
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    per_call_us = (time.perf_counter() - start) / iterations * 1e6
+    print(f"{label:<42} {per_call_us:>12.1f} us/task")
+    return per_call_us
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    before = _bench("before: build + compile matching/approval", lambda: (
+        build_recruitment_graph_matching(),
+        build_recruitment_graph_approval(),
+    ), iterations)
+    after = _bench("after: reuse compiled matching/approval", lambda: (
+        get_recruitment_graph_matching(),
+        get_recruitment_graph_approval(),
+    ), iterations)
+    print(f"speedup: {before / max(after, 1e-9):.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Per-node overhead of the graph wrappers on a large synthetic state:
+legacy full model_dump merge + eager debug f-string vs delta updates.
+
+Run from backend/services/recruitment_agent:
+    python benchmarks/bench_graph_state.py [iterations]
+"""
+import logging
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from agents.base_agent import BaseAgent  # noqa: E402
+from agents.graph import node_with_log, _static  # noqa: E402
+from agents.state import RecruitmentState  # noqa: E402
+from config.log_config import AppLogger  # noqa: E402
+
+logger = AppLogger("bench_graph_state")
+
+
+class _MatchLikeAgent(BaseAgent):
+    """Touches a single field, like most nodes do."""
+
+    def run(self, state: RecruitmentState) -> RecruitmentState:
+        state.matched_jd = {"position": "Backend Engineer", "score_breakdown": {"total_score": 80.0}}
+        return state
+
+
+def legacy_node_with_log(agent: BaseAgent):
+    # Wrapper shape used before delta updates
+    def wrapper(state):
+        logger.debug("[legacy] Starting...")
+        if isinstance(state, RecruitmentState):
+            state_obj = state
+        else:
+            state_obj = RecruitmentState(**state)
+
+        result = agent.run(state_obj)
+        updated_fields = result.model_dump()
+        merged_state = {**state_obj.model_dump(), **updated_fields}
+        logger.debug(f"[legacy] Merged state: {merged_state}")
+        return merged_state
+
+    return wrapper
+
+
+def synthetic_state(n_jds: int = 500, n_cv_items: int = 300) -> RecruitmentState:
+    return RecruitmentState(
+        cv_file_path="/tmp/cv.pdf",
+        position_applied_for="Backend Engineer",
+        parsed_cv={
+            "name": "Candidate",
+            "skills": [f"skill-{i}" for i in range(n_cv_items)],
+            "experience": [{"company": f"c{i}", "description": "x" * 200} for i in range(n_cv_items)],
+        },
+        jd_list=[
+            {
+                "position": "Backend Engineer",
+                "skills_required": [f"skill-{j}" for j in range(i % 40 + 10)],
+                "experience_required": i % 6,
+                "level": "Mid",
+            }
+            for i in range(n_jds)
+        ],
+    )
+
+
+def _bench(label, node, state, iterations):
+    node(state.model_copy(), None)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        node(state.model_copy(), None)
+    per_call_us = (time.perf_counter() - start) / iterations * 1e6
+
+    tracemalloc.start()
+    node(state.model_copy(), None)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<28} {per_call_us:>12.1f} us/node {peak / 1024:>10.1f} KiB peak")
+    return per_call_us
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    logging.getLogger().setLevel(logging.INFO)
+    state = synthetic_state()
+    agent = _MatchLikeAgent()
+
+    legacy = legacy_node_with_log(agent)
+    before = _bench("before: full merge", lambda s, config: legacy(s), state, iterations)
+    after = _bench("after: delta update", node_with_log("matcher", _static(agent)), state, iterations)
+    print(f"speedup: {before / max(after, 1e-9):.0f}x")
+
+
+if __name__ == "__main__":
+    main()
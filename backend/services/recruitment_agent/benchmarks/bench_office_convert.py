@@ -0,0 +1,64 @@
+"""
+Document -> PDF conversion throughput: a cold `libreoffice --convert-to` per
+file vs the pooled long-lived unoserver workers.
+
+Requires LibreOffice and a UNOSERVER_PYTHON interpreter with the `uno` module
+(both are in the service image). Run from backend/services/recruitment_agent:
+    python benchmarks/bench_office_convert.py [files] [threads]
+"""
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from utils.office_converter import OfficeConverterPool, convert_with_cli  # noqa: E402
+
+
+def _make_inputs(work_dir: str, count: int):
+    paths = []
+    for i in range(count):
+        path = os.path.join(work_dir, f"doc_{i}.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f"Position: Backend Engineer {i}\n\n" + "Responsibilities: build services.\n" * 200)
+        paths.append(path)
+    return paths
+
+
+def _bench(label, convert, paths, out_dir, threads):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(lambda path: convert(path, out_dir), paths))
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34} {len(paths) / elapsed:>8.2f} docs/s  ({elapsed:.1f}s for {len(paths)})")
+    return elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        paths = _make_inputs(work_dir, count)
+        cold_dir = os.path.join(work_dir, "cold")
+        pool_dir = os.path.join(work_dir, "pool")
+        os.makedirs(cold_dir)
+        os.makedirs(pool_dir)
+
+        cold = _bench(f"cold spawn ({threads} threads)", convert_with_cli, paths, cold_dir, threads)
+
+        pool = OfficeConverterPool(size=threads)
+        try:
+            # Start the workers outside the measured window
+            list(ThreadPoolExecutor(max_workers=threads).map(lambda path: pool.convert_to_pdf(path, pool_dir), paths[:threads]))
+            pooled = _bench(f"pooled ({threads} workers)", pool.convert_to_pdf, paths, pool_dir, threads)
+        finally:
+            pool.close()
+
+        print(f"speedup: {cold / pooled:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
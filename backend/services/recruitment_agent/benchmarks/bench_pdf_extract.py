@@ -0,0 +1,72 @@
+"""
+PDF text extraction time per document size: serial page loop vs
+extract_text_from_pdf (page ranges across the process pool once a document
+reaches PDF_PARALLEL_MIN_PAGES), plus a warm extracted-text cache lookup
+when Redis is reachable.
+
+Run from backend/services/recruitment_agent:
+    python benchmarks/bench_pdf_extract.py [repeats]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import fitz
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from config.constants import PDF_EXTRACT_WORKERS, PDF_PARALLEL_MIN_PAGES  # noqa: E402
+from utils.text_extraction import extract_text  # noqa: E402
+from utils.utils import _get_pdf_pool, _pdf_page_range_text, extract_text_from_pdf  # noqa: E402
+
+PAGE_COUNTS = (2, 10, 30, 100, 300)
+
+
+def _make_pdf(path: str, pages: int) -> None:
+    # Portfolio-like pages: a block of text plus an embedded raster image
+    pixmap = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 400, 300), False)
+    pixmap.set_rect(pixmap.irect, (90, 140, 200))
+    image = pixmap.tobytes("png")
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        page.insert_textbox(fitz.Rect(50, 50, 545, 420), f"Project {i}: " + "Built distributed services. " * 60)
+        page.insert_image(fitz.Rect(50, 440, 450, 740), stream=image)
+    doc.save(path)
+    doc.close()
+
+
+def _time(fn, repeats: int) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats * 1000
+
+
+def _cache_available() -> bool:
+    try:
+        from config.redis_client import get_redis_client
+        return bool(get_redis_client().ping())
+    except Exception:
+        return False
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print(f"workers={PDF_EXTRACT_WORKERS} parallel_min_pages={PDF_PARALLEL_MIN_PAGES} pool={'on' if _get_pdf_pool() else 'off'}")
+    with_cache = _cache_available()
+    print(f"{'pages':>6} {'serial ms':>12} {'extract ms':>12} {'cached ms':>12}")
+    with tempfile.TemporaryDirectory(prefix="bench-pdf-") as work_dir:
+        for pages in PAGE_COUNTS:
+            path = os.path.join(work_dir, f"cv_{pages}.pdf")
+            _make_pdf(path, pages)
+            serial = _time(lambda: _pdf_page_range_text(path, 0, pages), repeats)
+            current = _time(lambda: extract_text_from_pdf(path), repeats)
+            cached = f"{_time(lambda: extract_text(path), repeats):>12.2f}" if with_cache else f"{'n/a':>12}"
+            print(f"{pages:>6} {serial:>12.2f} {current:>12.2f} {cached}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Response serialization cost per 1,000 rows of the CV endpoints, database
+excluded: FastAPI's default path (jsonable_encoder, or response_model
+validation, then json.dumps) vs the plain rows encoded by orjson that the
+routers now return, for list rows and for /cvs/me rows with and without
+?include=parsed_cv.
+
+Run from backend/services/recruitment_agent:
+    python benchmarks/bench_serialization.py [rows] [iterations]
+"""
+import json
+import os
+import random
+import sys
+import time
+from collections import namedtuple
+from datetime import date
+from typing import List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+
+from schemas.cv_schema import CVApplicationResponse, CVListItemSchema  # noqa: E402
+from services.service import _cv_detail  # noqa: E402
+from utils.pagination import page_response  # noqa: E402
+
+SKILLS = ["Python", "FastAPI", "SQL", "Docker", "Kubernetes", "React", "AWS", "Redis", "Celery", "Go", "Java", "Kafka"]
+
+ListRow = namedtuple("ListRow", "id candidate_name email position matched_score justification status datetime")
+DetailRow = namedtuple(
+    "DetailRow",
+    "id candidate_name username email position experience_years skills matched_jd_skills "
+    "matched_score justification status parsed_cv",
+)
+# What the query selects without ?include=parsed_cv
+SlimDetailRow = namedtuple("SlimDetailRow", DetailRow._fields[:-1])
+
+
+def _parsed_cv(rng: random.Random) -> str:
+    # Roughly the size of a parsed two-page CV
+    return json.dumps({
+        "summary": "Backend engineer building distributed systems. " * 6,
+        "skills": rng.sample(SKILLS, 8),
+        "experience": [
+            {"company": f"Company {i}", "title": "Software Engineer", "years": rng.randint(1, 4),
+             "highlights": ["Designed and shipped services handling millions of requests a day"] * 4}
+            for i in range(4)
+        ],
+        "education": [{"school": "University of Science", "degree": "BSc Computer Science", "year": 2018}],
+        "projects": [{"name": f"Project {i}", "description": "Event-driven pipeline on Kafka and Celery " * 3}
+                     for i in range(5)],
+    })
+
+
+def _rows(count: int):
+    rng = random.Random(7)
+    list_rows, detail_rows = [], []
+    for i in range(count):
+        name, email = f"Nguyen Van {i}", f"candidate{i}@example.com"
+        justification = "Strong match on backend skills and years of experience. " * 3
+        list_rows.append(ListRow(i, name, email, "Senior Backend Engineer", rng.randint(1, 10), justification,
+                                 "Pending", date(2025, 1, 1)))
+        detail_rows.append(DetailRow(i, name, f"user{i}", email, "Senior Backend Engineer", rng.randint(0, 10),
+                                     json.dumps(rng.sample(SKILLS, 6)), json.dumps(rng.sample(SKILLS, 4)),
+                                     rng.randint(1, 10), justification, "Pending", _parsed_cv(rng)))
+    return list_rows, detail_rows
+
+
+def _decode_all(row) -> dict:
+    # Detail rows as built before: every JSON column decoded, parsed_cv included
+    return {
+        "id": row.id,
+        "candidate_name": row.candidate_name,
+        "username": row.username,
+        "email": row.email,
+        "position": row.position,
+        "experience_years": row.experience_years,
+        "skills": json.loads(row.skills) if row.skills else [],
+        "jd_skills": json.loads(row.matched_jd_skills) if row.matched_jd_skills else [],
+        "matched_score": row.matched_score,
+        "justification": row.justification,
+        "status": row.status,
+        "parsed_cv": json.loads(row.parsed_cv) if row.parsed_cv else {},
+    }
+
+
+def _bench(label, fn, rows, iterations):
+    fn()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        body = fn()
+    per_1000_ms = (time.perf_counter() - start) / iterations * 1000 * 1000 / rows
+    print(f"{label:<58} {per_1000_ms:>10.2f} ms {len(body) / rows:>8.0f} B/row")
+    return per_1000_ms
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    list_rows, detail_rows = _rows(rows)
+    list_adapter = TypeAdapter(List[CVListItemSchema])
+    detail_adapter = TypeAdapter(List[CVApplicationResponse])
+    slim_rows = [SlimDetailRow(*row[:-1]) for row in detail_rows]
+
+    print(f"{'per 1,000 rows':<58} {'time':>13} {'size':>10}")
+    print("list rows (/cvs/pending, /cvs/approved, /cvs/position)")
+    before = _bench("  before: jsonable_encoder + json", lambda: JSONResponse(
+        jsonable_encoder([row._asdict() for row in list_rows])).body, rows, iterations)
+    _bench("  response_model: validate + serialize + orjson", lambda: page_response(
+        list_adapter.dump_python(list_adapter.validate_python([row._asdict() for row in list_rows]), mode="json"),
+        None).body, rows, iterations)
+    after = _bench("  after: plain rows + orjson", lambda: page_response(
+        [row._asdict() for row in list_rows], None).body, rows, iterations)
+    print(f"  speedup: {before / after:.1f}x")
+
+    print("detail rows (/cvs/me, /cvs/{cv_id})")
+    before = _bench("  before: decode all + response_model + json", lambda: JSONResponse(
+        detail_adapter.dump_python(detail_adapter.validate_python([_decode_all(row) for row in detail_rows]),
+                                   mode="json")).body, rows, iterations)
+    _bench("  after, ?include=parsed_cv: orjson decode + encode", lambda: page_response(
+        [_cv_detail(row, True) for row in detail_rows], None).body, rows, iterations)
+    after = _bench("  after: parsed_cv left out", lambda: page_response(
+        [_cv_detail(row, False) for row in slim_rows], None).body, rows, iterations)
+    print(f"  speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Unit tests of the upload locks claimed by bulk CV uploads and of the batch
+status, with in-memory stand-ins for Redis; no services needed.
+
+Run from backend/services/recruitment_agent/tests:
+    python -m unittest test_unit_bulk_upload
+"""
+import hashlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+import zipfile
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+import redis  # noqa: E402
+from fastapi import HTTPException  # noqa: E402
+
+from services import service  # noqa: E402
+from services.service import RecruitmentService  # noqa: E402
+from utils import upload_lock  # noqa: E402
+from utils.batch_tracker import CVBatchTracker  # noqa: E402
+from utils.upload_lock import CVUploadLock  # noqa: E402
+
+POSITION = "Backend Engineer"
+USERNAME = "admin"
+
+
+class FakeLockRedis:
+    """The SET NX / GET / EXPIRE / release-script subset CVUploadLock uses."""
+
+    def __init__(self):
+        self.data = {}
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value.encode()
+        return True
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def expire(self, key, seconds):
+        return key in self.data
+
+    def eval(self, script, numkeys, key, value):
+        if self.data.get(key) == value.encode():
+            del self.data[key]
+            return 1
+        return 0
+
+
+def _upload(filename, content):
+    return SimpleNamespace(filename=filename, file=io.BytesIO(content))
+
+
+def _zip(members):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        for name, content in members.items():
+            zf.writestr(name, content)
+    buffer.seek(0)
+    return buffer
+
+
+class TestBulkUploadLocks(unittest.TestCase):
+    def setUp(self):
+        self.upload_dir = tempfile.mkdtemp()
+        self.redis = FakeLockRedis()
+        self.signatures = mock.Mock(return_value=[])
+        self.group = mock.Mock()
+        self.tracker = mock.Mock()
+        self.patches = [
+            mock.patch.object(service, "UPLOAD_DIR", self.upload_dir),
+            mock.patch.object(upload_lock, "get_redis_client", return_value=self.redis),
+            mock.patch.object(service, "CVBatchTracker", return_value=self.tracker),
+            mock.patch("celery_tasks.stages.cv_batch_signatures", self.signatures),
+            mock.patch("celery.group", self.group),
+        ]
+        for patch in self.patches:
+            patch.start()
+
+    def tearDown(self):
+        for patch in reversed(self.patches):
+            patch.stop()
+        shutil.rmtree(self.upload_dir, ignore_errors=True)
+
+    def _bulk_upload(self, *files):
+        return RecruitmentService().bulk_upload_cvs(list(files), POSITION, USERNAME)
+
+    def _enqueued(self):
+        paths, _, _, _, _, upload_ids = self.signatures.call_args.args
+        return paths, upload_ids
+
+    def test_every_cv_is_enqueued_with_its_claimed_lock(self):
+        response = self._bulk_upload(_upload("a.pdf", b"cv a"), _upload("b.pdf", b"cv b"))
+        self.assertEqual(response.accepted, 2)
+        self.assertEqual(response.duplicate_of, {})
+        paths, upload_ids = self._enqueued()
+        self.assertEqual(len(paths), 2)
+        # Each CV's task owns its lock, so the pipeline does not take it for a duplicate
+        for path, upload_id in zip(paths, upload_ids):
+            key = CVUploadLock.file_idempotency_key(path, POSITION, USERNAME)
+            self.assertEqual(CVUploadLock().acquire(key, upload_id), upload_id)
+        self.tracker.create.assert_called_once_with(response.batch_id, total=2, skipped=0)
+
+    def test_identical_cv_within_the_batch_is_skipped(self):
+        archive = _zip({"cvs/a.pdf": b"same cv", "cvs/b.pdf": b"other cv"})
+        response = self._bulk_upload(_upload("a.pdf", b"same cv"), _upload("cvs.zip", archive.getvalue()))
+        self.assertEqual(response.accepted, 2)
+        paths, upload_ids = self._enqueued()
+        self.assertEqual(response.duplicate_of, {"cvs/a.pdf": upload_ids[0]})
+        self.assertEqual(len(response.skipped), 1)
+        self.assertTrue(response.skipped[0].startswith("cvs/a.pdf: "))
+        # Only the enqueued copies are kept
+        self.assertEqual(sorted(os.listdir(self.upload_dir)), sorted(os.path.basename(p) for p in paths))
+        self.tracker.create.assert_called_once_with(response.batch_id, total=2, skipped=1)
+
+    def test_cv_already_in_flight_is_reported_with_its_task_id(self):
+        key = CVUploadLock.idempotency_key(hashlib.sha256(b"cv a").hexdigest(), POSITION, USERNAME)
+        CVUploadLock().acquire(key, "upload-1")
+        response = self._bulk_upload(_upload("a.pdf", b"cv a"))
+        self.assertEqual(response.accepted, 0)
+        self.assertIsNone(response.batch_id)
+        self.assertEqual(response.duplicate_of, {"a.pdf": "upload-1"})
+        self.signatures.assert_not_called()
+        self.assertEqual(os.listdir(self.upload_dir), [])
+
+    def test_failed_enqueue_releases_the_claimed_locks(self):
+        self.group.return_value.apply_async.side_effect = ConnectionError("broker down")
+        response = self._bulk_upload(_upload("a.pdf", b"cv a"))
+        self.assertEqual(response.accepted, 0)
+        self.assertEqual(self.redis.data, {})
+
+
+class TestBatchStatus(unittest.TestCase):
+    def _status(self, client):
+        with mock.patch.object(service, "CVBatchTracker", return_value=CVBatchTracker(client=client)):
+            return RecruitmentService().get_batch_status("batch-1")
+
+    def _error_status(self, client):
+        with self.assertRaises(HTTPException) as ctx:
+            self._status(client)
+        return ctx.exception.status_code
+
+    def test_counters_of_a_live_batch(self):
+        client = mock.Mock()
+        client.hgetall.return_value = {b"total": b"5", b"processed": b"2", b"failed": b"1", b"skipped": b"1"}
+        status = self._status(client)
+        self.assertEqual((status.total, status.processed, status.failed, status.pending, status.skipped), (5, 2, 1, 2, 1))
+
+    def test_unknown_or_expired_batch_is_not_found(self):
+        client = mock.Mock()
+        client.hgetall.return_value = {}
+        self.assertEqual(self._error_status(client), 404)
+        # Counters left without the batch they belonged to
+        client.hgetall.return_value = {b"processed": b"1"}
+        self.assertEqual(self._error_status(client), 404)
+
+    def test_redis_failure_is_service_unavailable(self):
+        client = mock.Mock()
+        client.hgetall.side_effect = redis.ConnectionError("connection refused")
+        self.assertEqual(self._error_status(client), 503)
+
+
+if __name__ == "__main__":
+    unittest.main()
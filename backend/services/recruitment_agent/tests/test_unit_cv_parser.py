@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Unit tests of the CV parser's use of text handed over by the chained
+pipeline's extract stage; no services needed.
+
+Run from backend/services/recruitment_agent/tests:
+    python -m unittest test_unit_cv_parser
+"""
+import json
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from agents import cv_parser_agent  # noqa: E402
+from agents.cv_parser_agent import CVParserAgent  # noqa: E402
+from agents.state import RecruitmentState  # noqa: E402
+
+
+class FakeResponse:
+    def __init__(self, content):
+        self.content = content.encode()
+
+
+class FakeLLM:
+    def __init__(self):
+        self.prompts = []
+
+    def invoke(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        return FakeResponse(json.dumps({"skills": ["Python"], "languages": [{"language": "English", "proficiency_cefr": "B2"}]}))
+
+
+class TestHandedOverText(unittest.TestCase):
+    def setUp(self):
+        self.llm = FakeLLM()
+        self.agent = CVParserAgent(self.llm, mode="single_pass")
+        self.agent.cache = None
+
+    def test_handed_over_text_is_parsed_without_extracting(self):
+        with mock.patch.object(cv_parser_agent, "extract_text", side_effect=AssertionError("extracted again")):
+            state = self.agent.run(RecruitmentState(cv_file_path="cv.pdf", cv_text="Senior Python developer"))
+        self.assertEqual(state.parsed_cv["skills"], ["Python"])
+        self.assertIn("Senior Python developer", self.llm.prompts[0])
+        # The text does not travel on to later stages
+        self.assertIsNone(state.cv_text)
+
+    def test_blank_handed_over_text_rejects_the_cv(self):
+        with mock.patch.object(cv_parser_agent, "extract_text", side_effect=AssertionError("extracted again")):
+            state = self.agent.run(RecruitmentState(cv_file_path="cv.pdf", cv_text="  \n"))
+        self.assertTrue(state.stop_pipeline)
+        self.assertEqual(self.llm.prompts, [])
+
+    def test_text_is_extracted_when_none_was_handed_over(self):
+        with mock.patch.object(cv_parser_agent, "extract_text", return_value="Go developer") as extract:
+            self.agent.run(RecruitmentState(cv_file_path="cv.pdf"))
+        extract.assert_called_once_with("cv.pdf")
+        self.assertIn("Go developer", self.llm.prompts[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
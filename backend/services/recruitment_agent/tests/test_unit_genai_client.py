@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Unit tests of the GenAI HTTP client's circuit breaker bookkeeping; no services needed.
+
+Run from backend/services/recruitment_agent/tests:
+    python -m unittest test_unit_genai_client
+"""
+import asyncio
+import os
+import sys
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+import httpx  # noqa: E402
+import requests  # noqa: E402
+
+from services.genai import GenAIDeadlineExceeded, GenAIUnavailableError, _GenAIHttpClient  # noqa: E402
+from utils.circuit_breaker import CircuitBreaker  # noqa: E402
+
+URL = "http://genai.test/api/v1/gen-ai/chat"
+TIMEOUT = httpx.Timeout(5.0, connect=1.0)
+
+
+def _half_open_client() -> _GenAIHttpClient:
+    client = _GenAIHttpClient()
+    client.breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=0.0)
+    client.breaker.record_failure()
+    return client
+
+
+class FakeAsyncClient:
+    def __init__(self, delay=0.0, status_code=200):
+        self.delay = delay
+        self.status_code = status_code
+        self.calls = 0
+        self.is_closed = False
+
+    async def post(self, url, json=None, timeout=None):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return httpx.Response(self.status_code, request=httpx.Request("POST", url))
+
+
+class TestHalfOpenProbe(unittest.TestCase):
+    def test_cancelled_probe_lets_the_next_call_through(self):
+        client = _half_open_client()
+        slow = FakeAsyncClient(delay=10.0)
+
+        async def scenario():
+            with mock.patch.object(client, "async_client", return_value=slow):
+                with self.assertRaises(asyncio.TimeoutError):
+                    await asyncio.wait_for(client.apost(URL, {}, TIMEOUT), 0.05)
+            fast = FakeAsyncClient()
+            with mock.patch.object(client, "async_client", return_value=fast):
+                response = await client.apost(URL, {}, TIMEOUT)
+            return fast, response
+
+        fast, response = asyncio.run(scenario())
+        self.assertEqual(fast.calls, 1)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(client.breaker.state, CircuitBreaker.CLOSED)
+
+    def test_spent_deadline_does_not_take_the_probe(self):
+        client = _half_open_client()
+        with self.assertRaises(GenAIDeadlineExceeded):
+            client.post(URL, {}, (1.0, 5.0), expires_at=time.monotonic() - 1)
+        self.assertTrue(client.breaker.allow_request())
+
+    def test_unexpected_error_ends_the_probe_as_a_failure(self):
+        client = _half_open_client()
+        session = mock.Mock()
+        session.post.side_effect = requests.exceptions.ChunkedEncodingError("truncated")
+        with mock.patch.object(client, "_create_session", return_value=session):
+            with self.assertRaises(requests.exceptions.ChunkedEncodingError):
+                client.post(URL, {}, (1.0, 5.0))
+        self.assertEqual(client.breaker.state, CircuitBreaker.OPEN)
+        # Not stuck: once the reset timeout passes a new probe is admitted
+        self.assertTrue(client.breaker.allow_request())
+
+    def test_open_breaker_rejects_without_a_request(self):
+        client = _GenAIHttpClient()
+        client.breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=60.0)
+        client.breaker.record_failure()
+        session = mock.Mock()
+        with mock.patch.object(client, "_create_session", return_value=session):
+            with self.assertRaises(GenAIUnavailableError):
+                client.post(URL, {}, (1.0, 5.0))
+        session.post.assert_not_called()
+
+
+class TestLiveClients(unittest.TestCase):
+    def test_closed_async_clients_are_not_counted(self):
+        client = _GenAIHttpClient()
+        self.assertEqual(client._live_clients(), 0)
+
+        async def scenario():
+            client.async_client()
+            counted = client._live_clients()
+            await client.aclose()
+            return counted
+
+        self.assertEqual(asyncio.run(scenario()), 1)
+        self.assertEqual(client._live_clients(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
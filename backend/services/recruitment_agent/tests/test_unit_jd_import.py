@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Unit tests of the JD import helpers: content signatures and NDJSON input; no services needed.
+
+Run from backend/services/recruitment_agent/tests:
+    python -m unittest test_unit_jd_import
+"""
+import io
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from models.job_description import jd_signature  # noqa: E402
+from utils.ndjson import is_ndjson, iter_ndjson  # noqa: E402
+
+
+class TestJDSignature(unittest.TestCase):
+    def test_case_whitespace_and_skill_order_are_ignored(self):
+        self.assertEqual(
+            jd_signature("Backend  Engineer", ["Python", "SQL"], 3, "Senior"),
+            jd_signature(" backend engineer", ["sql ", "PYTHON"], 3, "senior"),
+        )
+
+    def test_every_field_is_part_of_the_signature(self):
+        base = jd_signature("Backend Engineer", ["Python"], 3, "Senior")
+        self.assertNotEqual(base, jd_signature("Frontend Engineer", ["Python"], 3, "Senior"))
+        self.assertNotEqual(base, jd_signature("Backend Engineer", ["Python", "Go"], 3, "Senior"))
+        self.assertNotEqual(base, jd_signature("Backend Engineer", ["Python"], 4, "Senior"))
+        self.assertNotEqual(base, jd_signature("Backend Engineer", ["Python"], 3, "Mid"))
+
+    def test_missing_values_are_normalized(self):
+        self.assertEqual(jd_signature(None, None, 0, None), jd_signature("", [], 0, ""))
+        self.assertEqual(len(jd_signature("QA", [], 1, "Mid")), 64)
+
+
+class TestNDJSON(unittest.TestCase):
+    def test_detected_by_content_type_or_extension(self):
+        self.assertTrue(is_ndjson("jds.bin", "application/x-ndjson; charset=utf-8"))
+        self.assertTrue(is_ndjson("JDS.JSONL", "application/octet-stream"))
+        self.assertTrue(is_ndjson("jds.ndjson", None))
+        self.assertFalse(is_ndjson("jds.json", "application/json"))
+        self.assertFalse(is_ndjson(None, None))
+
+    def test_one_value_per_line_and_blank_lines_skipped(self):
+        stream = io.BytesIO(b'{"position": "QA"}\n\n  \n{"position": "Dev"}\r\n[1, 2]')
+        self.assertEqual(list(iter_ndjson(stream)), [{"position": "QA"}, {"position": "Dev"}, [1, 2]])
+
+    def test_invalid_line_yields_none(self):
+        stream = io.BytesIO(b'{"position": "QA"}\nnot json\n{"position": "Dev"}\n')
+        self.assertEqual(list(iter_ndjson(stream)), [{"position": "QA"}, None, {"position": "Dev"}])
+
+    def test_stream_is_read_lazily(self):
+        stream = io.BytesIO(b'{"a": 1}\n{"a": 2}\n')
+        records = iter_ndjson(stream)
+        self.assertEqual(next(records), {"a": 1})
+        self.assertEqual(stream.tell(), len(b'{"a": 1}\n'))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Unit tests of the IDF-weighted Jaccard JD prefilter; no services needed.
+
+Run from backend/services/recruitment_agent/tests:
+    python -m unittest test_unit_jd_prefilter
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from agents.jd_prefilter_agent import JDPrefilterAgent, score_skill_overlap  # noqa: E402
+from agents.state import RecruitmentState  # noqa: E402
+
+
+class TestScoreSkillOverlap(unittest.TestCase):
+    def test_identical_and_disjoint_skill_sets(self):
+        scores = score_skill_overlap(["Python", "SQL"], [["Python", "SQL"], ["Java", "Go"]])
+        self.assertAlmostEqual(scores[0], 1.0)
+        self.assertEqual(scores[1], 0.0)
+
+    def test_skill_spelling_is_normalized(self):
+        scores = score_skill_overlap(["Node.js", "Machine Learning"], [["nodejs", "machine-learning"]])
+        self.assertAlmostEqual(scores[0], 1.0)
+
+    def test_rare_skills_weigh_more_than_common_ones(self):
+        jds = [["Python", "Docker"], ["Python", "Rust"], ["Python", "Docker"], ["Python", "Docker"]]
+        scores = score_skill_overlap(["Python", "Rust"], jds)
+        self.assertGreater(scores[1], scores[0])
+        self.assertAlmostEqual(scores[1], 1.0)
+        # Sharing only the skill every JD requires scores below one third
+        self.assertLess(scores[0], 1 / 3)
+
+    def test_empty_inputs(self):
+        self.assertEqual(len(score_skill_overlap(["Python"], [])), 0)
+        self.assertEqual(list(score_skill_overlap([], [["Python"], []])), [0.0, 0.0])
+
+
+class TestJDPrefilterAgent(unittest.TestCase):
+    SKILLS = [["Java"], ["Python", "SQL"], ["Go"], ["Python"], ["Python", "SQL", "Docker"]]
+
+    def _state(self):
+        return RecruitmentState(
+            parsed_cv={"skills": ["Python", "SQL", "Docker"]},
+            jd_list=[{"position": f"Role {i}", "skills_required": skills} for i, skills in enumerate(self.SKILLS)],
+        )
+
+    def _positions(self, state):
+        return [jd["position"] for jd in state.jd_list]
+
+    def test_disabled_keeps_every_jd(self):
+        state = JDPrefilterAgent(top_k=1, enabled=False).run(self._state())
+        self.assertEqual(len(state.jd_list), len(self.SKILLS))
+
+    def test_jd_list_within_top_k_is_untouched(self):
+        state = JDPrefilterAgent(top_k=10, min_score=0.0, enabled=True).run(self._state())
+        self.assertEqual(len(state.jd_list), len(self.SKILLS))
+
+    def test_top_k_keeps_best_jds_in_original_order(self):
+        state = JDPrefilterAgent(top_k=2, min_score=0.0, enabled=True).run(self._state())
+        self.assertEqual(self._positions(state), ["Role 1", "Role 4"])
+        self.assertFalse(state.stop_pipeline)
+
+    def test_skills_required_as_json_string(self):
+        state = self._state()
+        state.jd_list[2]["skills_required"] = '["Python", "SQL", "Docker"]'
+        state = JDPrefilterAgent(top_k=1, min_score=0.0, enabled=True).run(state)
+        self.assertEqual(self._positions(state), ["Role 2"])
+
+    def test_min_score_drops_weak_matches(self):
+        state = JDPrefilterAgent(top_k=0, min_score=0.01, enabled=True).run(self._state())
+        self.assertEqual(self._positions(state), ["Role 1", "Role 3", "Role 4"])
+
+    def test_no_jd_passing_rejects_the_cv(self):
+        state = JDPrefilterAgent(top_k=3, min_score=1.01, enabled=True).run(self._state())
+        self.assertEqual(state.jd_list, [])
+        self.assertTrue(state.stop_pipeline)
+        self.assertIsNone(state.matched_jd)
+        self.assertIn("prefilter", state.final_decision)
+
+
+if __name__ == "__main__":
+    unittest.main()
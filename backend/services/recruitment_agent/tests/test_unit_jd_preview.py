@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Unit tests of the versioned JD preview cache; no services needed.
+
+Run from backend/services/recruitment_agent/tests:
+    python -m unittest test_unit_jd_preview
+"""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from utils import jd_preview  # noqa: E402
+
+
+def _jd(**overrides):
+    fields = dict(
+        id=7, position="Backend Engineer", level="Senior", experience_required=3, location="HCMC",
+        referral_code=None, recruiter=None, hiring_manager=None, company_description="", job_description="APIs",
+        responsibilities=None, qualifications=None, additional_information=None,
+    )
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+class TestJDPreviewCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.patch = mock.patch.object(jd_preview, "JD_PREVIEW_DIR", self.tmp_dir)
+        self.patch.start()
+
+    def tearDown(self):
+        self.patch.stop()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_unchanged_jd_reuses_the_rendered_file(self):
+        path, etag = jd_preview.get_jd_preview(_jd())
+        with mock.patch.object(jd_preview, "render_pdf") as render:
+            self.assertEqual(jd_preview.get_jd_preview(_jd()), (path, etag))
+        render.assert_not_called()
+
+    def test_old_version_is_removed_only_after_the_new_one_is_written(self):
+        old_path, _ = jd_preview.get_jd_preview(_jd())
+        seen_during_render = []
+        render_pdf = jd_preview.render_pdf
+
+        def render_and_check(text, output_path):
+            # A request still sending the old version keeps finding it
+            seen_during_render.append(os.path.exists(old_path))
+            render_pdf(text, output_path)
+
+        with mock.patch.object(jd_preview, "render_pdf", side_effect=render_and_check):
+            new_path, _ = jd_preview.get_jd_preview(_jd(job_description="APIs and queues"))
+        self.assertEqual(seen_during_render, [True])
+        self.assertNotEqual(new_path, old_path)
+        self.assertEqual(os.listdir(self.tmp_dir), [os.path.basename(new_path)])
+
+    def test_failed_render_leaves_no_temp_file(self):
+        with mock.patch.object(jd_preview.fitz, "DocumentWriter", side_effect=RuntimeError("disk full")):
+            with self.assertRaises(RuntimeError):
+                jd_preview.get_jd_preview(_jd())
+        self.assertEqual(os.listdir(self.tmp_dir), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
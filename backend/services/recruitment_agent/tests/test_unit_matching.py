@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Unit tests of the matching agent's LLM score parsing; no services needed.
+
+Run from backend/services/recruitment_agent/tests:
+    python -m unittest test_unit_matching
+"""
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from agents.matching_agent import MatchingAgent, _parse_llm_batch_scores  # noqa: E402
+from agents.state import RecruitmentState  # noqa: E402
+
+
+def score(jd_index, main=60.0, extra=10.0, **overrides):
+    entry = {
+        "jd_index": jd_index,
+        "main_skills_score": main,
+        "extras_score": extra,
+        "total_score": main + extra,
+        "rationale": "overlap",
+        "justification": "good fit",
+    }
+    entry.update(overrides)
+    return entry
+
+
+class FakeResponse:
+    def __init__(self, content):
+        self.content = content
+
+
+class FakeLLM:
+    """Answers batch prompts with `batch_answer`, single-JD prompts with `single_answer`."""
+
+    def __init__(self, batch_answer, single_answer):
+        self.batch_answer = batch_answer
+        self.single_answer = single_answer
+        self.single_calls = 0
+
+    def invoke(self, prompt, timeout=None, deadline=None):
+        if "EACH numbered JD" in prompt:
+            return FakeResponse(self.batch_answer)
+        self.single_calls += 1
+        return FakeResponse(self.single_answer)
+
+
+class TestParseBatchScores(unittest.TestCase):
+    def test_entries_follow_jd_index(self):
+        raw = json.dumps([score(1, main=70.0), score(0, main=40.0)])
+        results = _parse_llm_batch_scores(raw, 2)
+        self.assertEqual(results[0][0], 40.0)
+        self.assertEqual(results[1][0], 70.0)
+
+    def test_missing_and_invalid_entries_are_none(self):
+        raw = json.dumps([score(0), score(1, main=95.0)])  # main_skills_score above 80
+        self.assertEqual(_parse_llm_batch_scores(raw, 3)[1:], [None, None])
+
+    def test_out_of_range_and_duplicate_indexes_are_ignored(self):
+        raw = json.dumps([score(0, main=50.0), score(0, main=10.0), score(7)])
+        results = _parse_llm_batch_scores(raw, 2)
+        self.assertEqual(results[0][0], 50.0)
+        self.assertIsNone(results[1])
+
+    def test_entries_without_index_use_their_position(self):
+        entries = [score(0), score(1, main=30.0)]
+        for entry in entries:
+            del entry["jd_index"]
+        self.assertEqual(_parse_llm_batch_scores(json.dumps(entries), 2)[1][0], 30.0)
+
+    def test_array_in_prose_and_wrapper(self):
+        raw = json.dumps({"data": "Here are the scores:\n```json\n" + json.dumps([score(0)]) + "\n```"})
+        self.assertEqual(_parse_llm_batch_scores(raw, 1)[0][2], 70.0)
+
+    def test_object_instead_of_array_raises(self):
+        with self.assertRaises(ValueError):
+            _parse_llm_batch_scores(json.dumps({"total_score": 50}), 1)
+
+
+class TestBatchedScoringFallback(unittest.TestCase):
+    def _state(self, jd_count):
+        return RecruitmentState(
+            parsed_cv={"skills": ["Python", "SQL"], "education": [], "languages": []},
+            jd_list=[
+                {"position": f"Role {i}", "skills_required": ["Python"], "experience_required": 1, "level": "Mid"}
+                for i in range(jd_count)
+            ],
+        )
+
+    def test_invalid_batch_entries_are_scored_one_by_one(self):
+        batch = json.dumps([score(0, main=50.0), score(1, main=99.0), score(2, main=55.0)])
+        llm = FakeLLM(batch, json.dumps(score(0, main=75.0, extra=5.0)))
+        agent = MatchingAgent(llm, concurrency=1, scoring_mode="batched", batch_size=3)
+        state = agent.run(self._state(3))
+        self.assertEqual(llm.single_calls, 1)
+        self.assertEqual(state.matched_jd["position"], "Role 1")
+        self.assertEqual(state.matched_jd["score_breakdown"]["total_score"], 80.0)
+
+    def test_unparsable_batch_falls_back_for_every_jd(self):
+        llm = FakeLLM("not json at all", json.dumps(score(0, main=75.0)))
+        agent = MatchingAgent(llm, concurrency=2, scoring_mode="batched", batch_size=2)
+        state = agent.run(self._state(3))
+        self.assertEqual(llm.single_calls, 3)
+        self.assertFalse(state.stop_pipeline)
+
+
+if __name__ == "__main__":
+    unittest.main()
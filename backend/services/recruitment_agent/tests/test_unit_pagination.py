@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Unit tests of the keyset pagination of list endpoints, over an in-memory
+SQLite table; no services needed.
+
+Run from backend/services/recruitment_agent/tests:
+    python -m unittest test_unit_pagination
+"""
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from fastapi import HTTPException  # noqa: E402
+from sqlalchemy import Column, Integer, String, create_engine  # noqa: E402
+from sqlalchemy.orm import Session, declarative_base  # noqa: E402
+
+from utils import pagination  # noqa: E402
+from utils.pagination import decode_cursor, encode_cursor, keyset_page, page_response, page_size  # noqa: E402
+
+Base = declarative_base()
+
+
+class Row(Base):
+    __tablename__ = "rows"
+
+    id = Column(Integer, primary_key=True)
+    position = Column(String(50))
+
+
+class TestCursor(unittest.TestCase):
+    def test_round_trip(self):
+        for last_id in (1, 42, 10 ** 12):
+            self.assertEqual(decode_cursor(encode_cursor(last_id)), last_id)
+
+    def test_cursor_is_url_safe_without_padding(self):
+        cursor = encode_cursor(7)
+        self.assertNotIn("=", cursor)
+        self.assertTrue(all(c.isalnum() or c in "-_" for c in cursor))
+
+    def test_missing_cursor_starts_at_first_page(self):
+        self.assertIsNone(decode_cursor(None))
+        self.assertIsNone(decode_cursor(""))
+
+    def test_invalid_cursor_is_a_bad_request(self):
+        # Not base64, not JSON, no "id", and an id that is not a number
+        for cursor in ("%%%", "bm90IGpzb24", "eyJ4IjogMX0", "eyJpZCI6ICJhIn0"):
+            with self.assertRaises(HTTPException) as ctx:
+                decode_cursor(cursor)
+            self.assertEqual(ctx.exception.status_code, 400)
+
+
+class TestPageSize(unittest.TestCase):
+    def test_default_and_bounds(self):
+        with mock.patch.object(pagination, "LIST_PAGE_SIZE", 100), mock.patch.object(pagination, "LIST_PAGE_SIZE_MAX", 500):
+            self.assertEqual(page_size(None), 100)
+            self.assertEqual(page_size(20), 20)
+            self.assertEqual(page_size(10_000), 500)
+            self.assertEqual(page_size(-5), 1)
+
+
+class TestKeysetPage(unittest.TestCase):
+    ROWS = 7
+
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(self.engine)
+        self.db = Session(self.engine)
+        # Inserted out of order, so pages follow the id and not the insertion order
+        ids = [5, 1, 7, 3, 2, 6, 4]
+        self.db.add_all([Row(id=i, position="QA" if i % 2 else "Dev") for i in ids])
+        self.db.commit()
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def _ids(self, rows):
+        return [row.id for row in rows]
+
+    def test_pages_follow_the_cursor_to_the_last_page(self):
+        seen, cursor, pages = [], None, 0
+        while True:
+            rows, cursor = keyset_page(self.db.query(Row), Row.id, cursor, 3)
+            seen.extend(self._ids(rows))
+            pages += 1
+            if cursor is None:
+                break
+        self.assertEqual(seen, list(range(1, self.ROWS + 1)))
+        self.assertEqual(pages, 3)
+
+    def test_next_cursor_points_at_the_last_row_returned(self):
+        rows, cursor = keyset_page(self.db.query(Row), Row.id, None, 3)
+        self.assertEqual(self._ids(rows), [1, 2, 3])
+        self.assertEqual(decode_cursor(cursor), 3)
+
+    def test_exactly_one_full_page_has_no_next_cursor(self):
+        rows, cursor = keyset_page(self.db.query(Row), Row.id, None, self.ROWS)
+        self.assertEqual(len(rows), self.ROWS)
+        self.assertIsNone(cursor)
+
+    def test_cursor_applies_on_top_of_filters(self):
+        query = self.db.query(Row).filter(Row.position == "QA")
+        rows, cursor = keyset_page(query, Row.id, encode_cursor(1), 2)
+        self.assertEqual(self._ids(rows), [3, 5])
+        rows, cursor = keyset_page(query, Row.id, cursor, 2)
+        self.assertEqual(self._ids(rows), [7])
+        self.assertIsNone(cursor)
+
+    def test_page_response_sets_the_cursor_header(self):
+        response = page_response([{"id": 1}], encode_cursor(1))
+        self.assertEqual(response.headers[pagination.NEXT_CURSOR_HEADER], encode_cursor(1))
+        self.assertNotIn(pagination.NEXT_CURSOR_HEADER, page_response([], None).headers)
+
+
+if __name__ == "__main__":
+    unittest.main()
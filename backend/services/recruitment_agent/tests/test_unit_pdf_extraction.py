@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Unit tests of the parallel PDF text extraction, including from a daemonic
+child as in a Celery prefork worker; no services needed.
+
+Run from backend/services/recruitment_agent/tests:
+    python -m unittest test_unit_pdf_extraction
+"""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+import billiard  # noqa: E402
+import fitz  # noqa: E402
+from prometheus_client import REGISTRY  # noqa: E402
+
+from utils import utils  # noqa: E402
+
+PAGES = 12
+
+
+def _extractions(mode: str) -> float:
+    return REGISTRY.get_sample_value("pdf_extraction_duration_seconds_count", {"mode": mode}) or 0.0
+
+
+def _extract_in_child(file_path: str):
+    # Runs in a daemonic pool worker, like a task in a Celery prefork child
+    before = _extractions("parallel")
+    try:
+        text = utils.extract_text_from_pdf(file_path)
+    finally:
+        utils.close_pdf_pool()
+    return billiard.current_process().daemon, text, _extractions("parallel") - before
+
+
+class TestParallelPdfExtraction(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.mkdtemp()
+        cls.pdf_path = os.path.join(cls.tmp_dir, "cv.pdf")
+        with fitz.open() as doc:
+            for i in range(PAGES):
+                doc.new_page().insert_text((72, 72), f"Page {i} Python Kafka Redis")
+            doc.save(cls.pdf_path)
+        cls.patches = [
+            mock.patch.object(utils, "PDF_PARALLEL_MIN_PAGES", 4),
+            mock.patch.object(utils, "PDF_EXTRACT_WORKERS", 3),
+        ]
+        for patch in cls.patches:
+            patch.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        utils.close_pdf_pool()
+        for patch in cls.patches:
+            patch.stop()
+        shutil.rmtree(cls.tmp_dir, ignore_errors=True)
+
+    def _serial_text(self):
+        return utils._pdf_page_range_text(self.pdf_path, 0, PAGES)
+
+    def test_parallel_text_matches_serial_order(self):
+        before = _extractions("parallel")
+        text = utils.extract_text_from_pdf(self.pdf_path)
+        self.assertEqual(_extractions("parallel") - before, 1)
+        self.assertEqual(text, self._serial_text())
+        self.assertLess(text.index("Page 3 "), text.index("Page 11 "))
+
+    def test_small_documents_are_read_serially(self):
+        before = _extractions("serial")
+        text = utils.extract_text_from_pdf(self.pdf_path, max_pages=2)
+        self.assertEqual(_extractions("serial") - before, 1)
+        self.assertEqual(text, utils._pdf_page_range_text(self.pdf_path, 0, 2))
+
+    def test_single_worker_reads_serially_without_a_pool(self):
+        # The default: no extra interpreters per process
+        utils.close_pdf_pool()
+        with mock.patch.object(utils, "PDF_EXTRACT_WORKERS", 1):
+            before = _extractions("serial")
+            text = utils.extract_text_from_pdf(self.pdf_path)
+            self.assertIsNone(utils._pdf_pool)
+        self.assertEqual(_extractions("serial") - before, 1)
+        self.assertEqual(text, self._serial_text())
+
+    def test_parallel_path_runs_in_daemonic_prefork_child(self):
+        # The prefork parent never starts a pool of its own
+        utils.close_pdf_pool()
+        with billiard.get_context("fork").Pool(1) as pool:
+            daemon, text, parallel_runs = pool.apply(_extract_in_child, (self.pdf_path,))
+        self.assertTrue(daemon)
+        self.assertEqual(parallel_runs, 1)
+        self.assertEqual(text, self._serial_text())
+
+    def test_worker_failure_falls_back_to_serial_read(self):
+        # A range past the last page makes the worker raise
+        with mock.patch.object(utils, "_page_ranges", return_value=[(0, 4), (4, PAGES + 4)]):
+            before = _extractions("serial")
+            text = utils.extract_text_from_pdf(self.pdf_path)
+        self.assertEqual(_extractions("serial") - before, 1)
+        self.assertEqual(text, self._serial_text())
+        # The pool keeps serving later documents
+        self.assertEqual(utils.extract_text_from_pdf(self.pdf_path), self._serial_text())
+
+
+if __name__ == "__main__":
+    unittest.main()
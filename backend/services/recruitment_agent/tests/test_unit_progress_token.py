@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Unit tests of the short-lived tokens that open a CV progress stream; no services needed.
+
+Run from backend/services/recruitment_agent/tests:
+    python -m unittest test_unit_progress_token
+"""
+import os
+import sys
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from fastapi import HTTPException  # noqa: E402
+from fastapi.security import HTTPAuthorizationCredentials  # noqa: E402
+
+from services import jwt_service  # noqa: E402
+from services.jwt_service import JWTService  # noqa: E402
+
+USER = {"sub": "candidate01", "role": "USER"}
+
+
+class TestStreamToken(unittest.TestCase):
+    def _status(self, token, stream_id):
+        with self.assertRaises(HTTPException) as ctx:
+            JWTService.verify_stream_token(token, stream_id)
+        return ctx.exception.status_code
+
+    def test_token_opens_its_own_stream(self):
+        token = JWTService.issue_stream_token(USER, "task-1", 60)
+        payload = JWTService.verify_stream_token(token, "task-1")
+        self.assertEqual(payload["sub"], "candidate01")
+
+    def test_token_of_another_stream_is_forbidden(self):
+        token = JWTService.issue_stream_token(USER, "task-1", 60)
+        self.assertEqual(self._status(token, "task-2"), 403)
+
+    def test_expired_token_is_refused(self):
+        issued_at = time.time() - 120
+        with mock.patch.object(jwt_service.time, "time", return_value=issued_at):
+            token = JWTService.issue_stream_token(USER, "task-1", 60)
+        self.assertEqual(self._status(token, "task-1"), 401)
+
+    def test_stream_token_is_not_a_user_jwt(self):
+        token = JWTService.issue_stream_token(USER, "task-1", 60)
+        with self.assertRaises(HTTPException) as ctx:
+            JWTService.verify_jwt(HTTPAuthorizationCredentials(scheme="Bearer", credentials=token))
+        self.assertEqual(ctx.exception.status_code, 401)
+
+
+if __name__ == "__main__":
+    unittest.main()
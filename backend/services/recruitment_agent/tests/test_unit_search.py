@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Unit tests of the CV name/position filters and the offline FULLTEXT
+migration step, over in-memory SQLite; no services needed.
+
+Run from backend/services/recruitment_agent/tests:
+    python -m unittest test_unit_search
+"""
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from sqlalchemy import Column, Index, Integer, String, create_engine, inspect, text  # noqa: E402
+from sqlalchemy.dialects import mysql  # noqa: E402
+from sqlalchemy.orm import Session, declarative_base  # noqa: E402
+
+from config import migrations  # noqa: E402
+from utils import search  # noqa: E402
+from utils.search import contains_filter  # noqa: E402
+
+Base = declarative_base()
+
+
+class Candidate(Base):
+    __tablename__ = "candidates"
+    __table_args__ = (
+        Index("ft_candidates_name", "name", mysql_prefix="FULLTEXT", mysql_with_parser="ngram"),
+        Index("ix_candidates_position", "position"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(255))
+    position = Column(String(255))
+
+
+NAMES = ["Tran Van An", "Nguyen Thi Lan", "Le Minh", "Anna Smith"]
+
+
+class TestContainsFilterSemantics(unittest.TestCase):
+    """The filter keeps ILIKE '%text%' semantics; SQLite runs the ILIKE itself."""
+
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(self.engine)
+        self.db = Session(self.engine)
+        self.db.add_all([Candidate(name=name) for name in NAMES])
+        self.db.commit()
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def _names(self, query):
+        return sorted(c.name for c in self.db.query(Candidate).filter(contains_filter(self.db, Candidate.name, query)))
+
+    def test_mid_word_match(self):
+        self.assertEqual(self._names("ran"), ["Tran Van An"])
+
+    def test_word_shorter_than_an_ngram(self):
+        self.assertEqual(self._names("a"), ["Anna Smith", "Nguyen Thi Lan", "Tran Van An"])
+
+    def test_text_is_matched_as_one_substring(self):
+        self.assertEqual(self._names("van an"), ["Tran Van An"])
+        # Both words occur, but not next to each other
+        self.assertEqual(self._names("tran an"), [])
+
+
+class TestContainsFilterOnMySQL(unittest.TestCase):
+    def _sql(self, query, built=True):
+        db = mock.Mock()
+        db.get_bind.return_value.dialect.name = "mysql"
+        with mock.patch.object(search, "SEARCH_FULLTEXT_ENABLED", True), \
+                mock.patch.object(search, "_fulltext_indexes_built", return_value=built):
+            condition = contains_filter(db, Candidate.name, query)
+        return str(condition.compile(dialect=mysql.dialect(), compile_kwargs={"literal_binds": True}))
+
+    def test_match_narrows_and_ilike_decides(self):
+        sql = self._sql("tran an")
+        self.assertIn("MATCH (candidates.name) AGAINST ('+\"tran\" +\"an\"' IN BOOLEAN MODE)", sql)
+        self.assertIn("AND lower(candidates.name) LIKE lower('%%tran an%%')", sql)
+
+    def test_short_words_are_not_looked_up(self):
+        with mock.patch.object(search, "SEARCH_NGRAM_TOKEN_SIZE", 3):
+            sql = self._sql("le minh")
+        self.assertIn("'+\"minh\"'", sql)
+        self.assertNotIn('"le"', sql)
+        self.assertNotIn("MATCH", self._sql("a"))
+
+    def test_ilike_only_until_the_indexes_are_built(self):
+        self.assertNotIn("MATCH", self._sql("tran", built=False))
+
+
+class TestOfflineFulltextIndexes(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        with self.engine.begin() as conn:
+            # An existing table, created before its indexes were declared
+            conn.execute(text("CREATE TABLE candidates (id INTEGER PRIMARY KEY, name VARCHAR(255), position VARCHAR(255))"))
+        self.patch = mock.patch.object(migrations, "DeclarativeBase", Base)
+        self.patch.start()
+
+    def tearDown(self):
+        self.patch.stop()
+        self.engine.dispose()
+
+    def _indexes(self):
+        return {index["name"] for index in inspect(self.engine).get_indexes("candidates")}
+
+    def test_startup_leaves_fulltext_indexes_to_the_offline_step(self):
+        migrations.apply_migrations(self.engine)
+        self.assertEqual(self._indexes(), {"ix_candidates_position"})
+        with self.engine.connect() as conn:
+            self.assertEqual(migrations.missing_fulltext_indexes(conn), ["ft_candidates_name"])
+
+        migrations.apply_migrations(self.engine, fulltext=True)
+        self.assertEqual(self._indexes(), {"ix_candidates_position", "ft_candidates_name"})
+        with self.engine.connect() as conn:
+            self.assertEqual(migrations.missing_fulltext_indexes(conn), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
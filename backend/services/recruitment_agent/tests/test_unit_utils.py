@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Unit tests of the pure helpers in app/utils/utils.py; no services needed.
+
+Run from backend/services/recruitment_agent/tests:
+    python -m unittest test_unit_utils
+"""
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from utils.utils import clean_json_from_text  # noqa: E402
+
+
+class TestCleanJsonFromText(unittest.TestCase):
+    def test_plain_json_is_returned_as_is(self):
+        self.assertEqual(clean_json_from_text('{"a": 1}'), '{"a": 1}')
+
+    def test_code_fence_is_removed(self):
+        self.assertEqual(json.loads(clean_json_from_text('```json\n[1, 2]\n```')), [1, 2])
+
+    def test_object_in_prose(self):
+        self.assertEqual(json.loads(clean_json_from_text('Result: {"a": [1]} done')), {"a": [1]})
+
+    def test_array_of_objects_in_prose(self):
+        text = 'Scores:\n[{"jd_index": 0}, {"jd_index": 1}]\nThanks'
+        self.assertEqual(json.loads(clean_json_from_text(text)), [{"jd_index": 0}, {"jd_index": 1}])
+
+    def test_single_object_array_in_prose_stays_an_array(self):
+        text = 'Scores: [{"jd_index": 0, "total_score": 70}] end'
+        self.assertEqual(json.loads(clean_json_from_text(text)), [{"jd_index": 0, "total_score": 70}])
+
+    def test_bytes_and_empty_input(self):
+        self.assertEqual(json.loads(clean_json_from_text(b'{"a": 1}')), {"a": 1})
+        self.assertEqual(clean_json_from_text(""), "")
+
+    def test_unparsable_text_is_returned_stripped(self):
+        self.assertEqual(clean_json_from_text("  no json here "), "no json here")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,5 @@
 import { API_BASE_URL } from "../constants/constants";
-import { handleResponse } from "./responseHandler";
+import { fetchPage, handleResponse } from "./responseHandler";
 import { getToken } from "./authApi";
 
 /**
@@ -33,11 +33,15 @@ export const uploadCV = async (file, position_applied_for, override_email = null
   return await handleResponse(response);
 };
 
-export const getOwnCVApplied = async() => {
-  const response = await fetch(`${API_BASE_URL}/recruitment/cvs/me`, {
+/**
+ * Get one page of the CVs the current user applied with.
+ * @param {string|null} [cursor] - Cursor of the page, null for the first page.
+ * @returns {Promise<{items: Array, nextCursor: string|null}>} Page of CVs.
+ */
+export const getOwnCVApplied = async (cursor = null) => {
+  return await fetchPage(`${API_BASE_URL}/recruitment/cvs/me`, {
     headers: authHeaders()
-  });
-  return await handleResponse(response);
+  }, cursor);
 };
 
 export const uploadProofImages = async (cvId, files) => {
@@ -73,35 +77,35 @@ export const approveCV = async (candidateId) => {
 };
 
 /**
- * Get all pending CVs (admin).
+ * Get one page of pending CVs (admin).
  * @param {string} [candidateName] - Optional candidate name filter.
- * @returns {Promise<Array>} List of pending CVs.
+ * @param {string|null} [cursor] - Cursor of the page, null for the first page.
+ * @returns {Promise<{items: Array, nextCursor: string|null}>} Page of pending CVs.
  */
-export const getPendingCVs = async (candidateName = "") => {
+export const getPendingCVs = async (candidateName = "", cursor = null) => {
   const query = candidateName ? `?candidate_name=${encodeURIComponent(candidateName)}` : "";
   const url = `${API_BASE_URL}/recruitment/cvs/pending${query}`;
 
-  const response = await fetch(url, {
+  return await fetchPage(url, {
     headers: authHeaders()
-  });
-  return await handleResponse(response);
+  }, cursor);
 };
 
 /**
- * Get all approved CVs (admin).
+ * Get one page of approved CVs (admin).
  * @param {string} [candidateName] - Optional candidate name filter.
- * @returns {Promise<Array>} List of approved CVs.
+ * @param {string|null} [cursor] - Cursor of the page, null for the first page.
+ * @returns {Promise<{items: Array, nextCursor: string|null}>} Page of approved CVs.
  * @description This fetches all CVs that have been approved by the admin.
  * This is useful for displaying a list of candidates who have been approved for further recruitment steps.
  */
-export const getApprovedCVs = async (candidateName = "") => {
+export const getApprovedCVs = async (candidateName = "", cursor = null) => {
   const query = candidateName ? `?candidate_name=${encodeURIComponent(candidateName)}` : "";
   const url = `${API_BASE_URL}/recruitment/cvs/approved${query}`;
 
-  const response = await fetch(url, {
+  return await fetchPage(url, {
     headers: authHeaders()
-  });
-  return await handleResponse(response);
+  }, cursor);
 };
 
 /**
@@ -136,18 +140,18 @@ export const deleteCV = async (cvId) => {
 };
 
 /**
- * List all CVs by position (admin).
+ * List one page of CVs by position (admin).
  * @param {string} position - (optional) Position to filter CVs by.
- * @returns {Promise<Array>} List of CVs.
+ * @param {string|null} [cursor] - Cursor of the page, null for the first page.
+ * @returns {Promise<{items: Array, nextCursor: string|null}>} Page of CVs.
  */
-export const listCVsByPosition = async (position = "") => {
+export const listCVsByPosition = async (position = "", cursor = null) => {
   const query = position ? `?position=${encodeURIComponent(position)}` : "";
   const url = `${API_BASE_URL}/recruitment/cvs/position${query}`;
 
-  const response = await fetch(url, {
+  return await fetchPage(url, {
     headers: authHeaders()
-  });
-  return await handleResponse(response);
+  }, cursor);
 };
 
 /**
@@ -169,4 +173,95 @@ export const getCVById = async (cvId) => {
  */
 export const getCVPreviewUrl = (cvId) => {
   return `${API_BASE_URL}/recruitment/cvs/${cvId}/preview`;
+};
+
+// Last event of one CV; the stream of a bulk batch ends with "completed" instead
+const CV_PROGRESS_TERMINAL_STAGES = ["stored", "rejected", "failed", "duplicate"];
+const CV_PROGRESS_STAGES = ["parsed", "matched", ...CV_PROGRESS_TERMINAL_STAGES, "completed"];
+const CV_PROGRESS_MAX_REOPENS = 3;
+
+/**
+ * Get a short-lived token that opens the progress stream of one upload task or batch.
+ * @param {string} taskId - task_id of an upload, or batch_id of a bulk upload.
+ * @returns {Promise<{token: string, expires_in: number}>} The token.
+ */
+const getCVProgressToken = async (taskId) => {
+  const response = await fetch(`${API_BASE_URL}/recruitment/cvs/progress/${encodeURIComponent(taskId)}/token`, {
+    method: "POST",
+    headers: authHeaders()
+  });
+  return await handleResponse(response);
+};
+
+/**
+ * Follow the progress events (Server-Sent Events) of an upload task or a bulk batch.
+ * EventSource cannot send the Authorization header, so the stream is opened with a
+ * token for this task only; once it has expired, a refused reconnect gets a new one.
+ * @param {string} taskId - task_id of an upload, or batch_id of a bulk upload.
+ * @param {function(string, Object): void} onEvent - Called with the stage and data of each
+ * event, and with "error" when the progress can no longer be followed.
+ * @returns {function(): void} Stops following the progress.
+ */
+export const followCVProgress = (taskId, onEvent) => {
+  let source = null;
+  let lastEventId = null;
+  let stopped = false;
+  let reopens = 0;
+
+  const stop = () => {
+    stopped = true;
+    if (source) source.close();
+  };
+
+  const fail = (detail) => {
+    stop();
+    onEvent("error", { detail });
+  };
+
+  const open = async () => {
+    let token;
+    try {
+      ({ token } = await getCVProgressToken(taskId));
+    } catch (err) {
+      fail(err.message);
+      return;
+    }
+    if (stopped) return;
+
+    const query = new URLSearchParams({ token });
+    if (lastEventId) query.set("last_event_id", lastEventId);
+    source = new EventSource(`${API_BASE_URL}/recruitment/cvs/progress/${encodeURIComponent(taskId)}?${query}`);
+
+    CV_PROGRESS_STAGES.forEach((stage) => {
+      source.addEventListener(stage, (e) => {
+        reopens = 0;
+        if (e.lastEventId) lastEventId = e.lastEventId;
+        const data = JSON.parse(e.data);
+        // The server ends the stream here; close it before EventSource reconnects
+        if (stage === "completed" || (CV_PROGRESS_TERMINAL_STAGES.includes(stage) && data.task_id === taskId)) stop();
+        onEvent(stage, data);
+      });
+    });
+    source.onerror = (e) => {
+      if (stopped) return;
+      // Sent by the server when Redis is unavailable
+      if (e.data) {
+        fail(JSON.parse(e.data).detail);
+        return;
+      }
+      // Still CONNECTING: EventSource retries by itself. CLOSED: the server refused the
+      // reconnect, e.g. with an expired token
+      if (source.readyState === EventSource.CLOSED) {
+        if (reopens >= CV_PROGRESS_MAX_REOPENS) {
+          fail("Progress updates are unavailable.");
+          return;
+        }
+        reopens += 1;
+        open();
+      }
+    };
+  };
+
+  open();
+  return stop;
 };
\ No newline at end of file
@@ -1,5 +1,5 @@
 import { API_BASE_URL } from "../constants/constants";
-import { handleResponse } from "./responseHandler";
+import { fetchPage, handleResponse } from "./responseHandler";
 import { getToken } from "./authApi";
 
 /**
@@ -27,11 +27,12 @@ export const scheduleInterview = async (interviewData) => {
 };
 
 /**
- * Get all interviews (admin only).
+ * Get one page of interviews (admin only).
  * @param {Object} params - { interview_date, candidate_name }
- * @returns {Promise<Array>}
+ * @param {string|null} cursor - Cursor of the page, null for the first page.
+ * @returns {Promise<{items: Array, nextCursor: string|null}>}
  */
-export const getInterviews = async (params = {}) => {
+export const getInterviews = async (params = {}, cursor = null) => {
   const query = [];
   if (params.interview_date) {
     query.push(`interview_date=${encodeURIComponent(params.interview_date)}`);
@@ -42,10 +43,9 @@ export const getInterviews = async (params = {}) => {
   const queryString = query.length > 0 ? `?${query.join("&")}` : "";
   const url = `${API_BASE_URL}/recruitment/interviews${queryString}`;
 
-  const response = await fetch(url, {
+  return await fetchPage(url, {
     headers: authHeaders(false),
-  });
-  return await handleResponse(response);
+  }, cursor);
 };
 
 /**
@@ -1,5 +1,5 @@
 import { API_BASE_URL } from "../constants/constants";
-import { handleResponse } from "./responseHandler";
+import { fetchPage, handleResponse } from "./responseHandler";
 import { getToken } from "./authApi";
 
 /**
@@ -15,22 +15,22 @@ const authHeaders = (isJson = true) => ({
 // === JD SERVICES ===
 
 /**
- * Fetch all job descriptions (JDs).
+ * Fetch one page of job descriptions (JDs).
  * Optionally filter by position.
  * No authentication required.
  * @param {string} position - (optional) Position to filter JDs by.
- * @returns {Promise<Array>} List of JDs.
+ * @param {string|null} cursor - (optional) Cursor of the page, null for the first page.
+ * @returns {Promise<{items: Array, nextCursor: string|null}>} Page of JDs.
  */
-export const getAllJD = async (position = "") => {
+export const getAllJD = async (position = "", cursor = null) => {
   const query = position ? `?position=${encodeURIComponent(position)}` : "";
   const url = `${API_BASE_URL}/recruitment/jds${query}`;
-  const response = await fetch(url, {
+  return await fetchPage(url, {
     method: "GET",
     headers: {
       "Authorization": `Bearer ${getToken()}`
     }
-  });
-  return (await handleResponse(response)) || [];
+  }, cursor);
 };
 
 /**
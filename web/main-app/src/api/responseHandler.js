@@ -29,4 +29,23 @@ export const handleResponse = async (response) => {
     console.error("[DEBUG handleResponse] Failed to parse JSON:", err);
     return null;
   }
-};
\ No newline at end of file
+};
+
+/**
+ * Fetch one page of a paginated list endpoint.
+ * @param {string} url - List endpoint URL, with or without a query string.
+ * @param {Object} options - fetch options (headers, ...).
+ * @param {string|null} cursor - X-Next-Cursor of the previous page, null for the first page.
+ * @returns {Promise<{items: Array, nextCursor: string|null}>} Items of the page and the
+ * cursor of the next one, null on the last page.
+ */
+export const fetchPage = async (url, options = {}, cursor = null) => {
+  const separator = url.includes("?") ? "&" : "?";
+  const pageUrl = cursor ? `${url}${separator}cursor=${encodeURIComponent(cursor)}` : url;
+  const response = await fetch(pageUrl, options);
+  const page = await handleResponse(response);
+  return {
+    items: Array.isArray(page) ? page : [],
+    nextCursor: response.headers.get("X-Next-Cursor"),
+  };
+};
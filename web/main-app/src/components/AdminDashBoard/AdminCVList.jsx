@@ -22,6 +22,9 @@ const AdminCVList = ({ actionsEnabled = true }) => {
   const [minScore, setMinScore] = useState("");
   const [positionFilter, setPositionFilter] = useState("");
   const [proofs, setProofs] = useState({});
+  const [cvQuery, setCVQuery] = useState("");
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   // Justification modal state
   const [showJustificationModal, setShowJustificationModal] = useState(false);
   const [justificationContent, setJustificationContent] = useState("");
@@ -31,26 +34,47 @@ const AdminCVList = ({ actionsEnabled = true }) => {
     fetchCVs();
   }, []);
 
+  const fetchProofs = async (page) => {
+    const proofMap = {};
+    for (const cv of page) {
+      try {
+        const urls = await getProofImages(cv.id);
+        proofMap[cv.id] = urls;
+      } catch {
+        proofMap[cv.id] = [];
+      }
+    }
+    return proofMap;
+  };
+
+  // Loads the first page again; later pages come from "Load more"
   const fetchCVs = async (query = "") => {
     try {
-      const data = await listCVsByPosition(query);
-      setCVs(data || []);
-
-      const proofMap = {};
-      for (const cv of data || []) {
-        try {
-          const urls = await getProofImages(cv.id);
-          proofMap[cv.id] = urls;
-        } catch {
-          proofMap[cv.id] = [];
-        }
-      }
-      setProofs(proofMap);
+      const page = await listCVsByPosition(query);
+      setCVs(page.items);
+      setCVQuery(query);
+      setNextCursor(page.nextCursor);
+      setProofs(await fetchProofs(page.items));
     } catch (error) {
       console.error("Failed to fetch CVs:", error);
     }
   };
 
+  const loadMoreCVs = async () => {
+    setLoadingMore(true);
+    try {
+      const page = await listCVsByPosition(cvQuery, nextCursor);
+      setCVs((prev) => [...prev, ...page.items]);
+      setNextCursor(page.nextCursor);
+      const proofMap = await fetchProofs(page.items);
+      setProofs((prev) => ({ ...prev, ...proofMap }));
+    } catch (error) {
+      console.error("Failed to load more CVs:", error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const toggleSortOrder = () => {
     setSortByScore((prev) => (prev === "desc" ? "asc" : "desc"));
   };
@@ -218,6 +242,14 @@ const AdminCVList = ({ actionsEnabled = true }) => {
         </tbody>
       </table>
 
+      {nextCursor && (
+        <div className="admin-cv-table__load-more">
+          <button className="admin-cv-table__approve-btn" onClick={loadMoreCVs} disabled={loadingMore}>
+            {loadingMore ? "Loading..." : "Load more"}
+          </button>
+        </div>
+      )}
+
       {showModal && selectedCV && actionsEnabled && (
         <div className="admin-cv-modal__overlay" onClick={() => setShowModal(false)}>
           <div className="admin-cv-modal__content" onClick={(e) => e.stopPropagation()}>
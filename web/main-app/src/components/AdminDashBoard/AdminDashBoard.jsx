@@ -15,6 +15,9 @@ import { listCVsByPosition } from "../../api/cvApi";
 import { getAllJD } from "../../api/jdApi";
 import { getAllUsers } from "../../api/authApi";
 
+// Counts from the first page only; "+" marks a list with more pages
+const pageCount = (page) => (page.nextCursor ? `${page.items.length}+` : page.items.length);
+
 const AdminDashBoard = () => {
     const [stats, setStats] = useState({ cvs: 0, users: 0, jds: 0 });
 
@@ -26,7 +29,7 @@ const AdminDashBoard = () => {
                     getAllUsers(),
                     getAllJD()
                 ]);
-                setStats({ cvs: cvs.length, users: users.length, jds: jds.length });
+                setStats({ cvs: pageCount(cvs), users: users.length, jds: pageCount(jds) });
             } catch (err) {
                 console.error("Failed to fetch dashboard stats", err);
             }
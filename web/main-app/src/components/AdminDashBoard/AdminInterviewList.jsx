@@ -46,16 +46,21 @@ const AdminInterviewList = ({ actionsEnabled = true }) => {
   const [regeneratingId, setRegeneratingId] = useState(null);
   const [confirmDialogOpen, setConfirmDialogOpen] = useState(false);
   const [pendingRegenerationCvId, setPendingRegenerationCvId] = useState(null);
+  const [interviewsCursor, setInterviewsCursor] = useState(null);
+  const [approvedCVsCursor, setApprovedCVsCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   useEffect(() => {
     fetchInterviews();
     if (actionsEnabled) fetchApprovedCVs();
   }, [actionsEnabled]);
 
+  // Both lists load their first page again; later pages come from "Load more"
   const fetchInterviews = async () => {
     try {
-      const result = await getInterviews();
-      setInterviews(result || []);
+      const page = await getInterviews();
+      setInterviews(page.items);
+      setInterviewsCursor(page.nextCursor);
     } catch (error) {
       toast.error("Failed to fetch interviews");
     }
@@ -63,13 +68,40 @@ const AdminInterviewList = ({ actionsEnabled = true }) => {
 
   const fetchApprovedCVs = async () => {
     try {
-      const result = await getApprovedCVs();
-      setApprovedCVs(result || []);
+      const page = await getApprovedCVs();
+      setApprovedCVs(page.items);
+      setApprovedCVsCursor(page.nextCursor);
     } catch (error) {
       toast.error("Failed to fetch approved CVs");
     }
   };
 
+  const loadMoreInterviews = async () => {
+    setLoadingMore(true);
+    try {
+      const page = await getInterviews({}, interviewsCursor);
+      setInterviews((prev) => [...prev, ...page.items]);
+      setInterviewsCursor(page.nextCursor);
+    } catch (error) {
+      toast.error("Failed to fetch interviews");
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
+  const loadMoreApprovedCVs = async () => {
+    setLoadingMore(true);
+    try {
+      const page = await getApprovedCVs("", approvedCVsCursor);
+      setApprovedCVs((prev) => [...prev, ...page.items]);
+      setApprovedCVsCursor(page.nextCursor);
+    } catch (error) {
+      toast.error("Failed to fetch approved CVs");
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleRegenerateConfirm = (cvId) => {
     setPendingRegenerationCvId(cvId);
     setConfirmDialogOpen(true);
@@ -280,6 +312,14 @@ const AdminInterviewList = ({ actionsEnabled = true }) => {
         ))}
       </ul>
 
+      {interviewsCursor && (
+        <div className="admin-interview-list__load-more">
+          <button className="admin-interview-list__schedule-btn" onClick={loadMoreInterviews} disabled={loadingMore}>
+            {loadingMore ? "Loading..." : "Load more"}
+          </button>
+        </div>
+      )}
+
       {actionsEnabled && (
         <>
           <div className="admin-interview-list__header">
@@ -298,6 +338,13 @@ const AdminInterviewList = ({ actionsEnabled = true }) => {
               </li>
             ))}
           </ul>
+          {approvedCVsCursor && (
+            <div className="admin-interview-list__load-more">
+              <button className="admin-interview-list__schedule-btn" onClick={loadMoreApprovedCVs} disabled={loadingMore}>
+                {loadingMore ? "Loading..." : "Load more"}
+              </button>
+            </div>
+          )}
         </>
       )}
 
@@ -35,16 +35,33 @@ const AdminJDList = ({ actionsEnabled = true }) => {
   const [formJD, setFormJD] = useState(emptyJD);
   const [showCreate, setShowCreate] = useState(false);
   const [previewJDUrl, setPreviewJDUrl] = useState(null);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
+  // Loads the first page again; later pages come from "Load more"
   const fetchJDs = async () => {
     try {
-      const data = await getAllJD();
-      setJds(data || []);
+      const page = await getAllJD();
+      setJds(page.items);
+      setNextCursor(page.nextCursor);
     } catch (error) {
       console.error("Failed to fetch JDs:", error);
     }
   };
 
+  const loadMoreJDs = async () => {
+    setLoadingMore(true);
+    try {
+      const page = await getAllJD("", nextCursor);
+      setJds((prev) => [...prev, ...page.items]);
+      setNextCursor(page.nextCursor);
+    } catch (error) {
+      console.error("Failed to load more JDs:", error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   useEffect(() => {
     fetchJDs();
   }, []);
@@ -107,9 +124,9 @@ const AdminJDList = ({ actionsEnabled = true }) => {
     const file = e.target.files[0];
     if (!file) return;
     try {
-      await uploadJDFile(file);
+      const result = await uploadJDFile(file);
       fetchJDs();
-      alert("JD JSON file uploaded successfully!");
+      alert(`JD file uploaded: ${result.inserted} added, ${result.skipped} already present, ${result.invalid} invalid.`);
     } catch (err) {
       alert("Failed to upload JD JSON file: " + err.message);
     }
@@ -130,7 +147,7 @@ const AdminJDList = ({ actionsEnabled = true }) => {
           <div className="admin-jd-list__header-actions">
             <input
               type="file"
-              accept="application/json"
+              accept="application/json,.json,.ndjson,.jsonl"
               style={{ display: "none" }}
               id="jd-upload-input"
               onChange={handleUploadJSONFile}
@@ -183,6 +200,14 @@ const AdminJDList = ({ actionsEnabled = true }) => {
         ))}
       </ul>
 
+      {nextCursor && (
+        <div className="admin-jd-list__load-more">
+          <button className="admin-jd-list__create-btn" onClick={loadMoreJDs} disabled={loadingMore}>
+            {loadingMore ? "Loading..." : "Load more"}
+          </button>
+        </div>
+      )}
+
       {(showModal || showCreate) && (
         <div
           className="admin-jd-list__modal-overlay"
@@ -8,6 +8,44 @@ import TopHeader from "./TopHeader";
 import JobDetailDrawer from "./JobDetailDrawer";
 import { getAllJD } from "../../api/jdApi";
 
+const formatJob = (job) => ({
+  id: job.id,
+  title: job.position || "Untitled Position",
+  location: job.location || "Unknown location",
+  date: job.datetime
+    ? new Date(job.datetime).toLocaleDateString("en-US", {
+        year: "numeric",
+        month: "short",
+        day: "2-digit",
+      })
+    : "N/A",
+  datetime: job.datetime || null,
+  referral: job.referral || false,
+  ref: typeof job.referral_code === "string" ? job.referral_code : null,
+  experience_required: String(job.experience_required || ""),
+  level: job.level || "N/A",
+  companyDescription: job.company_description || "",
+  jobDescription: job.job_description || "",
+  responsibilities: Array.isArray(job.responsibilities)
+    ? job.responsibilities
+    : [],
+  qualifications: Array.isArray(job.qualifications)
+    ? job.qualifications
+    : [],
+  additionalInformation: job.additional_information || {},
+  hiringManager: job.hiring_manager || "N/A",
+  recruiter: job.recruiter || "N/A",
+  skills_required: (() => {
+    try {
+      return Array.isArray(job.skills_required)
+        ? job.skills_required
+        : JSON.parse(job.skills_required || "[]");
+    } catch {
+      return [];
+    }
+  })(),
+});
+
 const Candidate = () => {
   const [allJobs, setAllJobs] = useState([]);
   const [searchText, setSearchText] = useState("");
@@ -18,59 +56,33 @@ const Candidate = () => {
   const [refCodeInput, setRefCodeInput] = useState("");
   const [filteredByRef, setFilteredByRef] = useState(null);
   const [selectedJob, setSelectedJob] = useState(null);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
-  useEffect(() => {
-    const fetchJobs = async () => {
-      try {
-        const jobs = await getAllJD();
-        const formattedJobs = jobs.map((job) => ({
-          id: job.id,
-          title: job.position || "Untitled Position",
-          location: job.location || "Unknown location",
-          date: job.datetime
-            ? new Date(job.datetime).toLocaleDateString("en-US", {
-                year: "numeric",
-                month: "short",
-                day: "2-digit",
-              })
-            : "N/A",
-          datetime: job.datetime || null,
-          referral: job.referral || false,
-          ref: typeof job.referral_code === "string" ? job.referral_code : null,
-          experience_required: String(job.experience_required || ""),
-          level: job.level || "N/A",
-          companyDescription: job.company_description || "",
-          jobDescription: job.job_description || "",
-          responsibilities: Array.isArray(job.responsibilities)
-            ? job.responsibilities
-            : [],
-          qualifications: Array.isArray(job.qualifications)
-            ? job.qualifications
-            : [],
-          additionalInformation: job.additional_information || {},
-          hiringManager: job.hiring_manager || "N/A",
-          recruiter: job.recruiter || "N/A",
-          skills_required: (() => {
-            try {
-              return Array.isArray(job.skills_required)
-                ? job.skills_required
-                : JSON.parse(job.skills_required || "[]");
-            } catch {
-              return [];
-            }
-          })(),
-        }));
+  // Appends one page of jobs; the first page replaces the list
+  const fetchJobs = async (cursor = null) => {
+    try {
+      const page = await getAllJD("", cursor);
+      const formattedJobs = page.items.map(formatJob);
 
-        console.log("[DEBUG] Formatted jobs:", formattedJobs);
-        setAllJobs(formattedJobs);
-      } catch (error) {
-        console.error("Error loading job data:", error);
-      }
-    };
+      console.log("[DEBUG] Formatted jobs:", formattedJobs);
+      setAllJobs((prev) => (cursor ? [...prev, ...formattedJobs] : formattedJobs));
+      setNextCursor(page.nextCursor);
+    } catch (error) {
+      console.error("Error loading job data:", error);
+    }
+  };
 
+  useEffect(() => {
     fetchJobs();
   }, []);
 
+  const handleLoadMore = async () => {
+    setLoadingMore(true);
+    await fetchJobs(nextCursor);
+    setLoadingMore(false);
+  };
+
   const locations = useMemo(
     () => [...new Set(allJobs.map((job) => job.location))],
     [allJobs]
@@ -270,6 +282,13 @@ const Candidate = () => {
               <JobCard key={idx} job={job} logo={SmartRecruitmentLogo} onClick={setSelectedJob} />
             ))
           )}
+          {nextCursor && filteredByRef === null && (
+            <div className="job-list__load-more">
+              <button className="clear-filter-btn" onClick={handleLoadMore} disabled={loadingMore}>
+                {loadingMore ? "Loading..." : "Load more jobs"}
+              </button>
+            </div>
+          )}
         </div>
       </div>
 
@@ -21,23 +21,31 @@ const CandidateApplication = () => {
   const [cvList, setCvList] = useState([]);
   const [loading, setLoading] = useState(true);
   const [proofImages, setProofImages] = useState({});
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
+
+  // Appends one page of CVs with their proof images
+  const loadCVs = async (cursor = null) => {
+    const page = await getOwnCVApplied(cursor);
+    setCvList((prev) => (cursor ? [...prev, ...page.items] : page.items));
+    setNextCursor(page.nextCursor);
+
+    const proofMap = {};
+    for (const cv of page.items) {
+      try {
+        const urls = await getProofImages(cv.id);
+        proofMap[cv.id] = urls;
+      } catch {
+        proofMap[cv.id] = [];
+      }
+    }
+    setProofImages((prev) => ({ ...prev, ...proofMap }));
+  };
 
   useEffect(() => {
     const fetchCVs = async () => {
       try {
-        const data = await getOwnCVApplied();
-        setCvList(data || []);
-
-        const proofMap = {};
-        for (const cv of data) {
-          try {
-            const urls = await getProofImages(cv.id);
-            proofMap[cv.id] = urls;
-          } catch {
-            proofMap[cv.id] = [];
-          }
-        }
-        setProofImages(proofMap);
+        await loadCVs();
       } catch (err) {
         console.error("Error loading CVs:", err);
       } finally {
@@ -48,6 +56,17 @@ const CandidateApplication = () => {
     fetchCVs();
   }, []);
 
+  const handleLoadMore = async () => {
+    setLoadingMore(true);
+    try {
+      await loadCVs(nextCursor);
+    } catch (err) {
+      console.error("Error loading CVs:", err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleUpload = async (e, cvId) => {
     const files = e.target.files;
     if (!files?.length) return;
@@ -177,6 +196,13 @@ const CandidateApplication = () => {
             ))}
           </div>
         )}
+        {!loading && nextCursor && (
+          <div className="cv-load-more">
+            <button className="upload-btn" onClick={handleLoadMore} disabled={loadingMore}>
+              {loadingMore ? "Loading..." : "Load more"}
+            </button>
+          </div>
+        )}
       </div>
     </>
   );
@@ -1,7 +1,7 @@
 import { useRef, useState } from "react";
 import "../../css/JobDetailDrawer.css";
 import SmartRecruitmentLogo from "../../assets/images/smart-recruitment-admin-logo.png";
-import { uploadCV } from "../../api/cvApi";
+import { followCVProgress, uploadCV } from "../../api/cvApi";
 import { toast } from "react-toastify";
 
 const JobDetailDrawer = ({ job, onClose }) => {
@@ -53,6 +53,13 @@ const JobDetailDrawer = ({ job, onClose }) => {
     );
   };
 
+  const notifyProgress = (stage, data) => {
+    if (stage === "stored") toast.success("Your CV has been processed and submitted.");
+    else if (stage === "rejected") toast.warn(data.reason || "Your CV was not accepted for this position.");
+    else if (stage === "duplicate") toast.info("This CV is already being processed.");
+    else if (stage === "failed") toast.error("Your CV could not be processed, please try again later.");
+  };
+
   // Handle CV upload when Apply is clicked
   const handleApplyClick = () => {
     fileInputRef.current.click();
@@ -73,6 +80,8 @@ const JobDetailDrawer = ({ job, onClose }) => {
       }
       const response = await uploadCV(file, job.position || job.title || "Unknown Position");
       toast.success(response?.message || `CV uploaded successfully!`);
+      // The CV is processed in the background; the result is toasted even after the drawer closes
+      if (response?.task_id) followCVProgress(response.task_id, notifyProgress);
     } catch (err) {
       toast.error(err?.message || "Failed to upload CV.");
     }